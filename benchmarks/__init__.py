@@ -0,0 +1 @@
+"""Benchmarks of Elastica Pipelines."""
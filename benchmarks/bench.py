@@ -0,0 +1,330 @@
+"""Throughput and latency benchmarks of Elastica IO.
+
+Benchmarks run against a synthetic dataset (see ``benchmarks.synthetic``), and can
+be compared against the results of a previous run to catch regressions.
+
+Example:
+    Benchmark a series of 1024 rods over 64 iterations, and compare against a
+    baseline::
+
+        $ python -m benchmarks.bench --rods 1024 --iterations 64 -o new.json
+        $ python -m benchmarks.bench --rods 1024 --iterations 64 --baseline new.json
+"""
+import json
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import click
+import numpy as np
+
+from benchmarks.synthetic import DatasetSpec
+from benchmarks.synthetic import generate
+from elastica_pipelines.io import transforms
+from elastica_pipelines.io.entry import series
+from elastica_pipelines.io.specialize import CosseratRodRecordIndex
+
+
+#: Sets up a benchmark on a metadata file, returning the timed operation. The
+#: operation returns the number of items (e.g. rods) it processed.
+Setup = Callable[[pathlib.Path], Callable[[], int]]
+
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark.
+
+    Args:
+        name (str): Name of the benchmark.
+
+    Returns:
+        Decorator registering the setup of the benchmark.
+    """
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _read(systems: Iterable[Any], field: str = "Position") -> int:
+    """Read a field of systems.
+
+    Args:
+        systems (Iterable[Any]): Systems to read.
+        field (str): Field to read.
+
+    Returns:
+        Number of systems read.
+    """
+    n = 0
+    for system in systems:
+        np.asarray(system[field])
+        n += 1
+    return n
+
+
+def _read_rods(iterations: Any) -> int:
+    """Read positions of every rod of every iteration.
+
+    Args:
+        iterations (Any): Pairs of keys and snapshots.
+
+    Returns:
+        Number of rods read.
+    """
+    return sum(_read(snapshot.cosserat_rods().values()) for _, snapshot in iterations)
+
+
+@benchmark("keys")
+def _keys(metadata: pathlib.Path) -> Callable[[], int]:
+    return lambda: len(list(series(metadata=metadata)))
+
+
+@benchmark("iterations")
+def _iterations(metadata: pathlib.Path) -> Callable[[], int]:
+    s = series(metadata=metadata)
+    return lambda: _read_rods(s.iterations())
+
+
+@benchmark("iterations_prefetch")
+def _iterations_prefetch(metadata: pathlib.Path) -> Callable[[], int]:
+    s = series(metadata=metadata)
+    return lambda: _read_rods(s.iterations(prefetch=4, workers=4, fields=["Position"]))
+
+
+@benchmark("temporal_select")
+def _temporal_select(metadata: pathlib.Path) -> Callable[[], int]:
+    s = series(metadata=metadata)
+
+    def run() -> int:
+        selection = s.temporal_select(CosseratRodRecordIndex(slice(None)))
+        return sum(_read(rods.values()) for _, rods in selection.iterations())
+
+    return run
+
+
+@benchmark("temporal_select_stack")
+def _temporal_select_stack(metadata: pathlib.Path) -> Callable[[], int]:
+    s = series(metadata=metadata)
+
+    def run() -> int:
+        selection = s.temporal_select(CosseratRodRecordIndex(slice(None)))
+        stacked = selection.stack("Position")
+        return int(stacked.shape[0] * stacked.shape[1])
+
+    return run
+
+
+@benchmark("rods_traversal")
+def _rods_traversal(metadata: pathlib.Path) -> Callable[[], int]:
+    s = series(metadata=metadata)
+    snapshot = s[next(iter(s))]
+    return lambda: sum(1 for _, rod in snapshot.rods().items() if rod.keys())
+
+
+@benchmark("systems_traversal")
+def _systems_traversal(metadata: pathlib.Path) -> Callable[[], int]:
+    s = series(metadata=metadata)
+    snapshot = s[next(iter(s))]
+    return lambda: sum(1 for _, system in snapshot.systems().items() if system.keys())
+
+
+@benchmark("transform_to_array")
+def _transform_to_array(metadata: pathlib.Path) -> Callable[[], int]:
+    s = series(metadata=metadata, transforms=transforms.ToArray())
+    return lambda: _read_rods(s.iterations())
+
+
+@benchmark("transform_memmap")
+def _transform_memmap(metadata: pathlib.Path) -> Callable[[], int]:
+    s = series(metadata=metadata, transforms=transforms.MemMap())
+    return lambda: _read_rods(s.iterations())
+
+
+@dataclass(frozen=True)
+class Result:
+    """Timings of a benchmark.
+
+    Args:
+        name: Name of the benchmark.
+        items: Number of items processed per run.
+        timings: Duration in seconds of each run.
+    """
+
+    name: str
+    items: int
+    timings: Tuple[float, ...]
+
+    @property
+    def median(self) -> float:
+        """Median duration of a run, in seconds."""
+        return statistics.median(self.timings)
+
+    @property
+    def latency(self) -> float:
+        """Median duration per item, in seconds."""
+        return self.median / max(self.items, 1)
+
+    @property
+    def throughput(self) -> float:
+        """Items processed per second, over the median run."""
+        return self.items / self.median if self.median > 0 else float("inf")
+
+
+def run(
+    metadata: pathlib.Path,
+    names: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    warmup: int = 1,
+) -> List[Result]:
+    """Run benchmarks against a dataset.
+
+    Args:
+        metadata (Path): Metadata file of the dataset.
+        names (Sequence[str], Optional): Benchmarks to run, all if not provided.
+        repeat (int): Number of timed runs of each benchmark.
+        warmup (int): Number of untimed runs of each benchmark, before timed runs.
+
+    Returns:
+        Timings of each benchmark.
+
+    Raises:
+        KeyError: If a benchmark is not registered.
+    """
+    results = []
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            raise KeyError(f"Unknown benchmark {name}, expected one of {[*BENCHMARKS]}")
+        operation = BENCHMARKS[name](metadata)
+        for _ in range(warmup):
+            operation()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            items = operation()
+            timings.append(time.perf_counter() - start)
+        results.append(Result(name, items, tuple(timings)))
+    return results
+
+
+def regressions(
+    results: Sequence[Result], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Find benchmarks slower than a baseline.
+
+    Args:
+        results (Sequence[Result]): Timings of benchmarks.
+        baseline (Dict[str, Any]): Report of a previous run, see ``report``.
+        tolerance (float): Relative slowdown of the median run tolerated.
+
+    Returns:
+        Descriptions of benchmarks slower than the baseline.
+    """
+    previous = {r["name"]: r for r in baseline["results"]}
+    slower = []
+    for r in results:
+        if r.name not in previous:
+            continue
+        ratio = r.median / previous[r.name]["median"]
+        if ratio > 1 + tolerance:
+            slower.append(f"{r.name} is {ratio:.2f}x slower than the baseline")
+    return slower
+
+
+def report(spec: DatasetSpec, results: Sequence[Result]) -> Dict[str, Any]:
+    """Make a serializable report of a benchmark run.
+
+    Args:
+        spec (DatasetSpec): Dataset benchmarked against.
+        results (Sequence[Result]): Timings of benchmarks.
+
+    Returns:
+        Report of the run.
+    """
+    return {
+        "spec": asdict(spec),
+        "results": [
+            {**asdict(r), "median": r.median, "throughput": r.throughput}
+            for r in results
+        ],
+    }
+
+
+@click.command()
+@click.option("--rods", default=DatasetSpec.n_rods, show_default=True)
+@click.option("--elements", default=DatasetSpec.n_elements, show_default=True)
+@click.option("--spheres", default=DatasetSpec.n_spheres, show_default=True)
+@click.option("--iterations", default=DatasetSpec.n_iterations, show_default=True)
+@click.option("--chunked", is_flag=True, help="Store arrays in chunked datasets.")
+@click.option("--compression", type=click.Choice(["gzip", "lzf"]), default=None)
+@click.option("-k", "--benchmark", "names", multiple=True, help="Benchmarks to run.")
+@click.option("--repeat", default=5, show_default=True)
+@click.option(
+    "--directory",
+    type=click.Path(file_okay=False, path_type=pathlib.Path),
+    help="Directory of the dataset, generated in a temporary directory if absent.",
+)
+@click.option("-o", "--output", type=click.Path(dir_okay=False, path_type=pathlib.Path))
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path),
+    help="Report of a previous run to compare against.",
+)
+@click.option("--tolerance", default=0.2, show_default=True)
+def main(
+    rods: int,
+    elements: int,
+    spheres: int,
+    iterations: int,
+    chunked: bool,
+    compression: Optional[str],
+    names: Tuple[str, ...],
+    repeat: int,
+    directory: Optional[pathlib.Path],
+    output: Optional[pathlib.Path],
+    baseline: Optional[pathlib.Path],
+    tolerance: float,
+) -> None:
+    """Benchmark Elastica IO on a synthetic dataset."""  # noqa: DAR101
+    spec = DatasetSpec(
+        n_rods=rods,
+        n_elements=elements,
+        n_spheres=spheres,
+        n_iterations=iterations,
+        chunked=chunked,
+        compression=compression,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        metadata = generate(directory or tmp, spec)
+        results = run(metadata, names or None, repeat=repeat)
+
+    click.echo(f"{'benchmark':<24}{'items':>10}{'median [s]':>14}{'items/s':>14}")
+    for r in results:
+        click.echo(f"{r.name:<24}{r.items:>10}{r.median:>14.4g}{r.throughput:>14.4g}")
+    if output is not None:
+        output.write_text(json.dumps(report(spec, results), indent=2))
+    if baseline is not None:
+        slower = regressions(results, json.loads(baseline.read_text()), tolerance)
+        for s in slower:
+            click.echo(s, err=True)
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(prog_name="benchmarks")  # pragma: no cover
@@ -0,0 +1,184 @@
+"""Synthetic Elastica++ datasets of configurable size.
+
+Datasets follow the layout written by Elastica++: a metadata file with one record
+per iteration holding its ``TimeMetadata``, and an external link to a time-series
+file holding the systems of that iteration, keyed per ``ElasticaConvention``.
+"""
+import pathlib
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import h5py  # type: ignore[import]
+import numpy as np
+
+from elastica_pipelines.io.protocols import ElasticaConvention
+
+
+#: Shapes of fields of a rod with ``n`` elements.
+ROD_FIELDS: Dict[str, Callable[[int], Tuple[int, ...]]] = {
+    "Position": lambda n: (3, n + 1),
+    "Velocity": lambda n: (3, n + 1),
+    "Mass": lambda n: (n + 1,),
+    "Director": lambda n: (3, 3, n),
+    "Tangent": lambda n: (3, n),
+    "ElementLength": lambda n: (n,),
+    "Curvature": lambda n: (3, n - 1),
+    "VoronoiLength": lambda n: (n - 1,),
+}
+
+#: Shapes of fields of a sphere.
+SPHERE_FIELDS: Dict[str, Tuple[int, ...]] = {
+    "Position": (3, 1),
+    "Velocity": (3, 1),
+    "Director": (3, 3, 1),
+    "Mass": (1,),
+    "Radius": (1,),
+}
+
+METADATA_FILENAME = "elastica_metadata.h5"
+FILE_PATTERN = "elastica_%T.h5"
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Size and layout of a synthetic dataset.
+
+    Args:
+        n_rods: Number of Cosserat rods per iteration.
+        n_elements: Number of elements of each rod.
+        n_spheres: Number of spheres per iteration.
+        n_iterations: Number of iterations.
+        iterate_stride: Stride between iterates of consecutive iterations.
+        dt: Timestep of the simulation.
+        chunked: Store arrays in chunked, rather than contiguous, datasets.
+        compression: Compression filter of chunked datasets, e.g. ``"gzip"``.
+    """
+
+    n_rods: int = 16
+    n_elements: int = 50
+    n_spheres: int = 16
+    n_iterations: int = 32
+    iterate_stride: int = 50
+    dt: float = 1e-4
+    chunked: bool = False
+    compression: Optional[str] = None
+
+    def iterates(self) -> range:
+        """Iterates of the dataset.
+
+        Returns:
+            Iterates, starting at ``iterate_stride``.
+        """
+        stop = self.iterate_stride * (self.n_iterations + 1)
+        return range(self.iterate_stride, stop, self.iterate_stride)
+
+    def nbytes(self) -> int:
+        """Number of bytes of array data in the dataset.
+
+        Returns:
+            Number of bytes, excluding HDF5 overheads.
+        """
+        rod = sum(int(np.prod(shape(self.n_elements))) for shape in ROD_FIELDS.values())
+        sphere = sum(int(np.prod(shape)) for shape in SPHERE_FIELDS.values())
+        per_iteration = self.n_rods * (rod + 1) + self.n_spheres * (sphere + 1)
+        return 8 * per_iteration * self.n_iterations
+
+
+def _create(group: Any, field: str, data: Any, spec: DatasetSpec) -> None:
+    """Create a field of a system, per ``ElasticaConvention``.
+
+    Args:
+        group (Any): Group of the system.
+        field (str): Name of the field.
+        data (Any): Data of the field.
+        spec (DatasetSpec): Layout of the dataset.
+    """
+    chunked = spec.chunked or spec.compression is not None
+    group.create_group(field).create_dataset(
+        "data",
+        data=data,
+        chunks=True if chunked else None,
+        compression=spec.compression,
+    )
+
+
+def _write_systems(f: Any, spec: DatasetSpec, rng: np.random.Generator) -> None:
+    """Write the systems of an iteration to a time-series file.
+
+    Args:
+        f (Any): Time-series file.
+        spec (DatasetSpec): Size and layout of the dataset.
+        rng (Generator): Source of random data.
+    """
+    rods = f.create_group("CosseratRod")
+    for i in range(spec.n_rods):
+        rod = rods.create_group(ElasticaConvention.as_system_key(i))
+        for field, rod_shape in ROD_FIELDS.items():
+            data = rng.standard_normal(rod_shape(spec.n_elements))
+            _create(rod, field, data, spec)
+        _create(rod, "NElement", np.array([spec.n_elements], dtype=np.float64), spec)
+
+    spheres = f.create_group("Sphere")
+    for i in range(spec.n_spheres):
+        sphere = spheres.create_group(ElasticaConvention.as_system_key(i))
+        for field, sphere_shape in SPHERE_FIELDS.items():
+            _create(sphere, field, rng.standard_normal(sphere_shape), spec)
+        _create(sphere, "NElement", np.ones(1), spec)
+
+
+def _write_time_metadata(record: Any, spec: DatasetSpec, iterate: int) -> None:
+    """Write the time metadata of an iteration to a record of the metadata file.
+
+    Args:
+        record (Any): Record of the metadata file.
+        spec (DatasetSpec): Size and layout of the dataset.
+        iterate (int): Iterate of the iteration.
+    """
+    time_metadata = record.create_group("TimeMetadata")
+    time_metadata["time"] = np.float64(iterate * spec.dt)
+    time_metadata["dt"] = np.float64(spec.dt)
+    timestep = time_metadata.create_group("Timestep")
+    timestep["step"] = np.uint64(iterate)
+    timestep["substep"] = np.uint8(0)
+    timestep["threshold"] = np.uint8(0)
+
+
+def generate(
+    directory: Union[str, pathlib.Path], spec: DatasetSpec, seed: int = 0
+) -> pathlib.Path:
+    """Generate a synthetic dataset in the layout written by Elastica++.
+
+    Args:
+        directory (str, Path): Directory in which to write the dataset.
+        spec (DatasetSpec): Size and layout of the dataset.
+        seed (int): Seed of the random data.
+
+    Returns:
+        Path of the metadata file of the dataset. Time-series files are named after
+        ``FILE_PATTERN``, next to it.
+
+    Example:
+        >>> from benchmarks.synthetic import DatasetSpec, generate
+        >>> from elastica_pipelines.io import series
+        >>>
+        >>> metadata = generate("/tmp/synthetic", DatasetSpec(n_rods=1024))
+        >>> s = series(metadata=metadata)
+    """
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    metadata = directory / METADATA_FILENAME
+    with h5py.File(metadata, "w") as md:
+        for iterate in spec.iterates():
+            filename = FILE_PATTERN.replace("%T", str(iterate).zfill(6))
+            with h5py.File(directory / filename, "w") as f:
+                _write_systems(f, spec, rng)
+            record = md.create_group(ElasticaConvention.as_record_key(iterate))
+            _write_time_metadata(record, spec, iterate)
+            record["data"] = h5py.ExternalLink(filename, "/")
+    return metadata
@@ -36,3 +36,14 @@ for t, snapshot in subset.iterations():
     for rod_id, rod in snapshot.items():
         print(f"  Rod {rod_id!r} elements:")
         print("  Rod elements:", rod["NElement"])
+
+# Fields of the selected rods can also be stacked across all iterations into a
+# single array of shape (n_iterations, n_selected_rods, ...). This needs the field
+# to have the same shape across all the selected rods.
+subset = series.temporal_select(io.CosseratRodRecordIndex([0, 2]))
+positions = subset.stack("Position")
+print("Stacked positions:", positions.shape)
+
+# For long series, iterate over blocks of iterations to bound memory usage.
+for block in subset.chunks("Position", size=100):
+    print("Block of positions:", block.shape)
@@ -162,7 +162,7 @@ def safety(session: Session) -> None:
 def mypy(session: Session) -> None:
     """Type-check using mypy."""
     args = session.posargs or ["src", "docs/conf.py"]
-    session.install(".")
+    session.install(".[arrow]")
     session.install("mypy", "pytest")
     # https://github.com/python/mypy/issues/5697
     session.run("mypy", *args, "--no-warn-return-any")
@@ -173,7 +173,7 @@ def mypy(session: Session) -> None:
 @session(python=python_versions)
 def tests(session: Session) -> None:
     """Run the test suite."""
-    session.install(".")
+    session.install(".[arrow]")
     session.install("coverage[toml]", "pytest", "pygments")
     try:
         session.run("coverage", "run", "--parallel", "-m", "pytest", *session.posargs)
@@ -208,6 +208,13 @@ def typeguard(session: Session) -> None:
     )
 
 
+@session(python=python_versions[0])
+def benchmarks(session: Session) -> None:
+    """Run the benchmark suite on a synthetic dataset."""
+    session.install(".")
+    session.run("python", "-m", "benchmarks.bench", *session.posargs)
+
+
 @session(python=python_versions)
 def xdoctest(session: Session) -> None:
     """Run examples with xdoctest."""
@@ -1,12 +1,57 @@
 """Command-line interface."""
+import pathlib
+from typing import Optional
+
 import click
 
+from elastica_pipelines.io.entry import series
+from elastica_pipelines.io.repack import repack
+
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.version_option()
 def main() -> None:
     """Elastica Pipelines."""
 
 
+@main.command("repack")
+@click.argument(
+    "metadata", type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path)
+)
+@click.argument("output", type=click.Path(dir_okay=False, path_type=pathlib.Path))
+@click.option(
+    "--chunk-iterations",
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help="Number of iterations per chunk of the store.",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(["gzip", "lzf", "none"]),
+    default="gzip",
+    show_default=True,
+    help="Compression filter of the store.",
+)
+def repack_command(
+    metadata: pathlib.Path,
+    output: pathlib.Path,
+    chunk_iterations: int,
+    compression: str,
+) -> None:
+    """Repack a metadata-driven series into a single time-major HDF5 store.
+
+    The store at OUTPUT is served transparently by ``series(metadata=OUTPUT)``.
+    """
+    compression_filter: Optional[str] = None if compression == "none" else compression
+    repack(
+        series(metadata=metadata),
+        output,
+        chunk_iterations=chunk_iterations,
+        compression=compression_filter,
+    )
+    click.echo(f"Repacked {metadata} into {output}.")
+
+
 if __name__ == "__main__":
     main(prog_name="elastica-pipelines")  # pragma: no cover
@@ -0,0 +1,5 @@
+"""Vectorized analysis of systems read by Elastica IO."""
+__all__ = [
+    "batches",
+    "rods",
+]
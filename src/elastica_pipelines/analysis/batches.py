@@ -0,0 +1,102 @@
+"""Batches of systems, as arrays stacked over systems or packed into ragged arrays.
+
+Kernels of ``analysis`` operate on fields of many systems at once, laid out as
+read by Elastica IO, with nodes or elements along the last axis:
+
+- Arrays stacked over systems with equal number of elements, e.g. positions of
+  shape ``(n_systems, 3, n_nodes)`` from ``SystemRecords.to_arrays``, or of shape
+  ``(n_iterations, n_systems, 3, n_nodes)`` from ``SeriesSelection.stack``.
+- ``RaggedArray`` packing systems with different number of elements along the
+  last axis, e.g. positions of values ``(3, n_total_nodes)`` from
+  ``SystemRecords.to_arrays``, optionally with leading axes, e.g. iterations.
+
+Per-system results are laid out as for stacked arrays in both cases, i.e. with
+the systems axis before the axes of the field.
+"""
+from __future__ import annotations
+
+from typing import Any
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+
+from elastica_pipelines.io.arrays import RaggedArray
+
+
+Batch = Union[npt.NDArray[Any], RaggedArray]
+
+
+def values(x: Batch) -> npt.NDArray[Any]:
+    """Obtain the array of values of a batch.
+
+    Args:
+        x (Batch): Batch of systems.
+
+    Returns:
+        Stacked array, or packed values of a ragged array.
+    """
+    return x.values if isinstance(x, RaggedArray) else np.asarray(x)
+
+
+def like(x: Batch, data: npt.NDArray[Any]) -> Batch:
+    """Make a batch laid out as another batch, from an array of values.
+
+    Args:
+        x (Batch): Batch whose layout is reused.
+        data (ndarray): Values of the batch, with the same last axis as ``x``.
+
+    Returns:
+        Batch with values ``data``.
+    """
+    return RaggedArray(data, x.offsets) if isinstance(x, RaggedArray) else data
+
+
+def consecutive(x: Batch) -> Tuple[Batch, Batch]:
+    """Obtain pairs of consecutive entries along the last axis, within systems.
+
+    E.g. pairs of nodes bounding each element, or pairs of elements bounding each
+    voronoi region.
+
+    Args:
+        x (Batch): Batch of systems.
+
+    Returns:
+        First and second entries of every pair, with one entry less per system.
+    """
+    if not isinstance(x, RaggedArray):
+        data = np.asarray(x)
+        return data[..., :-1], data[..., 1:]
+    # Pairs straddling two systems are dropped.
+    keep = np.ones(x.values.shape[-1] - 1, dtype=bool)
+    keep[x.offsets[1:-1] - 1] = False
+    offsets = x.offsets - np.arange(len(x.offsets))
+    return (
+        RaggedArray(x.values[..., :-1][..., keep], offsets),
+        RaggedArray(x.values[..., 1:][..., keep], offsets),
+    )
+
+
+def reduce(x: Batch, op: np.ufunc, inner: int = 0) -> npt.NDArray[Any]:
+    """Reduce a batch along its last axis, per system.
+
+    Args:
+        x (Batch): Batch of systems.
+        op (ufunc): Reduction, e.g. ``np.add``.
+        inner (int): Number of axes of the field between systems and the reduced
+            axis, e.g. 1 for positions.
+
+    Returns:
+        Array of shape ``(..., n_systems, *inner_axes)``.
+
+    Raises:
+        ValueError: If a system of a ragged array is empty.
+    """
+    if not isinstance(x, RaggedArray):
+        reduced: npt.NDArray[Any] = op.reduce(np.asarray(x), axis=-1)
+        return reduced
+    if np.any(x.lengths == 0):
+        raise ValueError("Cannot reduce systems without entries along the last axis.")
+    reduced = op.reduceat(x.values, x.offsets[:-1], axis=-1)
+    return np.moveaxis(reduced, -1, -1 - inner)
@@ -0,0 +1,223 @@
+"""Vectorized kernels for Cosserat rods.
+
+Kernels compute quantities of all rods of a snapshot, or of a whole trajectory,
+at once from fields laid out as in Elastica++ files (see ``batches``), e.g.
+
+>>> from elastica_pipelines.io import series
+>>> from elastica_pipelines.analysis import rods
+>>>
+>>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+>>> records = series(metadata=metadata_filename)[50].cosserat_rods()
+>>> data = records.to_arrays(["Position", "Mass"])
+>>> rods.lengths(data["Position"])  # (n_rods,)
+>>> rods.center_of_mass(data["Position"], data["Mass"])  # (n_rods, 3)
+
+Conventions follow PyElastica: directors are stored row-wise, i.e.
+``director[i, :, k]`` is the i-th director of element ``k``, and strains and
+angular velocities are expressed in the frame of the directors.
+"""
+from __future__ import annotations
+
+from typing import Any
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from elastica_pipelines.analysis import batches
+from elastica_pipelines.analysis.batches import Batch
+
+
+def _edges(position: Batch) -> Batch:
+    """Vectors from node to node of every element, of shape ``(..., 3, n)``."""
+    first, second = batches.consecutive(position)
+    return batches.like(first, batches.values(second) - batches.values(first))
+
+
+def element_lengths(position: Batch) -> Batch:
+    """Compute lengths of the elements of rods.
+
+    Args:
+        position (Batch): Positions of the nodes, of shape ``(..., 3, n + 1)``.
+
+    Returns:
+        Lengths of the elements, of shape ``(..., n)``.
+    """
+    edges = _edges(position)
+    return batches.like(edges, np.linalg.norm(batches.values(edges), axis=-2))
+
+
+def lengths(position: Batch) -> npt.NDArray[Any]:
+    """Compute lengths of the centerlines of rods.
+
+    Args:
+        position (Batch): Positions of the nodes, of shape ``(..., 3, n + 1)``.
+
+    Returns:
+        Lengths of the rods, of shape ``(..., n_rods)``.
+    """
+    return batches.reduce(element_lengths(position), np.add)
+
+
+def tangents(position: Batch) -> Batch:
+    """Compute unit tangents of the elements of rods.
+
+    Args:
+        position (Batch): Positions of the nodes, of shape ``(..., 3, n + 1)``.
+
+    Returns:
+        Tangents of the elements, of shape ``(..., 3, n)``.
+    """
+    edges = _edges(position)
+    data = batches.values(edges)
+    return batches.like(edges, data / np.linalg.norm(data, axis=-2, keepdims=True))
+
+
+def shear_strain(position: Batch, director: Batch, rest_lengths: Batch) -> Batch:
+    """Compute shear and stretch strains of the elements of rods.
+
+    The strain is ``Q (x_{k+1} - x_k) / l0_k - e3``, in the frame of the directors
+    ``Q`` of every element.
+
+    Args:
+        position (Batch): Positions of the nodes, of shape ``(..., 3, n + 1)``.
+        director (Batch): Directors of the elements, of shape ``(..., 3, 3, n)``.
+        rest_lengths (Batch): Rest lengths of the elements, of shape ``(..., n)``,
+            e.g. ``"ReferenceElementLength"``.
+
+    Returns:
+        Strains of the elements, of shape ``(..., 3, n)``.
+    """
+    edges = _edges(position)
+    local = np.einsum(
+        "...ijn,...jn->...in", batches.values(director), batches.values(edges)
+    )
+    strain = local / batches.values(rest_lengths)[..., np.newaxis, :]
+    strain[..., 2, :] -= 1.0
+    return batches.like(edges, strain)
+
+
+def curvature(director: Batch, rest_voronoi_lengths: Batch) -> Batch:
+    """Compute bending and twist strains (curvatures) of the voronoi regions of rods.
+
+    The curvature is the rotation vector from the directors of an element to those
+    of the next element, divided by the rest length of the voronoi region in
+    between, as in PyElastica.
+
+    Curvatures are expressed in the frame of the directors, with the sign of the
+    Darboux vector ``kappa`` of ``d_j' = kappa x d_j`` (Gazzola, Dudte and
+    Mahadevan, Forward and inverse problems in the mechanics of soft filaments,
+    R. Soc. Open Sci. 5, 171628, 2018). E.g. a rod bent along an arc of radius
+    ``R``, turning its tangent ``d3`` towards ``d1``, has a curvature
+    ``(0, 1 / R, 0)``, and a rod whose ``d1`` turns towards ``d2`` has a positive
+    twist.
+
+    Args:
+        director (Batch): Directors of the elements, of shape ``(..., 3, 3, n)``.
+        rest_voronoi_lengths (Batch): Rest lengths of the voronoi regions, of shape
+            ``(..., n - 1)``, e.g. ``"ReferenceVoronoiLength"``.
+
+    Returns:
+        Curvatures of the voronoi regions, of shape ``(..., 3, n - 1)``.
+    """
+    first, second = batches.consecutive(director)
+    # Rotation from an element to the next, Q_{k+1} Q_k^T.
+    rotation = np.einsum(
+        "...ikn,...jkn->...ijn", batches.values(second), batches.values(first)
+    )
+    axis = np.stack(
+        [
+            rotation[..., 2, 1, :] - rotation[..., 1, 2, :],
+            rotation[..., 0, 2, :] - rotation[..., 2, 0, :],
+            rotation[..., 1, 0, :] - rotation[..., 0, 1, :],
+        ],
+        axis=-2,
+    )
+    trace = np.trace(rotation, axis1=-3, axis2=-2)
+    theta = np.arccos(np.clip(0.5 * trace - 0.5, -1.0, 1.0))
+    sin = np.sin(theta)
+    # theta / sin(theta) tends to 1 for small rotations.
+    scale = np.divide(theta, sin, out=np.ones_like(theta), where=sin > 1e-12)
+    kappa = -0.5 * scale[..., np.newaxis, :] * axis
+    kappa /= batches.values(rest_voronoi_lengths)[..., np.newaxis, :]
+    return batches.like(first, kappa)
+
+
+def center_of_mass(position: Batch, mass: Batch) -> npt.NDArray[Any]:
+    """Compute centers of mass of rods.
+
+    Args:
+        position (Batch): Positions of the nodes, of shape ``(..., 3, n + 1)``.
+        mass (Batch): Masses of the nodes, of shape ``(..., n + 1)``. Leading axes
+            broadcast against those of ``position``, e.g. static masses of shape
+            ``(n_rods, n + 1)`` for a trajectory of positions.
+
+    Returns:
+        Centers of mass, of shape ``(..., n_rods, 3)``.
+    """
+    m = batches.values(mass)
+    moment = batches.like(position, batches.values(position) * m[..., np.newaxis, :])
+    total = batches.reduce(batches.like(position, m), np.add)
+    com: npt.NDArray[Any] = (
+        batches.reduce(moment, np.add, inner=1) / total[..., np.newaxis]
+    )
+    return com
+
+
+def bounding_boxes(position: Batch) -> Tuple[npt.NDArray[Any], npt.NDArray[Any]]:
+    """Compute axis-aligned bounding boxes of rods.
+
+    Args:
+        position (Batch): Positions of the nodes, of shape ``(..., 3, n + 1)``.
+
+    Returns:
+        Lower and upper corners of the boxes, each of shape ``(..., n_rods, 3)``.
+    """
+    return (
+        batches.reduce(position, np.minimum, inner=1),
+        batches.reduce(position, np.maximum, inner=1),
+    )
+
+
+def kinetic_energy(
+    velocity: Batch,
+    mass: Batch,
+    angular_velocity: Optional[Batch] = None,
+    inertia: Optional[Batch] = None,
+) -> npt.NDArray[Any]:
+    """Compute kinetic energies of rods.
+
+    The translational energy of the nodes, ``0.5 m |v|^2``, is summed with the
+    rotational energy of the elements, ``0.5 w . J w``, if angular velocities and
+    inertias are given.
+
+    Args:
+        velocity (Batch): Velocities of the nodes, of shape ``(..., 3, n + 1)``.
+        mass (Batch): Masses of the nodes, of shape ``(..., n + 1)``.
+        angular_velocity (Optional[Batch]): Angular velocities of the elements, of
+            shape ``(..., 3, n)``.
+        inertia (Optional[Batch]): Mass second moments of inertia of the elements,
+            of shape ``(..., 3, 3, n)``, e.g. ``"MassSecondMomentOfInertia"``.
+
+    Returns:
+        Kinetic energies, of shape ``(..., n_rods)``.
+
+    Raises:
+        ValueError: If only one of ``angular_velocity`` and ``inertia`` is given.
+    """
+    v = batches.values(velocity)
+    translational = 0.5 * batches.values(mass) * np.einsum("...in,...in->...n", v, v)
+    energy = batches.reduce(batches.like(velocity, translational), np.add)
+    if angular_velocity is None and inertia is None:
+        return energy
+    if angular_velocity is None or inertia is None:
+        raise ValueError("Both angular velocities and inertias must be given.")
+    w = batches.values(angular_velocity)
+    rotational = 0.5 * np.einsum(
+        "...in,...ijn,...jn->...n", w, batches.values(inertia), w
+    )
+    total: npt.NDArray[Any] = energy + batches.reduce(
+        batches.like(angular_velocity, rotational), np.add
+    )
+    return total
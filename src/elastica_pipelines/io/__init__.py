@@ -1,9 +1,20 @@
 """Elastica IO Pipelines for data deserialization."""
 __all__ = [
+    "arrays",
+    "arrow",
+    "cache",
     "core",
     "entry",
+    "parallel",
+    "pool",
     "protocols",
+    "reduction",
+    "registry",
+    "repack",
+    "spatial",
     "specialize",
+    "stats",
+    "structure",
     "temporal",
     "transforms",
     "typing",
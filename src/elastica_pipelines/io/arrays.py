@@ -0,0 +1,249 @@
+"""Bulk struct-of-arrays reading of Elastica IO records."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+
+from elastica_pipelines.io import stats
+from elastica_pipelines.io.cache import CacheView
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.stats import Recorder
+from elastica_pipelines.io.structure import FieldInfo
+from elastica_pipelines.io.transforms import supports_batch
+from elastica_pipelines.io.typing import FuncType
+from elastica_pipelines.io.typing import Node
+
+
+@dataclass(frozen=True, eq=False)
+class RaggedArray:
+    """Packed arrays differing in length along their last axis.
+
+    Elastica++ stores per-element data of rods with elements along the last axis,
+    e.g. ``(3, n_elements)`` for positions, so rods with different number of
+    elements are packed along that axis.
+
+    Args:
+        values (ndarray): Arrays concatenated along their last axis.
+        offsets (ndarray): Offsets of each array into ``values``, of length one more
+            than the number of arrays.
+
+    Example:
+        >>> import numpy as np
+        >>> from elastica_pipelines.io.arrays import RaggedArray
+        >>>
+        >>> r = RaggedArray.pack([np.zeros((3, 4)), np.ones((3, 2))])
+        >>> r.offsets  # [0, 4, 6]
+        >>> r[1].shape  # (3, 2)
+    """
+
+    values: npt.NDArray[Any]
+    offsets: npt.NDArray[np.intp]
+
+    @classmethod
+    def pack(cls, arrays: Sequence[npt.NDArray[Any]]) -> RaggedArray:
+        """Pack arrays along their last axis.
+
+        Args:
+            arrays (Sequence[ndarray]): Arrays to be packed, with equal shapes except
+                for the last axis.
+
+        Returns:
+            Packed arrays.
+        """
+        lengths = [a.shape[-1] for a in arrays]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.intp)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(np.concatenate(arrays, axis=-1), offsets)
+
+    @property
+    def lengths(self) -> npt.NDArray[np.intp]:
+        """Lengths of the packed arrays along their last axis."""
+        return np.diff(self.offsets)
+
+    def __getitem__(self, i: int) -> npt.NDArray[Any]:  # noqa
+        return self.values[..., self.offsets[i] : self.offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[npt.NDArray[Any]]:  # noqa
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self) -> int:  # noqa
+        return len(self.offsets) - 1
+
+
+def _is_ragged(shapes: Sequence[Sequence[int]]) -> bool:
+    """Check if shapes differ only along their last axis.
+
+    Args:
+        shapes (Sequence): Shapes of arrays.
+
+    Returns:
+        True if shapes can be packed along their last axis.
+    """
+    return all(len(s) > 0 and s[:-1] == shapes[0][:-1] for s in shapes)
+
+
+def _read(
+    system: Node, field: str, recorder: Optional[Recorder] = None
+) -> npt.NDArray[Any]:
+    """Read a field of a system into an array.
+
+    Args:
+        system (Node): Node of the system.
+        field (str): Field to read.
+        recorder (Recorder, Optional): Recorder of the read.
+
+    Returns:
+        Raw array of the field.
+    """
+    with stats.timed(recorder, "read_time", datasets_opened=1, reads=1) as counts:
+        data = np.asarray(ElasticaConvention.access(system[field]))
+        counts["bytes_read"] = data.nbytes
+    return data
+
+
+def _empty(node: Node, field: str) -> npt.NDArray[Any]:
+    """Stack a field of no systems, laid out as the field of the first system.
+
+    Args:
+        node (Node): Records node in which to lookup the first system.
+        field (str): Field to describe, without reading it.
+
+    Returns:
+        Empty array of shape (0, ...) and of the data type of the field, or of
+        shape (0,) if the node has no system with the field.
+    """
+    key = ElasticaConvention.as_system_key(0)
+    if key not in node or field not in node[key]:
+        return np.empty(0)
+    info = FieldInfo.of(ElasticaConvention.access(node[key][field]))
+    return np.empty((0, *info.shape), dtype=info.dtype)
+
+
+def apply(
+    transforms: Optional[FuncType],
+    data: npt.NDArray[Any],
+    recorder: Optional[Recorder] = None,
+) -> npt.NDArray[Any]:
+    """Apply transforms to raw data read in bulk.
+
+    Args:
+        transforms (Callable, Optional): A function/transform that takes in an array
+            and returns a transformed version.
+        data (ndarray): Raw data.
+        recorder (Recorder, Optional): Recorder of the time spent in transforms.
+
+    Returns:
+        Transformed data, as an array.
+    """
+    if transforms is None:
+        return data
+    with stats.timed(recorder, "transform_time"):
+        return np.asarray(transforms(data))
+
+
+def _transform_packed(
+    field: str,
+    packed: RaggedArray,
+    transforms: Optional[FuncType],
+    recorder: Optional[Recorder] = None,
+) -> RaggedArray:
+    """Apply batch transforms once to the concatenated values of a packed field.
+
+    Args:
+        field (str): Field that is packed.
+        packed (RaggedArray): Packed field.
+        transforms (Callable, Optional): Batch transforms.
+        recorder (Recorder, Optional): Recorder of the time spent in transforms.
+
+    Returns:
+        Packed field, with transformed values.
+
+    Raises:
+        ValueError: If the transforms change the length of the last axis.
+    """
+    values = apply(transforms, packed.values, recorder)
+    if values.shape[-1:] != packed.values.shape[-1:]:
+        raise ValueError(
+            f"Cannot transform packed field {field} of shape "
+            f"{packed.values.shape} to shape {values.shape}, the lengths differ."
+        )
+    return RaggedArray(values, packed.offsets)
+
+
+def gather(
+    node: Node,
+    sys_ids: Sequence[int],
+    fields: Sequence[str],
+    transforms: Optional[FuncType] = None,
+    cache: Optional[CacheView] = None,
+    recorder: Optional[Recorder] = None,
+) -> Dict[str, Union[npt.NDArray[Any], RaggedArray]]:
+    """Read fields of several systems of a records node into arrays.
+
+    Uniformly shaped fields are stacked along a new leading axis, of length
+    ``len(sys_ids)``. Fields differing in shape along their last axis (e.g. rods with
+    different number of elements) are packed into a ``RaggedArray``.
+
+    Transforms supporting batches (see ``protocols.BatchTransform``) are applied
+    once to stacked fields, instead of once per system. Packed fields are
+    transformed once as well, as their concatenated values, so that such transforms
+    should also apply independently along the last axis, e.g. unit conversions or
+    rotations, and preserve its length.
+
+    Without systems to read, fields are stacked into empty arrays laid out as the
+    field of the first system of ``node``, see ``_empty``.
+
+    Args:
+        node (Node): Records node in which to lookup systems.
+        sys_ids (Sequence[int]): Ids of systems to read.
+        fields (Sequence[str]): Fields to read.
+        transforms (Callable, Optional): A function/transform that takes in an array
+            and returns a transformed version.
+        cache (CacheView, Optional): Cache of raw arrays read from records.
+        recorder (Recorder, Optional): Recorder of IO of the records.
+
+    Returns:
+        Mapping of fields to stacked or packed arrays.
+
+    Raises:
+        ValueError: If a field cannot be stacked or packed due to its shapes, or if
+            a batch transform changes the length of a packed field.
+    """
+    # Batch transforms are applied once to stacked fields, others to every field.
+    batch = transforms is not None and supports_batch(transforms)
+    data: Dict[str, List[npt.NDArray[Any]]] = {f: [] for f in fields}
+    for sys_id in sys_ids:
+        system = node[ElasticaConvention.as_system_key(sys_id)]
+        for f in fields:
+            load = partial(_read, system, f, recorder)
+            raw = load() if cache is None else cache.get((sys_id, f), load, recorder)
+            if transforms is not None and not batch:
+                raw = apply(transforms, raw, recorder)
+            data[f].append(raw)
+
+    arrays: Dict[str, Union[npt.NDArray[Any], RaggedArray]] = {}
+    for f, values in data.items():
+        shapes = [v.shape for v in values]
+        if not values or all(s == shapes[0] for s in shapes):
+            stacked = np.stack(values) if values else _empty(node, f)
+            arrays[f] = apply(transforms, stacked, recorder) if batch else stacked
+        elif _is_ragged(shapes):
+            # Packed fields are concatenated along their last axis, not stacked.
+            packed = RaggedArray.pack(values)
+            if batch:
+                packed = _transform_packed(f, packed, transforms, recorder)
+            arrays[f] = packed
+        else:
+            raise ValueError(f"Field {f} has incompatible shapes {set(shapes)}.")
+    return arrays
@@ -0,0 +1,249 @@
+"""Export of Elastica IO selections to Apache Arrow IPC files.
+
+Requires ``pyarrow``, which is an optional dependency installed with the ``arrow``
+extra, e.g. ``pip install elastica-pipelines[arrow]``.
+
+Every row of an exported file holds the fields of one selected system at one
+iteration, alongside the ``iterate``, ``time``, ``dt`` and ``system`` id. Fields are
+stored as large list arrays of their values flattened in C order, so that systems
+differing in length along their last axis (e.g. rods with different number of
+elements) are stored without padding. The shape of each field is kept in the
+field metadata under ``"shape"``, with ``-1`` in place of the last axis.
+"""
+from __future__ import annotations
+
+import json
+import pathlib
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+
+from elastica_pipelines.io.arrays import RaggedArray
+from elastica_pipelines.io.arrays import gather
+from elastica_pipelines.io.core import _expand
+from elastica_pipelines.io.protocols import name
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from elastica_pipelines.io.temporal import SeriesSelection
+
+
+def _import_pyarrow() -> Any:
+    """Import ``pyarrow``, which is an optional dependency.
+
+    Returns:
+        The ``pyarrow`` module.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    try:
+        import pyarrow  # type: ignore[import-untyped]
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "Export to Arrow requires pyarrow, install it with "
+            "`pip install elastica-pipelines[arrow]`."
+        ) from e
+    return pyarrow
+
+
+def _rows(
+    value: Union[npt.NDArray[Any], RaggedArray]
+) -> Tuple[List[npt.NDArray[Any]], Tuple[int, ...]]:
+    """Flatten a stacked or packed field into rows, one per system.
+
+    Args:
+        value (ndarray, RaggedArray): Field stacked or packed across systems.
+
+    Returns:
+        Flattened rows, and shape of the field with -1 in place of its last axis.
+    """
+    if isinstance(value, RaggedArray):
+        return [np.ravel(v) for v in value], (*value.values.shape[:-1], -1)
+    shape = value.shape[1:]
+    return [np.ravel(v) for v in value], (*shape[:-1], -1) if shape else ()
+
+
+def _list_array(pa: Any, rows: Sequence[npt.NDArray[Any]]) -> Any:
+    """Build an Arrow large list array from rows of values.
+
+    Offsets are 64-bit, so that batches may hold more than 2**31 values.
+
+    Args:
+        pa (Any): The ``pyarrow`` module.
+        rows (Sequence[ndarray]): Flattened rows.
+
+    Returns:
+        Arrow large list array, with one list per row.
+    """
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(r) for r in rows], out=offsets[1:])
+    values = np.concatenate(rows)
+    return pa.LargeListArray.from_arrays(pa.array(offsets), pa.array(values))
+
+
+KEY_COLUMNS = ("iterate", "time", "dt", "system")
+
+
+def _schema(
+    pa: Any, types: Sequence[Any], shapes: Dict[str, Tuple[int, ...]]
+) -> Any:
+    """Build the Arrow schema of an exported file.
+
+    Args:
+        pa (Any): The ``pyarrow`` module.
+        types (Sequence[Any]): Arrow types of the key columns, then of the fields.
+        shapes (Dict[str, Tuple[int, ...]]): Shapes of the fields, by field, with
+            -1 in place of their last axis.
+
+    Returns:
+        Arrow schema, with the shapes of the fields in their metadata.
+    """
+    keys = [pa.field(k, types[i]) for i, k in enumerate(KEY_COLUMNS)]
+    return pa.schema(
+        keys
+        + [
+            pa.field(f, types[len(KEY_COLUMNS) + i], metadata={"shape": json.dumps(s)})
+            for i, (f, s) in enumerate(shapes.items())
+        ]
+    )
+
+
+def _empty_schema(selection: SeriesSelection, pa: Any, fields: Sequence[str]) -> Any:
+    """Build the Arrow schema of a selection without rows, from field descriptors.
+
+    Args:
+        selection (SeriesSelection): Selection without systems at any iteration.
+        pa (Any): The ``pyarrow`` module.
+        fields (Sequence[str]): Fields of the selected systems.
+
+    Returns:
+        Arrow schema, as written for the selection with rows.
+    """
+    types = [pa.int64(), pa.float64(), pa.float64(), pa.int64()]
+    shapes: Dict[str, Tuple[int, ...]] = {}
+    for f in fields:
+        empty = selection.empty(f, n_elements=1)
+        shape = empty.shape[2:]
+        shapes[f] = (*shape[:-1], -1) if shape else ()
+        types.append(pa.large_list(pa.from_numpy_dtype(empty.dtype)))
+    return _schema(pa, types, shapes)
+
+
+def write(
+    selection: SeriesSelection,
+    path: Union[str, pathlib.Path],
+    fields: Sequence[str],
+    chunk_size: int = 64,
+) -> None:
+    """Write fields of a selection to an Arrow IPC file, in record batches.
+
+    See ``SeriesSelection.to_arrow``.
+
+    Args:
+        selection (SeriesSelection): Selection to be written.
+        path (str, Path): Path of the Arrow IPC file.
+        fields (Sequence[str]): Fields of the selected systems to write.
+        chunk_size (int): Maximum number of iterations in a record batch.
+
+    Raises:
+        ValueError: If ``chunk_size`` is not positive.
+    """
+    pa = _import_pyarrow()
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size should be positive, got {chunk_size}.")
+
+    parent = selection.parent
+    index = parent.index()
+    system_name = name(selection.indices)
+
+    writer = None
+    try:
+        for start in range(0, len(index), chunk_size):
+            columns: Dict[str, List[npt.NDArray[Any]]] = {
+                k: [] for k in (*KEY_COLUMNS, *fields)
+            }
+            shapes: Dict[str, Tuple[int, ...]] = {}
+            for position in range(start, min(start + chunk_size, len(index))):
+                iterate = int(index.iterates[position])
+                records = parent[iterate][system_name]
+                sys_ids = _expand(selection.indices.indices, len(records))
+                data = gather(
+                    records.node,
+                    sys_ids,
+                    fields,
+                    records.transforms,
+                    records.cache,
+                    records.recorder,
+                )
+                n = len(sys_ids)
+                columns["iterate"].append(np.full(n, iterate, dtype=np.int64))
+                columns["time"].append(np.full(n, index.times[position]))
+                columns["dt"].append(np.full(n, index.dts[position]))
+                columns["system"].append(np.asarray(sys_ids, dtype=np.int64))
+                for f in fields:
+                    if n:
+                        rows, shapes[f] = _rows(data[f])
+                        columns[f].extend(rows)
+
+            # Iterations without selected systems have no rows to write.
+            if not shapes:
+                continue
+            arrays = [pa.array(np.concatenate(columns[k])) for k in KEY_COLUMNS]
+            arrays += [_list_array(pa, columns[f]) for f in fields]
+            if writer is None:
+                schema = _schema(pa, [a.type for a in arrays], shapes)
+                writer = pa.ipc.new_file(str(path), schema)
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        if writer is None:
+            # Selections without rows are written as empty tables.
+            writer = pa.ipc.new_file(str(path), _empty_schema(selection, pa, fields))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def read(path: Union[str, pathlib.Path]) -> Any:
+    """Read an Arrow IPC file written by ``SeriesSelection.to_arrow``.
+
+    The file is memory-mapped, so that columns are read without copies. The map is
+    kept open by the buffers of the returned table, and unmapped with them.
+
+    Args:
+        path (str, Path): Path of the Arrow IPC file.
+
+    Returns:
+        Arrow table, with one row per system and iteration.
+
+    Example:
+        >>> from elastica_pipelines.io.arrow import read, value
+        >>>
+        >>> table = read("rods.arrow")
+        >>> value(table, "Position", 0) # Position of the first row
+    """
+    pa = _import_pyarrow()
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def value(table: Any, field: str, row: int) -> npt.NDArray[Any]:
+    """Obtain a field of a row of a table, as an array of its original shape.
+
+    Args:
+        table (Any): Arrow table read by ``read``.
+        field (str): Field to obtain.
+        row (int): Row of the table.
+
+    Returns:
+        Array viewing the values of the table, without copies.
+    """
+    shape = json.loads(table.schema.field(field).metadata[b"shape"])
+    values = table.column(field)[row].values.to_numpy(zero_copy_only=True)
+    viewed: npt.NDArray[Any] = values.reshape(shape)
+    return viewed
@@ -0,0 +1,192 @@
+"""Caching of data read by Elastica IO."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from elastica_pipelines.io import stats
+from elastica_pipelines.io.stats import Recorder
+
+
+@dataclass(frozen=True, eq=True)
+class CacheStats:
+    """Statistics of a dataset cache.
+
+    Args:
+        hits: Number of reads served from the cache.
+        misses: Number of reads not served from the cache.
+        evictions: Number of arrays evicted from the cache.
+        entries: Number of arrays currently in the cache.
+        nbytes: Number of bytes currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+
+class DatasetCache:
+    """Least-recently-used cache of arrays, bounded in bytes.
+
+    Arrays are cached read-only, so that cached data cannot be modified in place.
+
+    Args:
+        max_bytes (int): Maximum number of bytes in the cache. Arrays larger than
+            ``max_bytes`` are not cached.
+
+    Raises:
+        ValueError: If ``max_bytes`` is negative.
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> s = series(metadata=metadata_filename, cache_bytes=2**30)
+        >>> s[50].cosserat_rods()[0]["Position"] # read from file
+        >>> s[50].cosserat_rods()[0]["Position"] # served from memory
+        >>> print(s.cache.stats())
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initializer."""
+        if max_bytes < 0:
+            raise ValueError(f"Cache size should not be negative, got {max_bytes}.")
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.arrays: OrderedDict[Hashable, npt.NDArray[Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Caches are shared across prefetching threads.
+        self.lock = threading.Lock()
+
+    def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        recorder: Optional[Recorder] = None,
+    ) -> npt.NDArray[Any]:
+        """Obtain an array from the cache, loading it on a miss.
+
+        Args:
+            key (Hashable): Key of the array.
+            load (Callable): Loads the array, on a miss.
+            recorder (Recorder, Optional): Recorder of hits and misses.
+
+        Returns:
+            Cached array, which is read-only.
+        """
+        with self.lock:
+            hit = key in self.arrays
+            if hit:
+                self.hits += 1
+                self.arrays.move_to_end(key)
+                array = self.arrays[key]
+            else:
+                self.misses += 1
+        if hit:
+            stats.count(recorder, cache_hits=1)
+            return array
+        stats.count(recorder, cache_misses=1)
+
+        # Load outside the lock, so that other threads are not blocked on reads.
+        array = np.array(load())
+        array.flags.writeable = False
+        with self.lock:
+            if array.nbytes > self.max_bytes or key in self.arrays:
+                return array
+            self.arrays[key] = array
+            self.nbytes += array.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self.arrays.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+        return array
+
+    def view(self, *prefix: Hashable) -> CacheView:
+        """Obtain a view of the cache, with keys prefixed by ``prefix``.
+
+        Args:
+            prefix : Prefix of keys in the view.
+
+        Returns:
+            View of the cache.
+        """
+        return CacheView(self, prefix)
+
+    def clear(self) -> None:
+        """Evict all arrays from the cache."""
+        with self.lock:
+            self.arrays.clear()
+            self.nbytes = 0
+
+    def stats(self) -> CacheStats:
+        """Obtain statistics of the cache.
+
+        Returns:
+            Statistics of the cache.
+        """
+        with self.lock:
+            return CacheStats(
+                self.hits, self.misses, self.evictions, len(self.arrays), self.nbytes
+            )
+
+    def __len__(self) -> int:  # noqa
+        return len(self.arrays)
+
+
+class CacheView:
+    """View of a dataset cache, with keys prefixed by a common prefix.
+
+    Views are passed down from series to system records, and accumulate the
+    iterate, system type and system id into the prefix along the way.
+
+    Args:
+        cache (DatasetCache): Cache being viewed.
+        prefix (Tuple): Prefix of keys in the view.
+    """
+
+    def __init__(self, cache: DatasetCache, prefix: Tuple[Hashable, ...]) -> None:
+        """Initializer."""
+        self.cache = cache
+        self.prefix = prefix
+
+    def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        recorder: Optional[Recorder] = None,
+    ) -> npt.NDArray[Any]:
+        """Obtain an array from the cache, loading it on a miss.
+
+        Args:
+            key (Hashable): Key of the array, within the view.
+            load (Callable): Loads the array, on a miss.
+            recorder (Recorder, Optional): Recorder of hits and misses.
+
+        Returns:
+            Cached array, which is read-only.
+        """
+        return self.cache.get((*self.prefix, key), load, recorder)
+
+    def view(self, *prefix: Hashable) -> CacheView:
+        """Obtain a view of the cache, with keys further prefixed by ``prefix``.
+
+        Args:
+            prefix : Additional prefix of keys in the view.
+
+        Returns:
+            View of the cache.
+        """
+        return CacheView(self.cache, (*self.prefix, *prefix))
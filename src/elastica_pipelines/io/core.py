@@ -3,21 +3,38 @@ from __future__ import annotations
 
 from typing import Any
 from typing import ClassVar
+from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 from typing import overload
 
+import numpy as np
 import numpy.typing as npt
 
+from elastica_pipelines.io import stats
+from elastica_pipelines.io.arrays import RaggedArray
+from elastica_pipelines.io.arrays import _read
+from elastica_pipelines.io.arrays import apply
+from elastica_pipelines.io.arrays import gather
+from elastica_pipelines.io.cache import CacheView
 from elastica_pipelines.io.protocols import ElasticaConvention
 from elastica_pipelines.io.protocols import RecordTraits
 from elastica_pipelines.io.protocols import _ErrorOutTraits
 from elastica_pipelines.io.protocols import record_type
 from elastica_pipelines.io.protocols import slice_type
+from elastica_pipelines.io.stats import Recorder
+from elastica_pipelines.io.structure import FieldInfo
+from elastica_pipelines.io.structure import StructureView
 from elastica_pipelines.io.transforms import Compose
+from elastica_pipelines.io.transforms import is_elementwise
+from elastica_pipelines.io.transforms import is_memory_mapped
+from elastica_pipelines.io.transforms import memory_map
 from elastica_pipelines.io.typing import FuncType
 from elastica_pipelines.io.typing import Indices
 from elastica_pipelines.io.typing import Key
@@ -28,6 +45,181 @@ from elastica_pipelines.io.typing import Records
 from elastica_pipelines.io.typing import RecordsSlice
 
 
+Selection = Tuple[Union[int, slice], ...]
+
+
+def _select_axis(k: Any, n: int) -> Optional[Tuple[Union[int, slice], Any]]:
+    """Split an index along an axis into a forward selection and a reversal.
+
+    Args:
+        k (Any): Index along the axis.
+        n (int): Length of the axis.
+
+    Returns:
+        Integer or slice with positive step selecting the indexed elements, and a
+        slice reversing them if the index has a negative step. None if the index
+        cannot be selected from file, e.g. integer arrays.
+
+    Raises:
+        IndexError: If an integer index is out of bounds.
+    """
+    if isinstance(k, (int, np.integer)) and not isinstance(k, bool):
+        i = int(k) + n if k < 0 else int(k)
+        if not 0 <= i < n:
+            raise IndexError(f"Index {k} is out of bounds for axis with size {n}.")
+        return i, None
+    if not isinstance(k, slice):
+        return None
+    start, stop, step = k.indices(n)
+    if step > 0:
+        return slice(start, stop, step), slice(None)
+    r = range(start, stop, step)
+    if len(r) == 0:
+        return slice(0, 0), slice(None)
+    return slice(r[-1], r[0] + 1, -step), slice(None, None, -1)
+
+
+def _selection(
+    key: Any, shape: Tuple[int, ...]
+) -> Optional[Tuple[Selection, Selection]]:
+    """Split an index of an array into a selection from file and a reversal.
+
+    HDF5 hyperslabs select elements with positive steps only, so elements indexed
+    with negative steps are selected forward and reversed once read.
+
+    Args:
+        key (Any): Index of the array, e.g. ``(slice(None), -1)``.
+        shape (Tuple[int, ...]): Shape of the array.
+
+    Returns:
+        Selection from file, and reversal of the selected array. None if the index
+        cannot be selected from file, e.g. with integer arrays or new axes.
+
+    Raises:
+        IndexError: If the index has more axes than the array.
+    """
+    key = key if isinstance(key, tuple) else (key,)
+    ellipses = [i for i, k in enumerate(key) if k is Ellipsis]
+    if len(ellipses) > 1:
+        return None
+    if ellipses:
+        i = ellipses[0]
+        key = (*key[:i], *[slice(None)] * (len(shape) - len(key) + 1), *key[i + 1 :])
+    if len(key) > len(shape):
+        raise IndexError(f"Too many indices for array with {len(shape)} dimensions.")
+    key = (*key, *[slice(None)] * (len(shape) - len(key)))
+
+    selection: List[Union[int, slice]] = []
+    reversal: List[slice] = []
+    for axis, k in enumerate(key):
+        split = _select_axis(k, shape[axis])
+        if split is None:
+            return None
+        selection.append(split[0])
+        if split[1] is not None:
+            reversal.append(split[1])
+    return tuple(selection), tuple(reversal)
+
+
+class DatasetView:
+    """Lazy view of a field of a system record, read only when indexed.
+
+    Indexing with integers and slices is pushed down to the backend, e.g. as an
+    HDF5 hyperslab selection, so that only the selected elements are read. Other
+    indices (e.g. integer arrays) read the whole field first. With ``MemMap``
+    transforms, contiguous, uncompressed HDF5 datasets are mapped into memory once
+    per view instead, and selected without copies.
+
+    Transforms of the record are applied to the selected elements if they are
+    elementwise (see ``transforms.is_elementwise``), and to the whole field before
+    selecting otherwise. Either way, indexing a view gives the same result as
+    indexing the transformed field.
+
+    Args:
+        data (Any): Raw data of the field, e.g. an HDF5 dataset.
+        transforms (Callable, Optional): A function/transform that takes in an array
+            data-structure and returns a transformed version.
+        recorder (Recorder, Optional): Recorder of IO of the view.
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> rod = series(metadata=metadata_filename)[50].cosserat_rods()[0]
+        >>> tip = rod.view("Position")[:, -1] # reads only the tip
+        >>> every_tenth = rod.view("Position")[:, ::10]
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        transforms: Optional[FuncType] = None,
+        recorder: Optional[Recorder] = None,
+    ) -> None:
+        """Initializer."""
+        self.data = data
+        self.transforms = transforms
+        self.recorder = recorder
+        self.mapped = transforms is not None and is_memory_mapped(transforms)
+        self.memory: Optional[npt.NDArray[Any]] = None
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the raw field."""
+        return tuple(np.shape(self.data))
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Data type of the raw field."""
+        dtype: np.dtype[Any] = np.dtype(self.data.dtype)
+        return dtype
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the raw field."""
+        return len(self.shape)
+
+    def _read(self, key: Any) -> npt.NDArray[Any]:
+        """Read selected elements of the raw field.
+
+        Args:
+            key (Any): Index of the field, all elements if ``()``.
+
+        Returns:
+            Selected raw elements.
+        """
+        # Comparing arrays to () would be elementwise.
+        whole = isinstance(key, tuple) and key == ()
+        split = None if whole else _selection(key, self.shape)
+        with stats.timed(self.recorder, "read_time", reads=1) as counts:
+            if self.mapped:
+                # Mapped on the first read only, or read through HDF5 if it can't be.
+                self.memory, self.mapped = memory_map(self.data), False
+            source = self.data if self.memory is None else self.memory
+            if split is None:
+                data = np.asarray(source)
+            else:
+                data = np.asarray(source[split[0]])[split[1]]
+            counts["bytes_read"] = data.nbytes
+        return data if split is not None or whole else data[key]
+
+    def __getitem__(self, key: Any) -> Any:  # noqa
+        if self.transforms is None:
+            return self._read(key)
+        if is_elementwise(self.transforms):
+            return apply(self.transforms, self._read(key), self.recorder)
+        return apply(self.transforms, self._read(()), self.recorder)[key]
+
+    def __array__(self, dtype: Any = None) -> npt.NDArray[Any]:  # noqa
+        return np.asarray(self[()], dtype=dtype)
+
+    def __len__(self) -> int:  # noqa
+        return self.shape[0]
+
+    def __repr__(self) -> str:  # noqa
+        return f"{self.__class__.__name__}(shape={self.shape}, dtype={self.dtype})"
+
+
 class SystemRecord(Record):
     """Base record for an Elastica++ data-structure.
 
@@ -40,6 +232,11 @@ class SystemRecord(Record):
         transforms (Callable, Optional): A function/transform that takes in an array
             data-structure and returns a transformed version.
             E.g, ``transforms.ToArray``
+        cache (CacheView, Optional): Cache of raw arrays read from the record, before
+            ``transforms`` are applied.
+        recorder (Recorder, Optional): Recorder of IO of the record.
+        structure (StructureView, Optional): Cached structure of the records, in
+            which to lookup fields of the record.
 
     .. note::
             This is decoupled from records because this is a node that deals with purely
@@ -47,29 +244,156 @@ class SystemRecord(Record):
     """
 
     def __init__(
-        self, node: Node, sys_id: int, transforms: Optional[FuncType] = None
+        self,
+        node: Node,
+        sys_id: int,
+        transforms: Optional[FuncType] = None,
+        cache: Optional[CacheView] = None,
+        recorder: Optional[Recorder] = None,
+        structure: Optional[StructureView] = None,
     ) -> None:
         """Init."""
         self.node = node
         self.sys_id = sys_id
         # Add a lambda to WAR weird mypy bugs
         # access may not be needed for general node types
+        self.has_transforms = transforms is not None
+        self.user_transforms: FuncType = transforms or (lambda x: x)
         self.transforms: FuncType = Compose(
-            (ElasticaConvention.access, transforms or (lambda x: x))
+            (ElasticaConvention.access, self.user_transforms)
         )
+        self.cache = cache
+        self.recorder = recorder
+        self.structure = structure
 
     def lazy_lookup(self) -> Any:
         """Lazily lookup an Elastica++ data-structure from records."""
         return self.node[ElasticaConvention.as_system_key(self.sys_id)]
 
+    def _raw(self, k: str) -> Any:
+        """Lookup the raw data of a field, from the cache if any.
+
+        Args:
+            k (str): Field of the record.
+
+        Returns:
+            Raw data of the field, before ``transforms`` are applied.
+        """
+        if self.cache is None:
+            with stats.timed(self.recorder, "read_time", datasets_opened=1):
+                return ElasticaConvention.access(self.lazy_lookup()[k])
+
+        def load() -> npt.NDArray[Any]:
+            return _read(self.lazy_lookup(), k, self.recorder)
+
+        return self.cache.get((self.sys_id, k), load, self.recorder)
+
     def __getitem__(self, k: str) -> npt.ArrayLike:  # noqa
-        return self.transforms(self.lazy_lookup()[k])
+        data: npt.ArrayLike = self._raw(k)
+        if not self.has_transforms:
+            return data
+        with stats.timed(self.recorder, "transform_time"):
+            transformed: npt.ArrayLike = self.user_transforms(data)
+        return transformed
+
+    def read_into(self, field: str, out: npt.NDArray[Any]) -> npt.NDArray[Any]:
+        """Read a field of the record into a preallocated array.
+
+        Raw data is read directly into ``out`` (e.g. through ``read_direct`` of HDF5
+        datasets) without allocating intermediate arrays, so that the same buffer can
+        be reused across iterations. Cached data is copied into ``out``. Transforms
+        are then applied to ``out``, and their result copied back into it unless
+        they return ``out`` itself.
+
+        Args:
+            field (str): Field of the record to read, e.g. ``"Position"``.
+            out (ndarray): Array to read into, of the same shape as the field.
+
+        Returns:
+            ``out`` filled with the field data.
+
+        Raises:
+            ValueError: If the shape of ``out`` differs from that of the field, or
+                from that of the transformed field.
+
+        Example:
+            >>> import numpy as np
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename)
+            >>> out = np.empty((3, 11))
+            >>> for t, snapshot in s.iterations():
+            >>>     snapshot.cosserat_rods()[0].read_into("Position", out)
+        """
+        data: Any = self._raw(field)
+        if np.shape(data) != out.shape:
+            raise ValueError(
+                f"Cannot read field {field} of shape {np.shape(data)} into an array "
+                f"of shape {out.shape}."
+            )
+        with stats.timed(self.recorder, "read_time", reads=1, bytes_read=out.nbytes):
+            if hasattr(data, "read_direct") and out.flags.c_contiguous:
+                data.read_direct(out)
+            else:
+                np.copyto(out, data)
+        if not self.has_transforms:
+            return out
+
+        with stats.timed(self.recorder, "transform_time"):
+            transformed = np.asarray(self.user_transforms(out))
+        if transformed.shape != out.shape:
+            raise ValueError(
+                f"Cannot read field {field} transformed to shape {transformed.shape} "
+                f"into an array of shape {out.shape}."
+            )
+        if transformed is not out:
+            np.copyto(out, transformed)
+        return out
+
+    def view(self, field: str) -> DatasetView:
+        """Lazily view a field of the record, reading only the elements indexed.
+
+        Unlike indexing the record, views bypass the cache and read the selected
+        elements from file on every access.
+
+        Args:
+            field (str): Field of the record to view, e.g. ``"Position"``.
+
+        Returns:
+            Lazy view of the field, see ``DatasetView``.
+        """
+        with stats.timed(self.recorder, "read_time", datasets_opened=1):
+            data = ElasticaConvention.access(self.lazy_lookup()[field])
+        transforms = self.user_transforms if self.has_transforms else None
+        return DatasetView(data, transforms, self.recorder)
+
+    def describe(self, field: str) -> FieldInfo:
+        """Describe a field of the record, without reading it.
+
+        Args:
+            field (str): Field of the record, e.g. ``"Position"``.
+
+        Returns:
+            Shape and data type of the raw field, before ``transforms`` are applied.
+        """
+
+        def lookup() -> Any:
+            return ElasticaConvention.access(self.lazy_lookup()[field])
+
+        if self.structure is None:
+            return FieldInfo.of(lookup())
+        return self.structure.describe(lookup, self.sys_id, field)
 
     def __iter__(self) -> Iterator[str]:  # noqa
-        return iter(self.lazy_lookup())
+        if self.structure is None:
+            return iter(self.lazy_lookup())
+        return iter(self.structure.keys(self.lazy_lookup, self.sys_id))
 
     def __len__(self) -> int:  # noqa
-        return len(self.lazy_lookup())
+        if self.structure is None:
+            return len(self.lazy_lookup())
+        return len(self.structure.keys(self.lazy_lookup, self.sys_id))
 
 
 """Implementation of system-records specific functionality."""
@@ -95,6 +419,24 @@ def _validate(length: int, index: int) -> int:
     return index
 
 
+def _expand(indices: Indices, length: int) -> List[int]:
+    """Expand indices into a list of validated indices.
+
+    Args:
+        indices (Indices): Indices to be expanded.
+        length (int): Length of data-structure.
+
+    Returns:
+        List of indices satisfying 0 <= ``index`` < ``length``
+    """
+    if isinstance(indices, int):
+        return [_validate(length, indices)]
+    elif isinstance(indices, slice):
+        return list(range(*indices.indices(length)))
+    else:
+        return [_validate(length, i) for i in indices]
+
+
 # Can defined a new protocol for mapping
 # @overload
 # def __getitem__(self, k: int) -> Record:
@@ -120,29 +462,88 @@ class SystemRecords(Records):
         transforms (Callable, Optional): A function/transform that takes in an array
             data-structure and returns a transformed version.
             E.g, ``transforms.ToArray``
+        cache (CacheView, Optional): Cache of raw arrays read from records.
+        recorder (Recorder, Optional): Recorder of IO of the records.
+        structure (StructureView, Optional): Cached structure of the records, in
+            which to lookup system ids, and fields of records.
     """
 
     """These traits are not used, but are required to keep the static type-checkers
     quiet."""
     traits: ClassVar[Type[RecordTraits]] = _ErrorOutTraits
 
-    def __init__(self, node: Node, transforms: Optional[FuncType] = None) -> None:
+    def __init__(
+        self,
+        node: Node,
+        transforms: Optional[FuncType] = None,
+        cache: Optional[CacheView] = None,
+        recorder: Optional[Recorder] = None,
+        structure: Optional[StructureView] = None,
+    ) -> None:
         """Initializer."""
         self.node = node
         self.transforms = transforms
+        self.cache = cache
+        self.recorder = recorder
+        self.structure = structure
 
     def __iter__(self) -> Iterator[int]:  # noqa
-        for x in self.node:
+        if self.structure is None:
+            keys: Iterable[str] = self.node
+        else:
+            keys = self.structure.keys(lambda: self.node)
+        for x in keys:
             yield int(x)
 
     def __len__(self) -> int:  # noqa
-        return len(self.node)
+        if self.structure is None:
+            return len(self.node)
+        return len(self.structure.keys(lambda: self.node))
+
+    def to_arrays(
+        self, fields: Sequence[str]
+    ) -> Dict[str, Union[npt.NDArray[Any], RaggedArray]]:
+        """Read fields of all systems into arrays, in one call.
+
+        Uniformly shaped fields are stacked along a new leading axis over systems.
+        Fields differing in length along their last axis, e.g. positions of rods
+        with different number of elements, are packed into a ``RaggedArray``.
+
+        Args:
+            fields (Sequence[str]): Fields to read.
+
+        Returns:
+            Mapping of fields to stacked or packed arrays.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> rods = series(metadata=metadata_filename)[50].cosserat_rods()
+            >>> data = rods.to_arrays(["Position", "Radius"])
+            >>> data["Position"].offsets  # ragged positions of rods
+        """
+        return gather(
+            self.node,
+            range(len(self)),
+            fields,
+            self.transforms,
+            self.cache,
+            self.recorder,
+        )
 
     def __getitem__(self, k: Key) -> RecordLeafs:  # noqa
         length = len(self)
         if isinstance(k, int):
             rt: Type[Record] = record_type(self)
-            return rt(self.node, _validate(length, k), self.transforms)
+            return rt(
+                self.node,
+                _validate(length, k),
+                self.transforms,
+                self.cache,
+                self.recorder,
+                self.structure,
+            )
         elif isinstance(k, slice):
             st: Type[RecordsSlice] = slice_type(self)
             return st(self, slice(*k.indices(length)))
@@ -251,7 +652,7 @@ class RecordsSliceOp:
             Indices into the record slice.
         """
         if isinstance(k, int):
-            return self.value.start + self.value.step * _validate(length, k)
+            return int(self.value.start + self.value.step * _validate(length, k))
         elif isinstance(k, slice):
             c_start, c_stop, c_step = k.indices(length)
             p_start, _, p_step = self.value.start, self.value.stop, self.value.step
@@ -285,6 +686,31 @@ class SystemRecordsSlice(RecordsSlice):
             else RecordsIndexedOp(indices)
         )
 
+    def to_arrays(
+        self, fields: Sequence[str]
+    ) -> Dict[str, Union[npt.NDArray[Any], RaggedArray]]:
+        """Read fields of all systems in the slice into arrays, in one call.
+
+        See ``SystemRecords.to_arrays``.
+
+        Args:
+            fields (Sequence[str]): Fields to read.
+
+        Returns:
+            Mapping of fields to stacked or packed arrays.
+        """
+        length = len(self)
+        sys_ids = [self.indices.get_index_into_slice(i, length) for i in range(length)]
+        parent = self.parent
+        return gather(
+            parent.node,
+            sys_ids,
+            fields,
+            parent.transforms,
+            parent.cache,
+            parent.recorder,
+        )
+
     def __iter__(self) -> Iterator[int]:  # noqa
         # Implemented as integers from 0 to len() instead of parent to
         # have consistent API usage.
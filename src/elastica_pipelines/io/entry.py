@@ -1,13 +1,35 @@
 """Entry point into IO."""
 
 
+import glob
 import pathlib
+import re
 import weakref
+from functools import partial
+from typing import Any
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 
+import numpy as np
+
 from elastica_pipelines.io.backends import SupportedBackends
+from elastica_pipelines.io.cache import DatasetCache
+from elastica_pipelines.io.pool import FilePool
+from elastica_pipelines.io.pool import PooledNode
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.repack import StoreNode
+from elastica_pipelines.io.repack import is_repacked
+from elastica_pipelines.io.stats import Recorder
+from elastica_pipelines.io.structure import StructureCache
+from elastica_pipelines.io.temporal import LiveSeries
 from elastica_pipelines.io.temporal import Series
+from elastica_pipelines.io.temporal import SeriesIndex
 from elastica_pipelines.io.typing import FuncType
 
 
@@ -51,20 +73,443 @@ def _choose_backend(p: pathlib.Path) -> SupportedBackends:
         raise RuntimeError(f"Unsupported backend {p.suffix}")
 
 
+def _sidecar_path(p: pathlib.Path) -> pathlib.Path:
+    """Path of the index sidecar file, stored next to the metadata file.
+
+    Args:
+        p(Path) : path of the metadata file.
+
+    Returns:
+        Path of the sidecar file.
+    """
+    return p.with_name(p.stem + ".index.npz")
+
+
+def _load_index(p: pathlib.Path) -> Optional[SeriesIndex]:
+    """Load an index from the sidecar of a metadata file, if it is up to date.
+
+    Args:
+        p(Path) : path of the metadata file.
+
+    Returns:
+        Index if a sidecar exists and is newer than the metadata file, else None.
+    """
+    sidecar = _sidecar_path(p)
+    try:
+        with np.load(sidecar, allow_pickle=False) as f:
+            if int(f["mtime"]) != p.stat().st_mtime_ns:
+                return None
+            return SeriesIndex(f["iterates"], f["times"], f["dts"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_index(p: pathlib.Path, index: SeriesIndex) -> None:
+    """Save an index to the sidecar of a metadata file.
+
+    Failures to write, e.g. in a read-only directory, are silently ignored.
+
+    Args:
+        p(Path) : path of the metadata file.
+        index(SeriesIndex) : index to be saved.
+    """
+    try:
+        with open(_sidecar_path(p), "wb") as f:
+            np.savez(
+                f,
+                iterates=index.iterates,
+                times=index.times,
+                dts=index.dts,
+                mtime=np.int64(p.stat().st_mtime_ns),
+            )
+    except OSError:
+        pass
+
+
+def _open_hdf5(p: pathlib.Path) -> Any:
+    """Open a HDF5 file for reading.
+
+    Args:
+        p(Path) : path of file to open.
+
+    Returns:
+        Open HDF5 file.
+    """
+    import h5py  # type: ignore[import-untyped]
+
+    return h5py.File(p, "r")
+
+
+def _open_hdf5_fresh(p: pathlib.Path) -> Tuple[Any, BinaryIO]:
+    """Open a HDF5 file for reading, independent of other open handles of the file.
+
+    HDF5 shares the state of a file opened more than once in a process, so groups
+    appended to the file after it was first opened are not seen by reopening it.
+    Opening the file through a Python file object instead reads its current state,
+    without locking the file against a writer.
+
+    SWMR (single-writer multiple-reader) reads are not used: SWMR writers cannot
+    create the groups of the records Elastica++ appends to metadata files, and
+    SWMR readers lock the file against writers which reopen it to append records.
+
+    Args:
+        p(Path) : path of file to open.
+
+    Returns:
+        Open HDF5 file, and the Python file object it reads from, which is not
+        closed with the HDF5 file.
+    """
+    import h5py
+
+    handle = open(p, "rb")  # noqa: SIM115
+    return h5py.File(handle, "r"), handle
+
+
+def _close(*handles: Any) -> None:
+    """Close handles, in order.
+
+    Args:
+        handles : handles to be closed.
+    """
+    for h in handles:
+        h.close()
+
+
+ITERATE_PLACEHOLDER = "%T"
+
+
+def _discover(pattern: str) -> Dict[int, pathlib.Path]:
+    """Discover files of a series from their naming pattern, without opening them.
+
+    Args:
+        pattern(str) : naming pattern of files, with ``%T`` in place of iterates.
+
+    Returns:
+        Files of the series, sorted by iterate.
+
+    Raises:
+        ValueError: If the pattern has no iterate placeholder.
+        FileNotFoundError: If no files match the pattern.
+    """
+    p = pathlib.Path(pattern)
+    if ITERATE_PLACEHOLDER not in p.name:
+        raise ValueError(
+            f"Pattern {pattern} should contain {ITERATE_PLACEHOLDER} in place of "
+            "iterates, e.g. elastica_%T.h5"
+        )
+
+    prefix, suffix = p.name.split(ITERATE_PLACEHOLDER, 1)
+    matcher = re.compile(re.escape(prefix) + r"(\d+)" + re.escape(suffix))
+    files = {}
+    for f in p.parent.glob(glob.escape(prefix) + "*" + glob.escape(suffix)):
+        match = matcher.fullmatch(f.name)
+        if match:
+            files[int(match.group(1))] = f
+
+    if not files:
+        raise FileNotFoundError(f"No files matching pattern {pattern} found.")
+    return dict(sorted(files.items()))
+
+
+class _PatternNode(Mapping[str, Any]):
+    """Series node of files discovered from a naming pattern.
+
+    Args:
+        files (Dict[int, Path]): Files of the series, by iterate.
+        pool (FilePool): Pool from which files are lazily opened.
+    """
+
+    def __init__(self, files: Dict[int, pathlib.Path], pool: FilePool) -> None:
+        """Initializer."""
+        self.files = files
+        self.pool = pool
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        return {"data": PooledNode(self.pool, self.files[int(k)])}
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return map(ElasticaConvention.as_record_key, self.files)
+
+    def __len__(self) -> int:  # noqa
+        return len(self.files)
+
+
+class _MetadataRecord(Mapping[str, Any]):
+    """Record of a metadata file, whose data is linked to another file.
+
+    Args:
+        node (Node): Record node in the metadata file.
+        directory (Path): Directory of the metadata file, relative to which
+            linked files are resolved.
+        pool (FilePool): Pool from which linked files are lazily opened.
+    """
+
+    def __init__(self, node: Any, directory: pathlib.Path, pool: FilePool) -> None:
+        """Initializer."""
+        self.node = node
+        self.directory = directory
+        self.pool = pool
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        link = self.node.get(k, getlink=True)
+        # Data of Elastica++ records is an external link to a time-series file.
+        filename = getattr(link, "filename", None)
+        if filename is None:
+            return self.node[k]
+        parts = tuple(p for p in link.path.split("/") if p)
+        return PooledNode(self.pool, self.directory / filename, parts)
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return iter(self.node)
+
+    def __len__(self) -> int:  # noqa
+        return len(self.node)
+
+
+class _MetadataNode(Mapping[str, Any]):
+    """Series node of a metadata file, with linked files opened from a pool.
+
+    Args:
+        node (Node): Root node of the metadata file.
+        directory (Path): Directory of the metadata file.
+        pool (FilePool): Pool from which linked files are lazily opened.
+        handles (Sequence[Any]): Handles owned by the node, closed in order with
+            the node.
+    """
+
+    def __init__(
+        self,
+        node: Any,
+        directory: pathlib.Path,
+        pool: FilePool,
+        handles: Sequence[Any] = (),
+    ) -> None:
+        """Initializer."""
+        self.node = node
+        self.directory = directory
+        self.pool = pool
+        self.handles = tuple(handles)
+        self._finalizer = weakref.finalize(self, _close, *self.handles)
+
+    def close(self) -> None:
+        """Close the handles owned by the node."""
+        self._finalizer()
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        return _MetadataRecord(self.node[k], self.directory, self.pool)
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return iter(self.node)
+
+    def __len__(self) -> int:  # noqa
+        return len(self.node)
+
+
+def _open_metadata(md: pathlib.Path, pool: FilePool) -> Mapping[str, Any]:
+    """Open a metadata file of an in-progress simulation.
+
+    Args:
+        md(Path) : path of the metadata file.
+        pool(FilePool) : pool from which linked files are lazily opened.
+
+    Returns:
+        Series node of the metadata file.
+    """
+    f, handle = _open_hdf5_fresh(md)
+    return _MetadataNode(f, md.parent, pool, (f, handle))
+
+
+def _structure(cache: bool, validate: bool) -> Optional[StructureCache]:
+    """Make a cache of the structure of a series, if requested.
+
+    Args:
+        cache (bool): Cache the structure of the series.
+        validate (bool): Cache and check the structure at every iteration.
+
+    Returns:
+        Cache of the structure, or None if not requested.
+    """
+    return StructureCache(validate) if cache or validate else None
+
+
+def _metadata_series(
+    md: pathlib.Path,
+    transforms: Optional[FuncType],
+    sidecar: bool,
+    max_open_files: int,
+    max_idle: Optional[float],
+    cache_bytes: Optional[int],
+    follow: bool,
+    poll_interval: float,
+    timeout: Optional[float],
+    cache_structure: bool,
+    validate_structure: bool,
+    recorder: Optional[Recorder],
+) -> Series:
+    """Make a Series from a HDF5 metadata file, or a store repacked from one.
+
+    See ``series`` for a description of the arguments.
+
+    Args:
+        md (Path): Metadata file.
+        transforms (Callable, Optional): Transform of arrays read from the series.
+        sidecar (bool): Persist the temporal index of the series in a sidecar file.
+        max_open_files (int): Maximum number of time-series files kept open.
+        max_idle (float, Optional): Maximum time a time-series file is kept open.
+        cache_bytes (int, Optional): Size in bytes of an in-memory cache of arrays.
+        follow (bool): Follow records appended to the metadata file.
+        poll_interval (float): Time in seconds between polls for appended records.
+        timeout (float, Optional): Time in seconds without appended records after
+            which iterations stop.
+        cache_structure (bool): Cache the structure of the series.
+        validate_structure (bool): Check the cached structure at every iteration.
+        recorder (Recorder, Optional): Recorder of IO of the series.
+
+    Returns:
+        Series object with temporal system evolution.
+
+    Raises:
+        ValueError: If following a repacked store, or persisting its index.
+    """
+    cache = None if cache_bytes is None else DatasetCache(cache_bytes)
+    structure = _structure(cache_structure, validate_structure)
+    f = _open_hdf5(md)
+    if is_repacked(f):
+        if follow or sidecar:
+            f.close()
+            raise ValueError(
+                f"Repacked store {md} is complete and indexed, it cannot be "
+                "followed or indexed in a sidecar file."
+            )
+        node = StoreNode(f)
+        s = Series(
+            node,
+            transforms=transforms,
+            index=node.index(),
+            opener=partial(
+                series,
+                metadata=md,
+                transforms=transforms,
+                cache_bytes=cache_bytes,
+                cache_structure=cache_structure,
+                validate_structure=validate_structure,
+            ),
+            cache=cache,
+            recorder=recorder,
+            structure=structure,
+        )
+        weakref.finalize(s, f.close)
+        return s
+
+    pool = FilePool(
+        _open_hdf5, max_open=max_open_files, max_idle=max_idle, recorder=recorder
+    )
+    if follow:
+        f.close()
+        s = LiveSeries(
+            partial(_open_metadata, md, pool),
+            transforms=transforms,
+            opener=partial(
+                series,
+                metadata=md,
+                transforms=transforms,
+                max_open_files=max_open_files,
+                max_idle=max_idle,
+                cache_bytes=cache_bytes,
+                cache_structure=cache_structure,
+                validate_structure=validate_structure,
+            ),
+            cache=cache,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            recorder=recorder,
+            structure=structure,
+        )
+        weakref.finalize(s, pool.close)
+        return s
+
+    index = _load_index(md) if sidecar else None
+    s = Series(
+        _MetadataNode(f, md.parent, pool),
+        transforms=transforms,
+        index=index,
+        opener=partial(
+            series,
+            metadata=md,
+            transforms=transforms,
+            sidecar=sidecar,
+            max_open_files=max_open_files,
+            max_idle=max_idle,
+            cache_bytes=cache_bytes,
+            cache_structure=cache_structure,
+            validate_structure=validate_structure,
+        ),
+        cache=cache,
+        recorder=recorder,
+        structure=structure,
+    )
+    weakref.finalize(s, _close, pool, f)
+    if sidecar and index is None:
+        _save_index(md, s.index())
+    return s
+
+
 def series(
     *,
     file_pattern: Optional[str] = None,
     metadata: Optional[Union[str, pathlib.Path]] = None,
     transforms: Optional[FuncType] = None,
+    sidecar: bool = False,
+    max_open_files: int = 128,
+    max_idle: Optional[float] = None,
+    cache_bytes: Optional[int] = None,
+    follow: bool = False,
+    poll_interval: float = 1.0,
+    timeout: Optional[float] = None,
+    cache_structure: bool = False,
+    validate_structure: bool = False,
+    stats: bool = False,
 ) -> Series:
     """Make a Series from pattern or metadata file.
 
     Args:
-        file_pattern (str, Optional): Naming pattern of time-series files.
-        metadata : Metadata file.
+        file_pattern (str, Optional): Naming pattern of time-series files, with
+            ``%T`` in place of iterates, e.g. ``"path/to/elastica_%T.h5"``.
+        metadata : Metadata file, or a store repacked from a metadata-driven series
+            (see ``repack``), which is detected and served transparently.
         transforms (Callable, Optional): A function/transform that takes in an array
             data-structure and returns a transformed version.
             E.g, ``transforms.ToArray``
+        sidecar (bool): Persist the temporal index of the series in a sidecar file
+            next to the metadata file, so that listing keys of the series does not
+            need a scan over all iterations. The sidecar is rebuilt when the
+            metadata file is modified.
+        max_open_files (int): Maximum number of time-series files kept open at
+            once.
+        max_idle (float, Optional): Maximum time in seconds a time-series file is
+            kept open without being used.
+        cache_bytes (int, Optional): Size in bytes of an in-memory cache of arrays
+            read from the series, before ``transforms`` are applied. Arrays are
+            not cached if not provided.
+        follow (bool): Follow records appended to the metadata file by an
+            in-progress simulation. The metadata file is reopened without locking
+            on every poll, and ``iterations()`` of the returned ``LiveSeries``
+            block for appended records.
+        poll_interval (float): Time in seconds between polls for appended records,
+            when following.
+        timeout (float, Optional): Time in seconds without appended records after
+            which iterations stop, when following. Iterations follow the series
+            indefinitely if not provided.
+        cache_structure (bool): Discover the structure of the series (system ids,
+            fields, and their shapes and data types) once, and answer structural
+            queries such as ``len(records)`` or ``rod.keys()`` from memory at every
+            iteration. Suited to series whose structure does not change.
+        validate_structure (bool): Cache the structure of the series, and check it
+            against the structure of every iteration once, raising ``ValueError``
+            on changes.
+        stats (bool): Record statistics of IO performed for the series, see
+            ``Series.stats``. IO is not timed nor counted otherwise, unless
+            within ``stats.record``.
 
     Returns:
         Series object with temporal system evolution.
@@ -74,10 +519,19 @@ def series(
         >>> metadata_fn = "tests/io/data/elastica_metadata.h5"
         >>> for t, snapshot in series(metadata=metadata_fn).iterations():
         >>>     print("Iteration: {0} at time {1}".format(t.iterate, t.time))
+        >>>
+        >>> pattern = "tests/io/data/elastica_%T.h5"
+        >>> for t, snapshot in series(file_pattern=pattern).iterations():
+        >>>     print("Iteration: {0}".format(t.iterate))
 
     Raises:
         RuntimeError: If none or both pattern and metadata is simultaneously specified.
-        NotImplementedError: For pattern-based iteration.
+        ValueError: If following a series without a metadata file, or if
+            following or persisting the index of a repacked store.
+
+    .. note::
+            Time-series files do not store temporal information, so times and
+            timesteps of pattern-based series are ``nan``.
     """
     if not (file_pattern or metadata):
         raise RuntimeError(
@@ -90,19 +544,61 @@ def series(
             "simultaneously, choose one."
         )
 
+    if follow and not metadata:
+        raise ValueError("Only series with a metadata file can be followed.")
+
+    recorder = Recorder() if stats else None
     if file_pattern:
-        raise NotImplementedError("Pattern based series matching is not implemented.")
+        files = _discover(file_pattern)
+        backend = _choose_backend(next(iter(files.values())))
+        if backend == SupportedBackends.HDF5:  # pragma: no branch
+            pool = FilePool(
+                _open_hdf5,
+                max_open=max_open_files,
+                max_idle=max_idle,
+                recorder=recorder,
+            )
+            iterates = np.fromiter(files.keys(), dtype=np.int64, count=len(files))
+            nans = np.full(len(files), np.nan)
+            s = Series(
+                _PatternNode(files, pool),
+                transforms=transforms,
+                index=SeriesIndex(iterates, nans, nans.copy()),
+                opener=partial(
+                    series,
+                    file_pattern=file_pattern,
+                    transforms=transforms,
+                    max_open_files=max_open_files,
+                    max_idle=max_idle,
+                    cache_bytes=cache_bytes,
+                    cache_structure=cache_structure,
+                    validate_structure=validate_structure,
+                ),
+                cache=None if cache_bytes is None else DatasetCache(cache_bytes),
+                recorder=recorder,
+                structure=_structure(cache_structure, validate_structure),
+            )
+            weakref.finalize(s, pool.close)
+            return s
 
     if metadata:
         # else metadata file
         md = pathlib.Path(metadata)
         backend = _choose_backend(md)
         if backend == SupportedBackends.HDF5:
-            import h5py  # type: ignore[import]
-
-            f = h5py.File(md, "r")
-            s = Series(f, transforms=transforms)
-            weakref.finalize(s, lambda x: x.close(), f)
-            return s
+            return _metadata_series(
+                md,
+                transforms=transforms,
+                sidecar=sidecar,
+                max_open_files=max_open_files,
+                max_idle=max_idle,
+                cache_bytes=cache_bytes,
+                follow=follow,
+                poll_interval=poll_interval,
+                timeout=timeout,
+                cache_structure=cache_structure,
+                validate_structure=validate_structure,
+                recorder=recorder,
+            )
 
     return Series({}, transforms=transforms)  # pragma: no cover
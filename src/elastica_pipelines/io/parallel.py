@@ -0,0 +1,291 @@
+"""Concurrent reading of Elastica++ data."""
+import asyncio
+import multiprocessing
+import weakref
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import MutableMapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+
+from elastica_pipelines.io.arrays import _read
+from elastica_pipelines.io.stats import Recorder
+from elastica_pipelines.io.typing import Node
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+R = TypeVar("R")
+
+# Source opened once in every worker process.
+_worker_source: Dict[str, Any] = {}
+
+
+def load(
+    node: Node,
+    fields: Optional[Sequence[str]] = None,
+    recorder: Optional[Recorder] = None,
+) -> Tuple[Node, int]:
+    """Read the data of a snapshot node into memory.
+
+    Args:
+        node (Node): Snapshot node, with system types, system ids and fields.
+        fields (Sequence[str], Optional): Fields to be read, e.g. ``["Position"]``.
+            All fields are read if not provided.
+        recorder (Recorder, Optional): Recorder of the reads.
+
+    Returns:
+        In-memory node with the same layout as ``node``, and its size in bytes.
+
+    .. note::
+            Fields not in ``fields`` are absent from the in-memory node.
+    """
+    nbytes = 0
+    loaded: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+    for sys_type, records in node.items():
+        loaded[sys_type] = {}
+        for sys_key, system in records.items():
+            loaded[sys_type][sys_key] = {}
+            for field in system if fields is None else fields:
+                if field not in system:
+                    continue
+                data = _read(system, field, recorder)
+                nbytes += data.nbytes
+                loaded[sys_type][sys_key][field] = {"data": data}
+    return loaded, nbytes
+
+
+def prefetch(
+    keys: Iterable[K],
+    fetch: Callable[[K], Tuple[V, int]],
+    depth: int,
+    workers: int = 1,
+    max_bytes: Optional[int] = None,
+) -> Iterator[Tuple[K, V]]:
+    """Fetch values ahead of consumption on a thread pool, yielding them in order.
+
+    Args:
+        keys (Iterable): Keys to be fetched, in order.
+        fetch (Callable): Fetches the value of a key and returns it with its size
+            in bytes.
+        depth (int): Maximum number of values fetched ahead of consumption.
+        workers (int): Number of threads fetching values.
+        max_bytes (int, Optional): Budget in bytes for the values fetched ahead of
+            consumption. A single value is fetched at first, and the depth grows
+            up to ``depth`` as far as the size of the last fetched value fits the
+            budget, but at least one value is being fetched.
+
+    Yields:
+        Pairs of keys and their fetched values, in the order of ``keys``.
+
+    Raises:
+        ValueError: If ``depth`` or ``workers`` is not positive.
+    """
+    if depth < 1 or workers < 1:
+        raise ValueError(
+            f"Prefetch depth ({depth}) and workers ({workers}) should be positive."
+        )
+
+    it = iter(keys)
+    pending: Deque[Tuple[K, "Future[Tuple[V, int]]"]] = deque()
+    # Sizes of values are unknown until one is fetched.
+    limit = depth if max_bytes is None else 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            while True:
+                for k in islice(it, max(limit - len(pending), 0)):
+                    pending.append((k, pool.submit(fetch, k)))
+
+                if not pending:
+                    return
+
+                k, future = pending.popleft()
+                value, nbytes = future.result()
+                if max_bytes is not None:
+                    limit = max(1, min(depth, max_bytes // max(nbytes, 1)))
+                yield k, value
+        finally:
+            # Do not wait on values that will never be consumed.
+            for _, future in pending:
+                future.cancel()
+
+
+async def aprefetch(
+    keys: Iterable[K],
+    fetch: Callable[[K], Tuple[V, int]],
+    concurrency: int,
+    executor: Optional[Executor] = None,
+    limiter: Optional[asyncio.Semaphore] = None,
+) -> AsyncIterator[Tuple[K, V]]:
+    """Fetch values on an executor without blocking the event loop, in order.
+
+    Args:
+        keys (Iterable): Keys to be fetched, in order.
+        fetch (Callable): Fetches the value of a key and returns it with its size
+            in bytes.
+        concurrency (int): Maximum number of values being fetched at once.
+        executor (Executor, Optional): Executor on which values are fetched, the
+            default executor of the event loop if not provided.
+        limiter (Semaphore, Optional): Semaphore held by every fetch, shared with
+            other fetches from the same source.
+
+    Yields:
+        Pairs of keys and their fetched values, in the order of ``keys``.
+
+    Raises:
+        ValueError: If ``concurrency`` is not positive.
+    """
+    if concurrency < 1:
+        raise ValueError(f"Concurrency ({concurrency}) should be positive.")
+
+    loop = asyncio.get_running_loop()
+    it = iter(keys)
+    pending: "Deque[Tuple[K, asyncio.Future[Tuple[V, int]]]]" = deque()
+    try:
+        while True:
+            for k in islice(it, concurrency - len(pending)):
+                pending.append((k, await _submit(loop, executor, fetch, k, limiter)))
+
+            if not pending:
+                return
+
+            k, future = pending.popleft()
+            value, _ = await future
+            yield k, value
+    finally:
+        # Do not wait on values that will never be consumed.
+        for _, future in pending:
+            future.cancel()
+
+
+async def _submit(
+    loop: asyncio.AbstractEventLoop,
+    executor: Optional[Executor],
+    fetch: Callable[[K], Tuple[V, int]],
+    k: K,
+    limiter: Optional[asyncio.Semaphore],
+) -> "asyncio.Future[Tuple[V, int]]":
+    """Submit a fetch to an executor, once the limiter is acquired.
+
+    Args:
+        loop (AbstractEventLoop): Running event loop.
+        executor (Executor, Optional): Executor on which the value is fetched.
+        fetch (Callable): Fetches the value of a key.
+        k (K): Key to be fetched.
+        limiter (Semaphore, Optional): Semaphore held until the fetch is done.
+
+    Returns:
+        Future of the fetched value.
+    """
+    if limiter is None:
+        return loop.run_in_executor(executor, fetch, k)
+    await limiter.acquire()
+    future = loop.run_in_executor(executor, fetch, k)
+    release = limiter.release
+    future.add_done_callback(lambda _: release())
+    return future
+
+
+class Limiter:
+    """Limit on the number of concurrent tasks, per event loop.
+
+    Semaphores are bound to an event loop, so one is lazily created for every
+    event loop the limiter is used in.
+
+    Args:
+        limit (int): Maximum number of concurrent tasks.
+
+    Raises:
+        ValueError: If ``limit`` is not positive.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initializer."""
+        if limit < 1:
+            raise ValueError(f"Concurrency ({limit}) should be positive.")
+        self.limit = limit
+        self.semaphores: MutableMapping[Any, asyncio.Semaphore]
+        self.semaphores = weakref.WeakKeyDictionary()
+
+    def __call__(self) -> asyncio.Semaphore:
+        """Semaphore of the running event loop.
+
+        Returns:
+            Semaphore limiting concurrent tasks in the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self.semaphores:
+            self.semaphores[loop] = asyncio.Semaphore(self.limit)
+        return self.semaphores[loop]
+
+
+def _open_source(opener: Callable[[], Mapping[Any, Any]]) -> None:
+    """Opens the source of a worker process.
+
+    Args:
+        opener (Callable): Opens the source.
+    """
+    _worker_source["source"] = opener()
+
+
+def _apply(fn: Callable[[Any], R], k: Any) -> R:
+    """Applies a function to a value of the source of a worker process.
+
+    Args:
+        fn (Callable): Function to apply.
+        k (Any): Key of the value in the source.
+
+    Returns:
+        Result of the function.
+    """
+    return fn(_worker_source["source"][k])
+
+
+def map_processes(
+    opener: Callable[[], Mapping[Any, V]],
+    fn: Callable[[V], R],
+    keys: Sequence[Any],
+    processes: Optional[int] = None,
+    chunksize: int = 1,
+) -> List[R]:
+    """Map a function over values of a source on a pool of processes.
+
+    Each process opens the source once, since file handles cannot be shared
+    across processes.
+
+    Args:
+        opener (Callable): Opens the source. Must be picklable.
+        fn (Callable): Function to apply to each value. Must be picklable.
+        keys (Sequence[Any]): Keys of the values in the source, e.g. iterates, or
+            lists of iterates for views of a series.
+        processes (int, Optional): Number of processes, defaults to the number of
+            CPUs.
+        chunksize (int): Number of keys sent to a process at once.
+
+    Returns:
+        Results of the function, in the order of ``keys``.
+    """
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        # Forked processes may inherit HDF5 library state, which is not fork-safe.
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_open_source,
+        initargs=(opener,),
+    ) as pool:
+        return list(pool.map(partial(_apply, fn), keys, chunksize=chunksize))
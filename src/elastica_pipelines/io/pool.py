@@ -0,0 +1,276 @@
+"""Pooling of open file handles."""
+import pathlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+from elastica_pipelines.io import stats
+from elastica_pipelines.io.stats import Recorder
+
+
+@dataclass(frozen=True, eq=True)
+class PoolStats:
+    """Statistics of a file pool.
+
+    Args:
+        hits: Number of opens served by an already open handle.
+        misses: Number of opens that opened a new handle.
+        evictions: Number of handles released by the pool.
+        open: Number of handles currently open in the pool.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    open: int
+
+
+class FilePool:
+    """Least-recently-used pool of open file handles.
+
+    At most ``max_open`` handles are kept open by the pool. When a file is opened
+    beyond that, the least-recently-used handle is released. Handles unused for
+    longer than ``max_idle`` seconds are also released. Released handles are
+    closed, unless they are leased by objects still referenced (see ``acquire``,
+    e.g. ``PooledNode``), in which case they are closed once the last of those
+    objects is dropped. Handles open at any time are thus those of the pool and
+    those still in use.
+
+    Args:
+        opener (Callable): Opens a file given its path, e.g. ``h5py.File``.
+        max_open (int): Maximum number of handles kept open by the pool.
+        max_idle (float, Optional): Maximum time in seconds a handle is kept open
+            without being used. Idle handles are kept open if not provided.
+        recorder (Recorder, Optional): Recorder of files opened by the pool.
+
+    Raises:
+        ValueError: If ``max_open`` is not positive.
+
+    Example:
+        >>> import h5py
+        >>> from elastica_pipelines.io.pool import FilePool
+        >>>
+        >>> pool = FilePool(lambda p: h5py.File(p, "r"), max_open=16)
+        >>> f = pool.open("tests/io/data/elastica_000050.h5")
+    """
+
+    def __init__(
+        self,
+        opener: Callable[[pathlib.Path], Any],
+        max_open: int = 128,
+        max_idle: Optional[float] = None,
+        recorder: Optional[Recorder] = None,
+    ):
+        """Initializer."""
+        if max_open < 1:
+            raise ValueError(f"Maximum open files should be positive, got {max_open}.")
+        self.opener = opener
+        self.max_open = max_open
+        self.max_idle = max_idle
+        self.recorder = recorder
+        # Handles with their last time of use, from least to most recently used.
+        self.handles: OrderedDict[pathlib.Path, Tuple[Any, float]] = OrderedDict()
+        # Number of leases by id of the handle, and released handles still leased.
+        self.leases: Dict[int, int] = {}
+        self.released: Dict[int, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Pools are shared across prefetching threads. Leases may be returned by
+        # the garbage collector while the lock is held, hence reentrant.
+        self.lock = threading.RLock()
+
+    def open(self, path: pathlib.Path) -> Any:
+        """Obtain an open handle to a file.
+
+        The handle is closed when released by the pool, unless leased.
+
+        Args:
+            path (Path): Path of the file.
+
+        Returns:
+            Open handle to the file.
+        """
+        now = time.monotonic()
+        with self.lock:
+            if path in self.handles:
+                self.hits += 1
+                handle, _ = self.handles.pop(path)
+            else:
+                self.misses += 1
+                with stats.timed(self.recorder, "read_time", files_opened=1):
+                    handle = self.opener(path)
+            self._release(now)
+            self.handles[path] = (handle, now)
+            while len(self.handles) > self.max_open:
+                self._evict()
+            return handle
+
+    def acquire(self, path: pathlib.Path, owner: object) -> Any:
+        """Obtain an open handle to a file, leased as long as an object lives.
+
+        Args:
+            path (Path): Path of the file.
+            owner (object): Object using the handle, e.g. a node of the file.
+
+        Returns:
+            Open handle to the file, which is not closed before ``owner`` is
+            garbage collected, even if released by the pool.
+        """
+        with self.lock:
+            handle = self.open(path)
+            self.lease(handle, owner)
+            return handle
+
+    def lease(self, handle: Any, owner: object) -> None:
+        """Keep a handle open as long as an object lives.
+
+        Objects which cannot be weakly referenced, e.g. plain values read from a
+        file, do not reference the file and do not lease its handle.
+
+        Args:
+            handle (Any): Open handle of the pool.
+            owner (object): Object using the handle.
+        """
+        with self.lock:
+            try:
+                weakref.finalize(owner, self._return, handle)
+            except TypeError:
+                return
+            self.leases[id(handle)] = self.leases.get(id(handle), 0) + 1
+
+    def _return(self, handle: Any) -> None:
+        """Return a lease of a handle, closing it if released and not leased.
+
+        Args:
+            handle (Any): Leased handle.
+        """
+        with self.lock:
+            key = id(handle)
+            n = self.leases.pop(key, 1) - 1
+            if n > 0:
+                self.leases[key] = n
+            elif key in self.released:
+                self.released.pop(key).close()
+
+    def _evict(self) -> None:
+        """Release the least-recently-used handle, closing it if not leased."""
+        _, (handle, _) = self.handles.popitem(last=False)
+        self.evictions += 1
+        if id(handle) in self.leases:
+            self.released[id(handle)] = handle
+        else:
+            handle.close()
+
+    def _release(self, now: float) -> None:
+        """Release handles idle for longer than ``max_idle``.
+
+        Args:
+            now (float): Current time.
+        """
+        if self.max_idle is None:
+            return
+        while self.handles:
+            _, (_, last_used) = next(iter(self.handles.items()))
+            if now - last_used < self.max_idle:
+                break
+            self._evict()
+
+    def release_idle(self) -> None:
+        """Release handles idle for longer than ``max_idle``."""
+        now = time.monotonic()
+        with self.lock:
+            self._release(now)
+
+    def stats(self) -> PoolStats:
+        """Obtain statistics of the pool.
+
+        Returns:
+            Statistics of the pool.
+        """
+        with self.lock:
+            return PoolStats(self.hits, self.misses, self.evictions, len(self.handles))
+
+    def close(self) -> None:
+        """Close all handles of the pool, including released handles still leased."""
+        with self.lock:
+            while self.handles:
+                _, (handle, _) = self.handles.popitem(last=False)
+                handle.close()
+            while self.released:
+                _, handle = self.released.popitem()
+                handle.close()
+            self.leases.clear()
+
+    def __contains__(self, path: object) -> bool:  # noqa
+        return path in self.handles
+
+    def __len__(self) -> int:  # noqa
+        return len(self.handles)
+
+
+class PooledNode(Mapping[str, Any]):
+    """Node of a file whose handle is leased from a pool on first lookup.
+
+    Unlike a node obtained from an open handle, this node remains valid when the
+    handle of its file is released by the pool, which closes the handle once no
+    node of the file is referenced anymore. The node is resolved once, and child
+    nodes are resolved from it, without walking again from the root of the file.
+
+    Args:
+        pool (FilePool): Pool of open file handles.
+        path (Path): Path of the file.
+        parts (Tuple[str, ...]): Keys leading to the node from the root of the file.
+        node (Any, Optional): Node already resolved from ``handle``.
+        handle (Any, Optional): Handle of the pool from which ``node`` is resolved.
+    """
+
+    def __init__(
+        self,
+        pool: FilePool,
+        path: pathlib.Path,
+        parts: Tuple[str, ...] = (),
+        node: Any = None,
+        handle: Any = None,
+    ) -> None:
+        """Initializer."""
+        self.pool = pool
+        self.path = path
+        self.parts = parts
+        self.node = node
+        self.handle = handle
+        if handle is not None:
+            pool.lease(handle, self)
+
+    def lookup(self) -> Any:
+        """Lookup the node from an open handle of its file."""
+        if self.node is None:
+            self.handle = self.pool.acquire(self.path, self)
+            node = self.handle
+            for k in self.parts:
+                node = node[k]
+            self.node = node
+        return self.node
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        v = self.lookup()[k]
+        if isinstance(v, Mapping):
+            return PooledNode(self.pool, self.path, (*self.parts, k), v, self.handle)
+        # Leaves, e.g. datasets, keep the handle of their file open.
+        self.pool.lease(self.handle, v)
+        return v
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return iter(list(self.lookup()))
+
+    def __len__(self) -> int:  # noqa
+        return len(self.lookup())
@@ -4,9 +4,11 @@ from __future__ import annotations
 from typing import Any
 from typing import ClassVar
 from typing import NoReturn
+from typing import Sequence
 from typing import Type
 
 from typing_extensions import Protocol
+from typing_extensions import runtime_checkable
 
 from elastica_pipelines.io.typing import Indices
 from elastica_pipelines.io.typing import Key
@@ -86,6 +88,35 @@ class BackendAccess(Protocol):
         ...  # pragma: no cover
 
 
+class BatchTransform(Protocol):
+    """Protocol for transforms that can be applied once to stacked arrays.
+
+    A transform declaring ``supports_batch`` applies independently over any number
+    of leading axes of an array, so that applying it to fields stacked across
+    systems, e.g. ``(n_systems, 3, n_nodes)``, or across iterations and systems,
+    e.g. ``(n_iterations, n_systems, 3, n_nodes)``, gives the same result as
+    applying it to every field and stacking. Bulk reads then apply it once,
+    vectorized, instead of once per field. Fields packed into a ``RaggedArray``
+    are transformed once as their values concatenated along the last axis, so that
+    the transform should also apply independently along it.
+    """
+
+    supports_batch: bool
+
+    def __call__(self, tensor: Any) -> Any:  # noqa
+        ...  # pragma: no cover
+
+
+@runtime_checkable
+class StackableNode(Protocol):
+    """Protocol for series nodes that stack fields across iterations in bulk."""
+
+    def stack(  # noqa
+        self, system: str, field: str, iterates: Sequence[int], indices: Indices
+    ) -> Any:
+        ...  # pragma: no cover
+
+
 class RecordTraits(Protocol):
     """Protocol for a data-record trait instance.
 
@@ -0,0 +1,529 @@
+"""Single-pass streaming reductions of fields over series.
+
+Statistics of fields are computed in one pass over the iterations of a series,
+reading blocks of iterations at once so that memory is bounded by the size of a
+block. Partial statistics of ranges of iterations are merged, so that ranges are
+reduced in parallel.
+"""
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+from typing import cast
+
+import numpy as np
+import numpy.typing as npt
+
+from elastica_pipelines.io import parallel
+from elastica_pipelines.io.arrays import RaggedArray
+from elastica_pipelines.io.arrays import gather
+from elastica_pipelines.io.core import _expand
+from elastica_pipelines.io.protocols import name
+from elastica_pipelines.io.typing import Record
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from elastica_pipelines.io.temporal import SeriesSelection
+
+
+OPS = ("min", "max", "mean", "var", "std", "quantile")
+OVER = ("time", "systems")
+
+Quantiles = Union[float, Sequence[float]]
+Seed = Union[int, Sequence[int]]
+
+
+class Accumulator:
+    """Numerically stable streaming statistics of samples.
+
+    Means and variances of blocks of samples are merged into those accumulated so
+    far with Chan's pairwise formulas, generalizing Welford's updates, which also
+    merge accumulators of different ranges of samples. Quantiles
+    are estimated from a uniform sample of at most ``reservoir_size`` samples,
+    and are exact for fewer samples.
+
+    Args:
+        reservoir_size (int): Maximum number of samples kept for quantiles, none
+            if zero.
+        seed (Seed, Optional): Seed of the sampling of the reservoir.
+
+    Example:
+        >>> import numpy as np
+        >>> from elastica_pipelines.io.reduction import Accumulator
+        >>>
+        >>> acc = Accumulator()
+        >>> acc.update(np.random.rand(100, 3, 11))
+        >>> acc.update(np.random.rand(50, 3, 11))
+        >>> acc.result(["mean", "std"])["mean"].shape # (3, 11)
+    """
+
+    def __init__(self, reservoir_size: int = 0, seed: Optional[Seed] = None) -> None:
+        """Initializer."""
+        self.reservoir_size = reservoir_size
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.mean: Optional[npt.NDArray[np.float64]] = None
+        self.m2: Optional[npt.NDArray[np.float64]] = None
+        self.min: Optional[npt.NDArray[Any]] = None
+        self.max: Optional[npt.NDArray[Any]] = None
+        self.reservoir: Optional[npt.NDArray[np.float64]] = None
+
+    def _merge_moments(
+        self, count: int, mean: npt.NDArray[np.float64], m2: npt.NDArray[np.float64]
+    ) -> None:
+        """Merge moments of other samples into the moments of the accumulator.
+
+        Args:
+            count (int): Number of other samples.
+            mean (ndarray): Mean of other samples.
+            m2 (ndarray): Sum of squared deviations from ``mean`` of other samples.
+        """
+        if self.mean is None or self.m2 is None:
+            self.mean, self.m2 = mean, m2
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (count / total)
+        self.m2 = self.m2 + m2 + delta**2 * (self.count * count / total)
+
+    def _merge_extrema(
+        self, lo: Optional[npt.NDArray[Any]], hi: Optional[npt.NDArray[Any]]
+    ) -> None:
+        """Merge extrema of other samples into the extrema of the accumulator.
+
+        Args:
+            lo (ndarray, Optional): Minimum of other samples.
+            hi (ndarray, Optional): Maximum of other samples.
+        """
+        if lo is None or hi is None:
+            return
+        self.min = lo if self.min is None else np.minimum(self.min, lo)
+        self.max = hi if self.max is None else np.maximum(self.max, hi)
+
+    def _sample(self, block: npt.NDArray[Any]) -> None:
+        """Sample a block of samples into the reservoir, as Algorithm R.
+
+        Args:
+            block (ndarray): Samples along the first axis.
+        """
+        k = self.reservoir_size
+        if self.reservoir is None:
+            self.reservoir = np.empty((k, *block.shape[1:]))
+        seen = self.count + np.arange(len(block))
+        slots = np.where(seen < k, seen, self.rng.integers(0, seen + 1))
+        kept = slots < k
+        self.reservoir[slots[kept]] = block[kept]
+
+    def update(self, block: npt.NDArray[Any]) -> None:
+        """Accumulate a block of samples.
+
+        Args:
+            block (ndarray): Samples along the first axis.
+        """
+        if len(block) == 0:
+            return
+        mean = block.mean(axis=0, dtype=np.float64)
+        self._merge_moments(len(block), mean, ((block - mean) ** 2).sum(axis=0))
+        self._merge_extrema(block.min(axis=0), block.max(axis=0))
+        if self.reservoir_size:
+            self._sample(block)
+        self.count += len(block)
+
+    def merge(self, other: Accumulator) -> Accumulator:
+        """Merge the statistics of another accumulator into this one.
+
+        Args:
+            other (Accumulator): Accumulator of other samples.
+
+        Returns:
+            This accumulator, with statistics of the samples of both.
+        """
+        if other.count == 0 or other.mean is None or other.m2 is None:
+            return self
+        if self.count == 0:
+            self.__dict__.update({**other.__dict__, "rng": self.rng})
+            return self
+        self._merge_moments(other.count, other.mean, other.m2)
+        self._merge_extrema(other.min, other.max)
+        if self.reservoir is not None and other.reservoir is not None:
+            self.reservoir = self._merge_reservoirs(self.reservoir, other)
+        self.count += other.count
+        return self
+
+    def _merge_reservoirs(
+        self, reservoir: npt.NDArray[np.float64], other: Accumulator
+    ) -> npt.NDArray[np.float64]:
+        """Sample the samples of two reservoirs, in proportion of their counts.
+
+        Args:
+            reservoir (ndarray): Reservoir of this accumulator.
+            other (Accumulator): Accumulator of other samples, with a reservoir.
+
+        Returns:
+            Reservoir sampling the samples of both accumulators uniformly.
+        """
+        k = self.reservoir_size
+        mine, theirs = min(k, self.count), min(k, other.count)
+        size = min(k, self.count + other.count)
+        # Number of samples drawn from this reservoir, without replacement.
+        n_mine = int(self.rng.hypergeometric(self.count, other.count, size))
+        merged = np.empty_like(reservoir)
+        merged[:n_mine] = reservoir[self.rng.permutation(mine)[:n_mine]]
+        merged[n_mine:size] = np.asarray(other.reservoir)[
+            self.rng.permutation(theirs)[: size - n_mine]
+        ]
+        return merged
+
+    def result(self, ops: Sequence[str], q: Quantiles = 0.5) -> Dict[str, Any]:
+        """Obtain statistics of the accumulated samples.
+
+        Args:
+            ops (Sequence[str]): Statistics, among ``OPS``.
+            q (Quantiles): Quantiles, for the ``"quantile"`` statistic.
+
+        Returns:
+            Statistics by name, with a leading axis of quantiles if ``q`` is a
+            sequence, as ``np.quantile``.
+
+        Raises:
+            ValueError: If no samples were accumulated.
+        """
+        if self.count == 0 or self.mean is None or self.m2 is None:
+            raise ValueError("Cannot compute statistics without samples.")
+        var = self.m2 / self.count
+        results: Dict[str, Callable[[], Any]] = {
+            "min": lambda: self.min,
+            "max": lambda: self.max,
+            "mean": lambda: self.mean,
+            "var": lambda: var,
+            "std": lambda: np.sqrt(var),
+            "quantile": lambda: self._quantile(q),
+        }
+        return {op: results[op]() for op in ops}
+
+    def _quantile(self, q: Quantiles) -> npt.NDArray[np.float64]:
+        """Estimate quantiles from the reservoir.
+
+        Args:
+            q (Quantiles): Quantiles.
+
+        Returns:
+            Estimated quantiles.
+
+        Raises:
+            ValueError: If the accumulator has no reservoir.
+        """
+        if self.reservoir is None:
+            raise ValueError("Cannot compute quantiles without a reservoir.")
+        samples = self.reservoir[: min(self.reservoir_size, self.count)]
+        return np.quantile(samples, q, axis=0)
+
+
+def _ragged(selection: SeriesSelection, field: str) -> bool:
+    """Whether a field differs in shape across the selected systems.
+
+    Args:
+        selection (SeriesSelection): Selection of systems.
+        field (str): Field of the systems.
+
+    Returns:
+        True if the field cannot be stacked over systems, e.g. positions of rods
+        with different number of elements.
+    """
+    keys = list(selection.keys())
+    if not keys:
+        return False
+    records = selection.parent[keys[0]][name(selection.indices)]
+    sys_ids = _expand(selection.indices.indices, len(records))
+    return len({cast(Record, records[i]).describe(field).shape for i in sys_ids}) > 1
+
+
+def _packed(
+    selection: SeriesSelection, field: str, size: int
+) -> Iterator[Tuple[npt.NDArray[Any], npt.NDArray[np.intp]]]:
+    """Pack a field of the selected systems, in blocks of iterations.
+
+    Args:
+        selection (SeriesSelection): Selection of systems.
+        field (str): Field of the systems.
+        size (int): Maximum number of iterations in a block.
+
+    Yields:
+        Packed values of shape (n_iterations_in_block, ..., n_total_entries), and
+        offsets of the systems into the values.
+
+    Raises:
+        ValueError: If the offsets of the systems change across iterations.
+    """
+    system_name = name(selection.indices)
+    iterates = selection.parent._iterates()
+    offsets: Optional[npt.NDArray[np.intp]] = None
+    for start in range(0, len(iterates), size):
+        values = []
+        packed: Any = None
+        for iterate in iterates[start : start + size]:
+            records = selection.parent[iterate][system_name]
+            sys_ids = _expand(selection.indices.indices, len(records))
+            packed = gather(
+                records.node,
+                sys_ids,
+                [field],
+                records.transforms,
+                records.cache,
+                records.recorder,
+            )[field]
+            if not isinstance(packed, RaggedArray):
+                packed = RaggedArray.pack(list(packed))
+            offsets = packed.offsets if offsets is None else offsets
+            if not np.array_equal(offsets, packed.offsets):
+                raise ValueError(
+                    f"Cannot reduce field {field} over time, the shapes of systems "
+                    f"changed at iteration {iterate}."
+                )
+            values.append(packed.values)
+        yield np.stack(values), packed.offsets
+
+
+def _blocks(
+    selection: SeriesSelection, field: str, size: int
+) -> Iterator[Tuple[npt.NDArray[Any], Optional[npt.NDArray[np.intp]]]]:
+    """Read a field of the selected systems, in blocks of iterations.
+
+    Args:
+        selection (SeriesSelection): Selection of systems.
+        field (str): Field of the systems.
+        size (int): Maximum number of iterations in a block.
+
+    Yields:
+        Either blocks stacked over systems, of shape
+        (n_iterations_in_block, n_systems, ...), without offsets, or blocks packed
+        along the last axis with offsets of systems, see ``_packed``.
+    """
+    if _ragged(selection, field):
+        yield from _packed(selection, field, size)
+    else:
+        for block in selection.chunks(field, size):
+            yield block, None
+
+
+def _entries(
+    block: npt.NDArray[Any], offsets: Optional[npt.NDArray[np.intp]]
+) -> npt.NDArray[Any]:
+    """Lay out a block with all entries of all systems along the second axis.
+
+    Args:
+        block (ndarray): Stacked or packed block, see ``_blocks``.
+        offsets (ndarray, Optional): Offsets of packed systems.
+
+    Returns:
+        Array of shape (n_iterations_in_block, n_entries, ...), e.g. all nodes of
+        all rods along the second axis, followed by components.
+    """
+    if offsets is not None:
+        return np.moveaxis(block, -1, 1)
+    if block.ndim == 2:
+        return block
+    entries = np.moveaxis(block, -1, 2)
+    return entries.reshape(len(block), -1, *entries.shape[3:])
+
+
+def _over_systems(
+    block: npt.NDArray[Any], ops: Sequence[str], q: Quantiles
+) -> Dict[str, npt.NDArray[Any]]:
+    """Compute statistics over all entries of systems, at every iteration.
+
+    Args:
+        block (ndarray): Block of shape (n_iterations_in_block, n_entries, ...).
+        ops (Sequence[str]): Statistics, among ``OPS``.
+        q (Quantiles): Quantiles, for the ``"quantile"`` statistic.
+
+    Returns:
+        Statistics by name, of shape (n_iterations_in_block, ...).
+    """
+    results: Dict[str, Callable[[], Any]] = {
+        "min": partial(np.min, block, axis=1),
+        "max": partial(np.max, block, axis=1),
+        "mean": partial(np.mean, block, axis=1, dtype=np.float64),
+        "var": partial(np.var, block, axis=1, dtype=np.float64),
+        "std": partial(np.std, block, axis=1, dtype=np.float64),
+        "quantile": partial(np.quantile, block, q, axis=1),
+    }
+    return {op: results[op]() for op in ops}
+
+
+Partial = Dict[str, Tuple[Any, Optional[npt.NDArray[np.intp]]]]
+
+
+def _reduce_range(
+    fields: Sequence[str],
+    ops: Sequence[str],
+    over: str,
+    q: Quantiles,
+    chunk_size: int,
+    reservoir_size: int,
+    seed: int,
+    selection: SeriesSelection,
+) -> Partial:
+    """Reduce fields of a selection over a range of iterations.
+
+    Args:
+        fields (Sequence[str]): Fields to reduce.
+        ops (Sequence[str]): Statistics, among ``OPS``.
+        over (str): Axis of the reduction, among ``OVER``.
+        q (Quantiles): Quantiles, for the ``"quantile"`` statistic.
+        chunk_size (int): Maximum number of iterations read at once.
+        reservoir_size (int): Maximum number of samples kept for quantiles.
+        seed (int): Seed of the sampling of the reservoir, combined with the first
+            iterate of the range so that ranges are sampled independently.
+        selection (SeriesSelection): Selection restricted to the range.
+
+    Returns:
+        Accumulators if reducing over time, or lists of statistics of blocks
+        otherwise, by field and with offsets of packed systems.
+    """
+    partials: Partial = {}
+    first = next(iter(selection))
+    for field in fields:
+        state: Any = (
+            Accumulator(
+                reservoir_size if "quantile" in ops else 0, [seed, first.iterate]
+            )
+            if over == "time"
+            else []
+        )
+        offsets = None
+        for block, offsets in _blocks(selection, field, chunk_size):
+            if over == "time":
+                state.update(block)
+            else:
+                state.append(_over_systems(_entries(block, offsets), ops, q))
+        partials[field] = (state, offsets)
+    return partials
+
+
+def _merge(
+    partials: Sequence[Partial], ops: Sequence[str], over: str, q: Quantiles
+) -> Dict[str, Dict[str, Any]]:
+    """Merge partial results of consecutive ranges of iterations.
+
+    Args:
+        partials (Sequence[Partial]): Partial results, in order of iterations.
+        ops (Sequence[str]): Statistics, among ``OPS``.
+        over (str): Axis of the reduction, among ``OVER``.
+        q (Quantiles): Quantiles, for the ``"quantile"`` statistic.
+
+    Returns:
+        Statistics by field and name.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for field in partials[0]:
+        states = [p[field][0] for p in partials]
+        offsets = next((p[field][1] for p in partials if p[field][1] is not None), None)
+        if over == "time":
+            acc = states[0]
+            for state in states[1:]:
+                acc = acc.merge(state)
+            reduced = acc.result(ops, q)
+            if offsets is not None:
+                reduced = {k: RaggedArray(v, offsets) for k, v in reduced.items()}
+        else:
+            blocks = [b for state in states for b in state]
+            reduced = {
+                op: np.concatenate(
+                    [b[op] for b in blocks],
+                    axis=np.ndim(q) if op == "quantile" else 0,
+                )
+                for op in ops
+            }
+        results[field] = reduced
+    return results
+
+
+def _ranges(iterates: Sequence[int], n: int) -> List[List[int]]:
+    """Split iterates into at most ``n`` consecutive ranges of similar sizes.
+
+    Args:
+        iterates (Sequence[int]): Iterates to split.
+        n (int): Number of ranges.
+
+    Returns:
+        Non-empty ranges of iterates.
+    """
+    bounds = np.linspace(0, len(iterates), n + 1).astype(int)
+    return [
+        list(iterates[a:b]) for a, b in np.stack([bounds[:-1], bounds[1:]], 1) if b > a
+    ]
+
+
+def reduce(
+    selection: SeriesSelection,
+    fields: Sequence[str],
+    ops: Sequence[str] = ("mean",),
+    over: str = "time",
+    q: Quantiles = 0.5,
+    chunk_size: int = 64,
+    processes: int = 1,
+    reservoir_size: int = 1024,
+    seed: int = 0,
+) -> Dict[str, Dict[str, Any]]:
+    """Compute statistics of fields of a selection, in one pass over iterations.
+
+    See ``SeriesSelection.reduce``.
+
+    Args:
+        selection (SeriesSelection): Selection of systems.
+        fields (Sequence[str]): Fields to reduce.
+        ops (Sequence[str]): Statistics, among ``OPS``.
+        over (str): Axis of the reduction, among ``OVER``.
+        q (Quantiles): Quantiles, for the ``"quantile"`` statistic.
+        chunk_size (int): Maximum number of iterations read at once.
+        processes (int): Number of processes reducing ranges of iterations.
+        reservoir_size (int): Maximum number of samples kept for quantiles.
+        seed (int): Seed of the sampling of the reservoir.
+
+    Returns:
+        Statistics by field and name.
+
+    Raises:
+        ValueError: If ``ops`` or ``over`` are invalid, or the selection is empty.
+        RuntimeError: If the series cannot be reopened in other processes.
+    """
+    unknown = [op for op in ops if op not in OPS]
+    if unknown or over not in OVER:
+        raise ValueError(
+            f"Invalid reduction of {unknown or ops} over {over}, expected "
+            f"statistics among {OPS} over one of {OVER}."
+        )
+    iterates = selection.parent._iterates()
+    if not iterates:
+        raise ValueError("Cannot reduce an empty selection.")
+    ranges = _ranges(iterates, max(processes, 1))
+    reduce_range = partial(
+        _reduce_range, fields, ops, over, q, chunk_size, reservoir_size, seed
+    )
+    if len(ranges) == 1:
+        return _merge([reduce_range(selection)], ops, over, q)
+    if selection.parent.opener is None:
+        raise RuntimeError(
+            "Series cannot be reopened in other processes, create it with an opener."
+        )
+    from elastica_pipelines.io.temporal import _reselect
+
+    # Ranges of the reopened selection are lazy views, see ``Series.__getitem__``.
+    opener: Callable[[], Mapping[Any, Any]] = partial(
+        _reselect, selection.parent.opener, selection.indices
+    )
+    partials = parallel.map_processes(
+        opener, reduce_range, ranges, len(ranges), chunksize=1
+    )
+    return _merge(partials, ops, over, q)
@@ -0,0 +1,338 @@
+"""Registry of Elastica++ system types.
+
+A system type is declared once, by its name and the schema of its fields, and
+snapshots look up the records of every system in a file through the registry.
+System types of other packages are registered through the
+``elastica_pipelines.system_types`` entry point group, whose entry points load a
+``SystemType`` (or a callable returning one), e.g. in ``pyproject.toml``::
+
+    [tool.poetry.plugins."elastica_pipelines.system_types"]
+    "Cylinder" = "my_package.systems:CYLINDER"
+"""
+from __future__ import annotations
+
+import re
+import warnings
+from dataclasses import dataclass
+from dataclasses import field
+from importlib import metadata
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+
+from elastica_pipelines.io.core import SystemRecord
+from elastica_pipelines.io.core import SystemRecords
+from elastica_pipelines.io.core import SystemRecordsSlice
+from elastica_pipelines.io.protocols import RecordTraits
+from elastica_pipelines.io.protocols import SystemIndices
+from elastica_pipelines.io.typing import Indices
+
+
+ENTRY_POINT_GROUP = "elastica_pipelines.system_types"
+
+#: Dimensions of fields on the nodes, elements and voronoi regions of a system with
+#: ``n`` elements.
+NODES = "n+1"
+ELEMENTS = "n"
+VORONOI = "n-1"
+
+Dim = Union[int, str]
+
+_DIM = re.compile(r"^n(?:([+-])(\d+))?$")
+
+
+def _resolve(dim: Dim, n_elements: int) -> int:
+    """Resolve a dimension of a shape rule.
+
+    Args:
+        dim (Dim): Fixed size, or size relative to the number of elements ``n``,
+            e.g. ``"n+1"``.
+        n_elements (int): Number of elements of the system.
+
+    Returns:
+        Size of the dimension.
+
+    Raises:
+        ValueError: If ``dim`` is not a valid dimension.
+    """
+    if isinstance(dim, int):
+        return dim
+    match = _DIM.match(dim.replace(" ", ""))
+    if match is None:
+        raise ValueError(f"Invalid dimension {dim}, expected e.g. 3, 'n' or 'n+1'.")
+    sign, offset = match.groups()
+    return n_elements + (0 if offset is None else int(f"{sign}{offset}"))
+
+
+@dataclass(frozen=True)
+class FieldSchema:
+    """Schema of a field of a system.
+
+    Args:
+        shape: Rule of the shape of the field, with dimensions either fixed or
+            relative to the number of elements of the system, e.g. ``(3, NODES)``.
+        dtype: Data type of the field.
+        static: Whether the field is constant over a simulation (e.g. ``Mass``), or
+            varies in time (e.g. ``Position``).
+    """
+
+    shape: Tuple[Dim, ...]
+    dtype: str = "float64"
+    static: bool = False
+
+    def __post_init__(self) -> None:  # noqa
+        for dim in self.shape:
+            _resolve(dim, 1)
+
+    @property
+    def fixed(self) -> bool:
+        """Whether the shape of the field is independent of the number of elements."""
+        return all(isinstance(dim, int) for dim in self.shape)
+
+    def resolve(self, n_elements: int) -> Tuple[int, ...]:
+        """Resolve the shape of the field for a system.
+
+        Args:
+            n_elements (int): Number of elements of the system.
+
+        Returns:
+            Shape of the field.
+        """
+        return tuple(_resolve(dim, n_elements) for dim in self.shape)
+
+
+@dataclass(frozen=True)
+class SystemType:
+    """System type of Elastica++, declared by name and field schema.
+
+    Args:
+        name: Name of the system type, as keyed in Elastica++ files.
+        fields: Schema of the fields of the system type. Files may hold fields not
+            in the schema, which are read but not known ahead of time.
+        traits: Traits specializing records for the system type.
+
+    Example:
+        >>> from elastica_pipelines.io.registry import registered
+        >>>
+        >>> rods = registered()["CosseratRod"]
+        >>> rods.shape("Position", n_elements=10) # (3, 11)
+        >>> out = rods.empty("Position", n_elements=10, leading=(100,))
+    """
+
+    name: str
+    fields: Mapping[str, FieldSchema] = field(compare=False)
+    traits: Type[RecordTraits] = field(compare=False)
+
+    def records_type(self) -> Type[SystemRecords]:
+        """Obtains type of (system) records."""
+        return self.traits.records_type()  # type: ignore[return-value]
+
+    def index_type(self) -> Type[SystemIndices]:
+        """Obtains type of (system) index."""
+        return self.traits.index_type()
+
+    def shape(self, field: str, n_elements: int) -> Tuple[int, ...]:
+        """Shape of a field of a system.
+
+        Args:
+            field (str): Field of the system, e.g. ``"Position"``.
+            n_elements (int): Number of elements of the system.
+
+        Returns:
+            Shape of the field.
+
+        Raises:
+            KeyError: If the field is not in the schema.
+        """
+        if field not in self.fields:
+            raise KeyError(f"Field {field} is not in the schema of {self.name}.")
+        return self.fields[field].resolve(n_elements)
+
+    def empty(
+        self, field: str, n_elements: int, leading: Tuple[int, ...] = ()
+    ) -> npt.NDArray[Any]:
+        """Allocate an array for a field of systems, e.g. to read into.
+
+        Args:
+            field (str): Field of the system, e.g. ``"Position"``.
+            n_elements (int): Number of elements of the systems.
+            leading (Tuple[int, ...]): Leading axes, e.g. the numbers of
+                iterations and systems.
+
+        Returns:
+            Uninitialized array of shape ``(*leading, *shape)``.
+        """
+        shape = self.shape(field, n_elements)
+        return np.empty((*leading, *shape), dtype=self.fields[field].dtype)
+
+    def time_varying(self) -> List[str]:
+        """Fields of the system type varying in time."""
+        return [k for k, v in self.fields.items() if not v.static]
+
+
+def declare(name: str, fields: Mapping[str, FieldSchema]) -> SystemType:
+    """Declare a system type, specializing records for it.
+
+    Record, records, slice and index types are made for the system type, as
+    hand-written for the system types of Elastica++ in ``specialize``.
+
+    Args:
+        name (str): Name of the system type, as keyed in Elastica++ files.
+        fields (Mapping[str, FieldSchema]): Schema of the fields of the system type.
+
+    Returns:
+        System type, to be registered with ``register``.
+
+    Example:
+        >>> from elastica_pipelines.io.registry import FieldSchema, declare, register
+        >>>
+        >>> cylinder = register(
+        >>>     declare(
+        >>>         "Cylinder",
+        >>>         {
+        >>>             "Position": FieldSchema((3, 1)),
+        >>>             "Radius": FieldSchema((1,), static=True),
+        >>>         },
+        >>>     )
+        >>> )
+        >>> index = cylinder.index_type()([0, 1])
+    """
+    annotations = {"traits": ClassVar[Type[RecordTraits]]}
+    record = type(f"{name}Record", (SystemRecord,), {"__annotations__": annotations})
+    records = type(f"{name}Records", (SystemRecords,), {"__annotations__": annotations})
+    records_slice = type(
+        f"{name}RecordsSlice", (SystemRecordsSlice,), {"__annotations__": annotations}
+    )
+    index: Type[Any] = dataclass(eq=True, frozen=True)(
+        type(
+            f"{name}RecordIndex",
+            (SystemIndices,),
+            {"__annotations__": {"indices": Indices, **annotations}},
+        )
+    )
+    traits = type(
+        f"{name}RecordTraits",
+        (),
+        {
+            "record_type": staticmethod(lambda: record),
+            "records_type": staticmethod(lambda: records),
+            "slice_type": staticmethod(lambda: records_slice),
+            "name": staticmethod(lambda: name),
+            "index_type": staticmethod(lambda: index),
+        },
+    )
+    for t in (record, records, records_slice, index):
+        t.traits = traits  # type: ignore[attr-defined]
+    return SystemType(name, dict(fields), traits)
+
+
+# System types by name, and records types by name derived from them.
+_registry: Dict[str, SystemType] = {}
+_records_types: Dict[str, Type[SystemRecords]] = {}
+_plugins_loaded = False
+
+
+def register(system_type: SystemType) -> SystemType:
+    """Register a system type, for snapshots to read its records.
+
+    Args:
+        system_type (SystemType): System type to register.
+
+    Returns:
+        ``system_type``, once registered.
+
+    Raises:
+        ValueError: If another system type is registered with the same name.
+    """
+    existing = _registry.get(system_type.name)
+    if existing is not None and existing.traits is not system_type.traits:
+        raise ValueError(f"System type {system_type.name} is already registered.")
+    _registry[system_type.name] = system_type
+    _records_types[system_type.name] = system_type.records_type()
+    return system_type
+
+
+def unregister(name: str) -> None:
+    """Unregister a system type.
+
+    Args:
+        name (str): Name of the system type.
+    """
+    _registry.pop(name, None)
+    _records_types.pop(name, None)
+
+
+def _entry_points() -> Iterable[Any]:
+    """Entry points of the system types of other packages."""
+    eps: Any = metadata.entry_points()
+    selected: Iterable[Any] = (
+        eps.select(group=ENTRY_POINT_GROUP)
+        if hasattr(eps, "select")
+        # Python < 3.10, entry points by group.
+        else eps.get(ENTRY_POINT_GROUP, [])
+    )
+    return selected
+
+
+def load_plugins() -> None:
+    """Register the system types of other packages, from their entry points.
+
+    Plugins are loaded once, on the first lookup of the registry. Plugins failing
+    to load are skipped with a warning.
+    """
+    global _plugins_loaded
+    _plugins_loaded = True
+    for ep in _entry_points():
+        try:
+            loaded = ep.load()
+            register(loaded if isinstance(loaded, SystemType) else loaded())
+        except Exception as e:  # noqa: B902
+            warnings.warn(
+                f"Skipping system type {ep.name} of plugin {ep.value}: {e!r}",
+                stacklevel=2,
+            )
+
+
+def registered() -> Mapping[str, SystemType]:
+    """Obtain the registered system types.
+
+    Returns:
+        System types by name, including those of plugins.
+    """
+    if not _plugins_loaded:
+        load_plugins()
+    return _registry
+
+
+def records_types() -> Mapping[str, Type[SystemRecords]]:
+    """Obtain the records types of the registered system types.
+
+    Returns:
+        Records types by system name, shared across calls and updated on
+        registration.
+    """
+    if not _plugins_loaded:
+        load_plugins()
+    return _records_types
+
+
+def lookup(name: str) -> Optional[SystemType]:
+    """Lookup a registered system type.
+
+    Args:
+        name (str): Name of the system type.
+
+    Returns:
+        System type, or None if no system type is registered with ``name``.
+    """
+    return registered().get(name)
@@ -0,0 +1,524 @@
+"""Repacking of Elastica IO series into a consolidated time-major store.
+
+Series written by Elastica++ are spread across one file per iteration, so reading
+the trajectory of a system opens and reads every file. The repacked store keeps
+all iterations in a single HDF5 file, with one chunked, compressed dataset per
+system type and field, laid out as ``(n_iterations, n_systems, ...)``.
+
+Fields differing in length along their last axis across systems (e.g. rods with
+different number of elements) are padded to the longest length, and the length
+of every system is stored alongside.
+
+Layout of the store::
+
+    /TimeMetadata/{iterate, time, dt}           (n_iterations,)
+    /<SystemType>/<Field>/data                  (n_iterations, n_systems, ...)
+    /<SystemType>/<Field>/lengths               (n_systems,), if padded
+"""
+from __future__ import annotations
+
+import pathlib
+from dataclasses import dataclass
+from typing import Any
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+
+from elastica_pipelines.io import registry
+from elastica_pipelines.io.core import _expand
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.temporal import Series
+from elastica_pipelines.io.temporal import SeriesIndex
+from elastica_pipelines.io.typing import Indices
+
+
+LAYOUT_ATTRIBUTE = "elastica_pipelines_layout"
+TIME_MAJOR_LAYOUT = "time-major"
+TIME_GROUP = "TimeMetadata"
+
+
+def is_repacked(node: Any) -> bool:
+    """Check if a HDF5 node is the root of a repacked store.
+
+    Args:
+        node (Any): HDF5 node.
+
+    Returns:
+        True if the node is laid out as a repacked store.
+    """
+    attrs = getattr(node, "attrs", {})
+    return bool(attrs.get(LAYOUT_ATTRIBUTE) == TIME_MAJOR_LAYOUT)
+
+
+def _empty_shape(
+    system: str, field: str, group: Any, sys_ids: npt.NDArray[np.intp]
+) -> Tuple[int, ...]:
+    """Unpadded shape of a field, when stacking no iterations or systems.
+
+    As in ``SeriesSelection.empty``, fields in the schema of the system type are
+    laid out for a single element, and other fields as the first selected system.
+
+    Args:
+        system (str): Type of the systems, e.g. ``"CosseratRod"``.
+        field (str): Field of the systems, e.g. ``"Position"``.
+        group (Any): Group of the field in the store.
+        sys_ids (NDArray): Indices of the selected systems.
+
+    Returns:
+        Shape of the field.
+
+    Raises:
+        KeyError: If the field is padded, not in the schema of the system type, and
+            no systems are selected.
+    """
+    system_type = registry.lookup(system)
+    schema = None if system_type is None else system_type.fields.get(field)
+    shape: Tuple[int, ...] = group["data"].shape[2:]
+    if schema is not None:
+        return schema.resolve(1)
+    if "lengths" not in group:
+        return shape
+    if len(sys_ids) == 0:
+        raise KeyError(f"Field {field} is not in the schema of {system}.")
+    return (*shape[:-1], int(group["lengths"][sys_ids[0]]))
+
+
+def _layout(
+    shapes: Sequence[Tuple[int, ...]]
+) -> Tuple[Tuple[int, ...], Optional[List[int]]]:
+    """Padded shape of a field across systems.
+
+    Args:
+        shapes (Sequence): Shapes of the field for every system.
+
+    Returns:
+        Shape of the padded field, and lengths of every system along the last axis
+        if the field is padded.
+
+    Raises:
+        ValueError: If shapes differ in more than their last axis.
+    """
+    first = shapes[0]
+    if all(s == first for s in shapes):
+        return first, None
+    if not all(len(s) > 0 and s[:-1] == first[:-1] for s in shapes):
+        raise ValueError(f"Shapes {set(shapes)} differ in more than their last axis.")
+    lengths = [s[-1] for s in shapes]
+    return (*first[:-1], max(lengths)), lengths
+
+
+def repack(
+    source: Series,
+    path: Union[str, pathlib.Path],
+    chunk_iterations: int = 64,
+    compression: Optional[str] = "gzip",
+) -> None:
+    """Repack a series into a consolidated time-major store.
+
+    Raw data of the series is repacked, i.e. transforms of ``source`` are not
+    applied. Shapes of fields are fixed by the first iteration of the series.
+
+    Args:
+        source (Series): Series to be repacked.
+        path (str, Path): Path of the store to be written.
+        chunk_iterations (int): Number of iterations per chunk of the store. Data
+            is also written in blocks of as many iterations.
+        compression (str, Optional): HDF5 compression filter, e.g. ``"gzip"`` or
+            ``"lzf"``. Data is not compressed if not provided.
+
+    Raises:
+        ValueError: If ``chunk_iterations`` is not positive, if the series is
+            empty, or if the shape of a field changes across iterations.
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>> from elastica_pipelines.io.repack import repack
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> repack(series(metadata=metadata_filename), "elastica_repacked.h5")
+        >>>
+        >>> # Repacked stores are served transparently
+        >>> s = series(metadata="elastica_repacked.h5")
+    """
+    import h5py  # type: ignore[import-untyped]
+
+    if chunk_iterations < 1:
+        raise ValueError(
+            f"Iterations per chunk should be positive, got {chunk_iterations}."
+        )
+    index = source.index()
+    n_iterations = len(index)
+    if n_iterations == 0:
+        raise ValueError("Cannot repack an empty series.")
+
+    def snapshot(iterate: int) -> Mapping[str, Any]:
+        record = source.node[ElasticaConvention.as_record_key(iterate)]
+        data: Mapping[str, Any] = ElasticaConvention.access(record)
+        return data
+
+    first = snapshot(int(index.iterates[0]))
+    with h5py.File(path, "w") as f:
+        f.attrs[LAYOUT_ATTRIBUTE] = TIME_MAJOR_LAYOUT
+        time = f.create_group(TIME_GROUP)
+        time.create_dataset("iterate", data=index.iterates)
+        time.create_dataset("time", data=index.times)
+        time.create_dataset("dt", data=index.dts)
+
+        fields: List[_Field] = []
+        for system_type, records in first.items():
+            group = f.create_group(system_type)
+            group.attrs["n_systems"] = len(records)
+            keys = [ElasticaConvention.as_system_key(s) for s in range(len(records))]
+            for field in list(records[keys[0]]) if keys else []:
+                shapes = [
+                    np.shape(ElasticaConvention.access(records[k][field])) for k in keys
+                ]
+                dataset = _create_field(
+                    group.create_group(field),
+                    shapes,
+                    np.asarray(
+                        ElasticaConvention.access(records[keys[0]][field])
+                    ).dtype,
+                    n_iterations,
+                    chunk_iterations,
+                    compression,
+                )
+                fields.append(_Field(system_type, field, keys, shapes, dataset))
+
+        # Every file of the series is opened once, and all its fields are copied.
+        for start in range(0, n_iterations, chunk_iterations):
+            block_iterates = index.iterates[start : start + chunk_iterations]
+            blocks = [
+                np.zeros((len(block_iterates), *c.dataset.shape[1:]), c.dataset.dtype)
+                for c in fields
+            ]
+            for t, iterate in enumerate(block_iterates):
+                data = snapshot(int(iterate))
+                for i, block in enumerate(blocks):
+                    fields[i].copy(data, int(iterate), block[t])
+            for i, block in enumerate(blocks):
+                fields[i].dataset[start : start + len(block_iterates)] = block
+
+
+@dataclass(frozen=True)
+class _Field:
+    """Field of a system type, copied into a store.
+
+    Args:
+        system_type (str): Type of the systems, e.g. ``"CosseratRod"``.
+        field (str): Name of the field.
+        keys (List[str]): Keys of the systems.
+        shapes (List[Tuple[int, ...]]): Shapes of the field for every system.
+        dataset (Any): Dataset of the field in the store.
+    """
+
+    system_type: str
+    field: str
+    keys: List[str]
+    shapes: List[Tuple[int, ...]]
+    dataset: Any
+
+    def copy(self, data: Mapping[str, Any], iterate: int, out: Any) -> None:
+        """Copy the field of all systems at an iteration.
+
+        Args:
+            data (Mapping[str, Any]): Systems of all types at the iteration.
+            iterate (int): Iterate of the iteration.
+            out (Any): Padded array of shape (n_systems, ...) to copy into.
+
+        Raises:
+            ValueError: If the shape of the field differs from the first iteration.
+        """
+        records = data[self.system_type]
+        for s, k in enumerate(self.keys):
+            value = np.asarray(ElasticaConvention.access(records[k][self.field]))
+            if value.shape != self.shapes[s]:
+                raise ValueError(
+                    f"Field {self.field} of system {s} of type {self.system_type} "
+                    f"at iteration {iterate} has shape {value.shape}, expected "
+                    f"{self.shapes[s]}."
+                )
+            where: Tuple[Union[int, slice], ...] = (
+                s,
+                *(slice(n) for n in value.shape),
+            )
+            out[where] = value
+
+
+def _create_field(
+    group: Any,
+    shapes: Sequence[Tuple[int, ...]],
+    dtype: Any,
+    n_iterations: int,
+    chunk_iterations: int,
+    compression: Optional[str],
+) -> Any:
+    """Create the datasets of a field in a store.
+
+    Args:
+        group (Any): Group of the field in the store.
+        shapes (Sequence): Shapes of the field for every system.
+        dtype (Any): Type of the field.
+        n_iterations (int): Number of iterations in the store.
+        chunk_iterations (int): Number of iterations per chunk of the store.
+        compression (str, Optional): HDF5 compression filter.
+
+    Returns:
+        Dataset of the field, of shape (n_iterations, n_systems, ...).
+    """
+    shape, lengths = _layout(shapes)
+    if lengths is not None:
+        group.create_dataset("lengths", data=np.asarray(lengths))
+    full_shape = (n_iterations, len(shapes), *shape)
+    if 0 in full_shape:
+        # Empty datasets cannot be chunked.
+        return group.create_dataset("data", shape=full_shape, dtype=dtype)
+    return group.create_dataset(
+        "data",
+        shape=full_shape,
+        dtype=dtype,
+        chunks=(min(n_iterations, chunk_iterations), 1, *shape),
+        compression=compression,
+    )
+
+
+class _StoreField(Mapping[str, Any]):
+    """Field of a system, at an iteration of a repacked store.
+
+    Args:
+        group (Node): Group of the field in the store.
+        position (int): Position of the iteration in the store.
+        sys_id (int): Id of the system.
+    """
+
+    def __init__(self, group: Any, position: int, sys_id: int) -> None:
+        """Initializer."""
+        self.group = group
+        self.position = position
+        self.sys_id = sys_id
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        if k != "data":
+            raise KeyError(k)
+        value = self.group["data"][self.position, self.sys_id]
+        if "lengths" in self.group:
+            value = value[..., : self.group["lengths"][self.sys_id]]
+        return value
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return iter(("data",))
+
+    def __len__(self) -> int:  # noqa
+        return 1
+
+
+class _StoreSystem(Mapping[str, Any]):
+    """System at an iteration of a repacked store.
+
+    Args:
+        group (Node): Group of the system type in the store.
+        position (int): Position of the iteration in the store.
+        sys_id (int): Id of the system.
+    """
+
+    def __init__(self, group: Any, position: int, sys_id: int) -> None:
+        """Initializer."""
+        self.group = group
+        self.position = position
+        self.sys_id = sys_id
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        return _StoreField(self.group[k], self.position, self.sys_id)
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return iter(self.group)
+
+    def __len__(self) -> int:  # noqa
+        return len(self.group)
+
+
+class _StoreRecords(Mapping[str, Any]):
+    """Systems of a type at an iteration of a repacked store.
+
+    Args:
+        group (Node): Group of the system type in the store.
+        position (int): Position of the iteration in the store.
+    """
+
+    def __init__(self, group: Any, position: int) -> None:
+        """Initializer."""
+        self.group = group
+        self.position = position
+        self.n_systems = int(group.attrs["n_systems"])
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        sys_id = int(k)
+        if not 0 <= sys_id < self.n_systems:
+            raise KeyError(k)
+        return _StoreSystem(self.group, self.position, sys_id)
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return map(ElasticaConvention.as_system_key, range(self.n_systems))
+
+    def __len__(self) -> int:  # noqa
+        return self.n_systems
+
+
+class _StoreSnapshot(Mapping[str, Any]):
+    """Systems of all types at an iteration of a repacked store.
+
+    Args:
+        store (Node): Root of the store.
+        position (int): Position of the iteration in the store.
+    """
+
+    def __init__(self, store: Any, position: int) -> None:
+        """Initializer."""
+        self.store = store
+        self.position = position
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        if k == TIME_GROUP:
+            raise KeyError(k)
+        return _StoreRecords(self.store[k], self.position)
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return (k for k in self.store if k != TIME_GROUP)
+
+    def __len__(self) -> int:  # noqa
+        return len(self.store) - 1
+
+
+class StoreNode(Mapping[str, Any]):
+    """Series node of a repacked store.
+
+    Emulates the layout of a metadata-driven series, so that the store is served
+    as a regular ``Series``. Stacking a field of systems across iterations reads
+    the selected iterations and systems in bulk.
+
+    Args:
+        store (Node): Root of the store.
+    """
+
+    def __init__(self, store: Any) -> None:
+        """Initializer."""
+        self.store = store
+        time = store[TIME_GROUP]
+        self.iterates: npt.NDArray[np.int64] = np.asarray(time["iterate"][()])
+        self.times: npt.NDArray[np.float64] = np.asarray(time["time"][()])
+        self.dts: npt.NDArray[np.float64] = np.asarray(time["dt"][()])
+
+    def index(self) -> SeriesIndex:
+        """Obtain the temporal index of the store.
+
+        Returns:
+            Temporal index sorted by iterate.
+        """
+        return SeriesIndex(self.iterates, self.times, self.dts)
+
+    def position(self, iterate: int) -> int:
+        """Position of an iterate in the store.
+
+        Args:
+            iterate (int): Iterate to locate.
+
+        Returns:
+            Position of the iterate.
+
+        Raises:
+            KeyError: If the iterate is not in the store.
+        """
+        i = int(np.searchsorted(self.iterates, iterate))
+        if i == len(self.iterates) or self.iterates[i] != iterate:
+            raise KeyError(f"{iterate}")
+        return i
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        i = self.position(int(k))
+        return {
+            TIME_GROUP: {"time": self.times[i], "dt": self.dts[i]},
+            "data": _StoreSnapshot(self.store, i),
+        }
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return map(ElasticaConvention.as_record_key, self.iterates.tolist())
+
+    def __len__(self) -> int:  # noqa
+        return len(self.iterates)
+
+    def stack(
+        self,
+        system: str,
+        field: str,
+        iterates: Sequence[int],
+        indices: Indices,
+    ) -> npt.NDArray[Any]:
+        """Stack a field of systems across iterations, in bulk reads.
+
+        Args:
+            system (str): Type of the systems, e.g. ``"CosseratRod"``.
+            field (str): Field of the systems, e.g. ``"Position"``.
+            iterates (Sequence[int]): Iterates to stack, in increasing order.
+            indices (Indices): Indices of systems to stack.
+
+        Returns:
+            Array of shape (n_iterates, n_systems, ...).
+
+        Raises:
+            ValueError: If the field shapes differ across the systems.
+
+        .. note::
+                Nothing stacked is laid out as ``SeriesSelection.empty``, unpadded.
+        """
+        group = self.store[system][field]
+        sys_ids = np.asarray(
+            _expand(indices, int(self.store[system].attrs["n_systems"])), dtype=np.intp
+        )
+        positions = np.asarray([self.position(i) for i in iterates], dtype=np.intp)
+        dataset = group["data"]
+        if len(positions) == 0 or len(sys_ids) == 0:
+            shape = _empty_shape(system, field, group, sys_ids)
+            return np.empty((len(positions), len(sys_ids), *shape), dtype=dataset.dtype)
+        length: Optional[int] = None
+        if "lengths" in group:
+            lengths = np.asarray(group["lengths"][()])[sys_ids]
+            if np.any(lengths != lengths[0]):
+                raise ValueError(
+                    f"Cannot stack field {field} of systems {sys_ids.tolist()}, "
+                    f"the shapes differ."
+                )
+            length = int(lengths[0])
+
+        # HDF5 reads a single list selection at a time, so iterations are selected
+        # by list and systems by contiguous runs, in increasing order.
+        rows, row_inverse = np.unique(positions, return_inverse=True)
+        row_runs = _runs(rows)
+        row_selection = row_runs[0] if len(row_runs) == 1 else rows.tolist()
+        columns, column_inverse = np.unique(sys_ids, return_inverse=True)
+        out: npt.NDArray[Any] = np.concatenate(
+            [dataset[row_selection, run] for run in _runs(columns)], axis=1
+        )[row_inverse][:, column_inverse]
+        return out if length is None else out[..., :length]
+
+
+def _runs(ids: npt.NDArray[np.intp]) -> List[slice]:
+    """Contiguous runs of sorted unique ids, as slices.
+
+    Args:
+        ids (ndarray): Sorted unique ids.
+
+    Returns:
+        Slices of the runs of consecutive ids, in order.
+    """
+    bounds = [0, *(np.flatnonzero(np.diff(ids) != 1) + 1).tolist(), len(ids)]
+    return [
+        slice(int(ids[bounds[i]]), int(ids[bounds[i + 1] - 1]) + 1)
+        for i in range(len(bounds) - 1)
+    ]
@@ -0,0 +1,330 @@
+"""Spatial indexing of the nodes of systems of a snapshot.
+
+Positions of all systems of a snapshot (nodes of rods, centers of spheres) are
+read in bulk and bucketed into a uniform grid, so that box, radius and nearest
+neighbour queries only look at the points of the cells overlapping the query.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from elastica_pipelines.io import registry
+from elastica_pipelines.io.arrays import RaggedArray
+from elastica_pipelines.io.core import SystemRecords
+from elastica_pipelines.io.protocols import SystemIndices
+
+
+Point = Sequence[float]
+
+
+@dataclass(frozen=True, eq=False)
+class Hits:
+    """Points of systems found by a spatial query.
+
+    Args:
+        systems (Tuple[str, ...]): Names of the system types of the index.
+        system (ndarray): System type of every hit, as position in ``systems``.
+        sys_id (ndarray): Id of the system of every hit.
+        element (ndarray): Position of every hit along the last axis of the field,
+            e.g. the node of a rod, or 0 for spheres.
+        distance (ndarray, Optional): Distance of every hit to the query point,
+            for radius and nearest neighbour queries.
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> index = series(metadata=metadata_filename)[50].spatial_index()
+        >>> for system_name, sys_id, element in index.radius([0.0, 0.0, 0.0], 0.1):
+        >>>     print(system_name, sys_id, element)
+    """
+
+    systems: Tuple[str, ...]
+    system: npt.NDArray[np.intp]
+    sys_id: npt.NDArray[np.intp]
+    element: npt.NDArray[np.intp]
+    distance: Optional[npt.NDArray[np.float64]] = None
+
+    def sys_ids(self, system_name: str) -> List[int]:
+        """Obtain the ids of the systems of a system type with hits.
+
+        Args:
+            system_name (str): Name of the system type, e.g. ``"CosseratRod"``.
+
+        Returns:
+            Sorted ids of the systems with at least one hit.
+        """
+        if system_name not in self.systems:
+            return []
+        code = self.systems.index(system_name)
+        ids: List[int] = np.unique(self.sys_id[self.system == code]).tolist()
+        return ids
+
+    def __iter__(self) -> Iterator[Tuple[str, int, int]]:  # noqa
+        for i in range(len(self)):
+            yield (
+                self.systems[self.system[i]],
+                int(self.sys_id[i]),
+                int(self.element[i]),
+            )
+
+    def __len__(self) -> int:  # noqa
+        return len(self.sys_id)
+
+
+def _points(
+    positions: Any,
+) -> Tuple[npt.NDArray[Any], npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Flatten positions of systems of a type into points.
+
+    Args:
+        positions (Any): Positions read by ``SystemRecords.to_arrays``, stacked of
+            shape ``(n_systems, 3, n)`` or packed of shape ``(3, n_total)``.
+
+    Returns:
+        Points of shape ``(n_points, 3)``, with system id and element of every
+        point.
+    """
+    if isinstance(positions, RaggedArray):
+        lengths = positions.lengths
+        sys_id = np.repeat(np.arange(len(lengths)), lengths)
+        element = np.arange(len(sys_id)) - np.repeat(positions.offsets[:-1], lengths)
+        return positions.values.T, sys_id, element
+    n_systems, _, n = positions.shape
+    points = np.moveaxis(positions, 1, -1).reshape(-1, 3)
+    return points, np.repeat(np.arange(n_systems), n), np.tile(np.arange(n), n_systems)
+
+
+class SpatialIndex:
+    """Uniform grid over points of systems, e.g. nodes of rods and sphere centers.
+
+    Points are sorted by the cell of the grid they fall into, so that the points
+    of a cell are a contiguous range found by binary search.
+
+    Args:
+        points (ndarray): Points of shape ``(n_points, 3)``.
+        systems (Tuple[str, ...]): Names of the system types of the points.
+        system (ndarray): System type of every point, as position in ``systems``.
+        sys_id (ndarray): Id of the system of every point.
+        element (ndarray): Position of every point along the last axis of the
+            field it is read from.
+        cell_size (float, Optional): Edge length of the cells of the grid, chosen
+            for about one point per cell of the bounding box if not provided.
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> snapshot = series(metadata=metadata_filename)[50]
+        >>> index = snapshot.spatial_index()
+        >>> index.box([0.0, 0.0, 0.0], [1.0, 0.5, 0.5]).sys_ids("CosseratRod")
+        >>> index.knn([0.0, 0.1, 0.0], k=4).distance
+    """
+
+    def __init__(
+        self,
+        points: npt.NDArray[Any],
+        systems: Tuple[str, ...],
+        system: npt.NDArray[np.intp],
+        sys_id: npt.NDArray[np.intp],
+        element: npt.NDArray[np.intp],
+        cell_size: Optional[float] = None,
+    ) -> None:
+        """Initializer."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        self.systems = systems
+        self.lo = points.min(axis=0) if len(points) else np.zeros(3)
+        extent = points.max(axis=0) - self.lo if len(points) else np.zeros(3)
+        if cell_size is None:
+            cell_size = float(extent.max()) / max(round(len(points) ** (1 / 3)), 1)
+        self.cell_size = cell_size if cell_size > 0 else 1.0
+        self.shape = (extent // self.cell_size).astype(np.intp) + 1
+
+        keys = self._keys(self._cells(points))
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.points = points[order]
+        self.system = np.asarray(system)[order]
+        self.sys_id = np.asarray(sys_id)[order]
+        self.element = np.asarray(element)[order]
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Mapping[str, SystemRecords],
+        field: str = "Position",
+        cell_size: Optional[float] = None,
+    ) -> SpatialIndex:
+        """Index the positions of records of systems, read in bulk.
+
+        Args:
+            records (Mapping[str, SystemRecords]): Records by system type, e.g.
+                a snapshot.
+            field (str): Field of the positions of the systems, of shape
+                ``(3, n)`` per system.
+            cell_size (float, Optional): Edge length of the cells of the grid.
+
+        Returns:
+            Spatial index over the positions of all records.
+        """
+        systems = tuple(k for k, v in records.items() if len(v))
+        if not systems:
+            empty = np.empty(0, dtype=np.intp)
+            return cls(np.empty((0, 3)), systems, empty, empty, empty, cell_size)
+        parts = [_points(records[k].to_arrays([field])[field]) for k in systems]
+        codes = [np.full(len(p[1]), i, dtype=np.intp) for i, p in enumerate(parts)]
+        return cls(
+            np.concatenate([p[0] for p in parts]),
+            systems,
+            np.concatenate(codes),
+            np.concatenate([p[1] for p in parts]),
+            np.concatenate([p[2] for p in parts]),
+            cell_size,
+        )
+
+    def _cells(self, points: npt.NDArray[Any]) -> npt.NDArray[np.intp]:
+        """Cells of the grid of points, clipped to the grid."""
+        cells = np.floor((points - self.lo) / self.cell_size).astype(np.intp)
+        return np.clip(cells, 0, self.shape - 1)
+
+    def _keys(self, cells: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
+        """Linear keys of cells of the grid."""
+        keys: npt.NDArray[np.intp] = np.ravel_multi_index(
+            tuple(np.moveaxis(cells, -1, 0)), tuple(self.shape)
+        )
+        return keys
+
+    def _candidates(
+        self, lo: npt.NDArray[np.float64], hi: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.intp]:
+        """Positions of the points in the cells overlapping a box.
+
+        Args:
+            lo (ndarray): Lower corner of the box.
+            hi (ndarray): Upper corner of the box.
+
+        Returns:
+            Positions into the sorted points, a superset of the points in the box.
+        """
+        if len(self.points) == 0 or np.any(hi < lo):
+            return np.empty(0, dtype=np.intp)
+        first, last = self._cells(lo), self._cells(hi)
+        n_cells = np.prod(last - first + 1)
+        if n_cells >= len(self.points):
+            # Scanning all points is cheaper than looking up every cell.
+            return np.arange(len(self.points))
+        axes = [np.arange(a, b + 1) for a, b in np.stack([first, last], 1)]
+        cells = np.stack(np.meshgrid(*axes, indexing="ij"), -1).reshape(-1, 3)
+        keys = self._keys(cells)
+        starts = np.searchsorted(self.keys, keys, side="left")
+        lengths = np.searchsorted(self.keys, keys, side="right") - starts
+        # Concatenation of the ranges of points of every cell.
+        skips = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        found: npt.NDArray[np.intp] = np.arange(lengths.sum()) + skips
+        return found
+
+    def _hits(
+        self,
+        found: npt.NDArray[np.intp],
+        distance: Optional[npt.NDArray[np.float64]] = None,
+    ) -> Hits:
+        """Hits of points of the index."""
+        return Hits(
+            self.systems,
+            self.system[found],
+            self.sys_id[found],
+            self.element[found],
+            distance,
+        )
+
+    def box(self, lo: Point, hi: Point) -> Hits:
+        """Find the points inside an axis-aligned box.
+
+        Args:
+            lo (Point): Lower corner of the box.
+            hi (Point): Upper corner of the box, inclusive.
+
+        Returns:
+            Points with ``lo <= point <= hi``, in order of cells.
+        """
+        lower, upper = np.asarray(lo, dtype=float), np.asarray(hi, dtype=float)
+        found = self._candidates(lower, upper)
+        points = self.points[found]
+        inside = np.all((points >= lower) & (points <= upper), axis=-1)
+        return self._hits(found[inside])
+
+    def radius(self, center: Point, r: float) -> Hits:
+        """Find the points within a distance of a point.
+
+        Args:
+            center (Point): Center of the query.
+            r (float): Distance from ``center``, inclusive.
+
+        Returns:
+            Points within ``r`` of ``center``, by increasing distance.
+        """
+        c = np.asarray(center, dtype=float)
+        found = self._candidates(c - r, c + r)
+        distance = np.linalg.norm(self.points[found] - c, axis=-1)
+        order = np.argsort(distance, kind="stable")
+        order = order[distance[order] <= r]
+        return self._hits(found[order], distance[order])
+
+    def knn(self, center: Point, k: int) -> Hits:
+        """Find the nearest points to a point.
+
+        The query radius is doubled from the size of a cell until ``k`` points are
+        found within it.
+
+        Args:
+            center (Point): Center of the query.
+            k (int): Number of points to find.
+
+        Returns:
+            At most ``k`` nearest points to ``center``, by increasing distance.
+        """
+        k = min(k, len(self.points))
+        r = self.cell_size
+        hits = self.radius(center, r)
+        while len(hits) < k:
+            r *= 2.0
+            hits = self.radius(center, r)
+        return Hits(
+            hits.systems,
+            hits.system[:k],
+            hits.sys_id[:k],
+            hits.element[:k],
+            None if hits.distance is None else hits.distance[:k],
+        )
+
+    def select(self, system_name: str, lo: Point, hi: Point) -> SystemIndices:
+        """Select the systems of a system type with points inside a box.
+
+        Args:
+            system_name (str): Name of the system type, e.g. ``"CosseratRod"``.
+            lo (Point): Lower corner of the box.
+            hi (Point): Upper corner of the box, inclusive.
+
+        Returns:
+            Indices of the systems, e.g. for ``Series.temporal_select``.
+
+        Raises:
+            KeyError: If the system type is not registered.
+        """
+        system_type = registry.lookup(system_name)
+        if system_type is None:
+            raise KeyError(f"System type {system_name} is not registered.")
+        return system_type.index_type()(self.box(lo, hi).sys_ids(system_name))
+
+    def __len__(self) -> int:  # noqa
+        return len(self.points)
@@ -1,4 +1,7 @@
-"""Specialization for Elastica++ types."""
+"""Specialization for Elastica++ types.
+
+Each system type is registered with the schema of its fields, see ``registry``.
+"""
 
 from dataclasses import dataclass
 from typing import ClassVar
@@ -9,9 +12,74 @@ from elastica_pipelines.io.core import SystemRecords
 from elastica_pipelines.io.core import SystemRecordsSlice
 from elastica_pipelines.io.protocols import RecordTraits
 from elastica_pipelines.io.protocols import SystemIndices
+from elastica_pipelines.io.registry import ELEMENTS
+from elastica_pipelines.io.registry import NODES
+from elastica_pipelines.io.registry import VORONOI
+from elastica_pipelines.io.registry import FieldSchema
+from elastica_pipelines.io.registry import SystemType
+from elastica_pipelines.io.registry import register
 from elastica_pipelines.io.typing import Indices
 
 
+# Fields of Cosserat rods, on nodes, elements and voronoi regions.
+_COSSERAT_ROD_FIELDS = {
+    "Position": FieldSchema((3, NODES)),
+    "Velocity": FieldSchema((3, NODES)),
+    "Acceleration": FieldSchema((3, NODES)),
+    "ExternalLoads": FieldSchema((3, NODES)),
+    "InternalLoads": FieldSchema((3, NODES)),
+    "Mass": FieldSchema((NODES,), static=True),
+    "Director": FieldSchema((3, 3, ELEMENTS)),
+    "AngularVelocity": FieldSchema((3, ELEMENTS)),
+    "AngularAcceleration": FieldSchema((3, ELEMENTS)),
+    "ExternalTorques": FieldSchema((3, ELEMENTS)),
+    "InternalTorques": FieldSchema((3, ELEMENTS)),
+    "InternalStress": FieldSchema((3, ELEMENTS)),
+    "ShearStretchStrain": FieldSchema((3, ELEMENTS)),
+    "Tangent": FieldSchema((3, ELEMENTS)),
+    "ElementDilatation": FieldSchema((ELEMENTS,)),
+    "ElementDimension": FieldSchema((ELEMENTS,)),
+    "ElementLength": FieldSchema((ELEMENTS,)),
+    "ElementVolume": FieldSchema((ELEMENTS,), static=True),
+    "MassSecondMomentOfInertia": FieldSchema((3, 3, ELEMENTS), static=True),
+    "InvMassSecondMomentOfInertia": FieldSchema((3, 3, ELEMENTS), static=True),
+    "ShearStretchRigidityMatrix": FieldSchema((3, 3, ELEMENTS), static=True),
+    "ReferenceElementLength": FieldSchema((ELEMENTS,), static=True),
+    "ReferenceShearStretchStrain": FieldSchema((3, ELEMENTS), static=True),
+    "Material": FieldSchema((ELEMENTS,), dtype="uint64", static=True),
+    "Curvature": FieldSchema((3, VORONOI)),
+    "InternalCouple": FieldSchema((3, VORONOI)),
+    "VoronoiDilatation": FieldSchema((VORONOI,)),
+    "VoronoiLength": FieldSchema((VORONOI,)),
+    "BendingTwistRigidityMatrix": FieldSchema((3, 3, VORONOI), static=True),
+    "ReferenceCurvature": FieldSchema((3, VORONOI), static=True),
+    "ReferenceVoronoiLength": FieldSchema((VORONOI,), static=True),
+    "NElement": FieldSchema((1,), dtype="uint64", static=True),
+}
+
+_DAMPING_FIELDS = {
+    "ForceDampingRate": FieldSchema((NODES,), static=True),
+    "TorqueDampingRate": FieldSchema((ELEMENTS,), static=True),
+}
+
+# Fields of spheres, as single-element systems.
+_SPHERE_FIELDS = {
+    "Position": FieldSchema((3, 1)),
+    "Velocity": FieldSchema((3, 1)),
+    "Acceleration": FieldSchema((3, 1)),
+    "ExternalLoads": FieldSchema((3, 1)),
+    "Director": FieldSchema((3, 3, 1)),
+    "AngularVelocity": FieldSchema((3, 1)),
+    "AngularAcceleration": FieldSchema((3, 1)),
+    "ExternalTorques": FieldSchema((3, 1)),
+    "InvMassSecondMomentOfInertia": FieldSchema((3, 3, 1), static=True),
+    "Mass": FieldSchema((1,), static=True),
+    "Radius": FieldSchema((1,), static=True),
+    "Material": FieldSchema((1,), dtype="uint64", static=True),
+    "NElement": FieldSchema((1,), dtype="uint64", static=True),
+}
+
+
 # Defines cosserat-rod records
 class CosseratRodRecord(SystemRecord):
     """CosseratRod record type."""
@@ -72,6 +140,13 @@ CosseratRodRecord.traits = CosseratRodRecordTraits
 CosseratRodRecords.traits = CosseratRodRecordTraits
 CosseratRodRecordsSlice.traits = CosseratRodRecordTraits
 CosseratRodRecordIndex.traits = CosseratRodRecordTraits
+COSSERAT_ROD = register(
+    SystemType(
+        "CosseratRod",
+        {**_COSSERAT_ROD_FIELDS, **_DAMPING_FIELDS},
+        CosseratRodRecordTraits,
+    )
+)
 
 
 # Defines cosserat-rod records
@@ -134,6 +209,13 @@ CosseratRodWithoutDampingRecord.traits = CosseratRodWithoutDampingRecordTraits
 CosseratRodWithoutDampingRecords.traits = CosseratRodWithoutDampingRecordTraits
 CosseratRodWithoutDampingRecordsSlice.traits = CosseratRodWithoutDampingRecordTraits
 CosseratRodWithoutDampingRecordIndex.traits = CosseratRodWithoutDampingRecordTraits
+COSSERAT_ROD_WITHOUT_DAMPING = register(
+    SystemType(
+        "CosseratRodWithoutDamping",
+        _COSSERAT_ROD_FIELDS,
+        CosseratRodWithoutDampingRecordTraits,
+    )
+)
 
 
 # Defines sphere records
@@ -196,3 +278,4 @@ SphereRecord.traits = SphereRecordTraits
 SphereRecords.traits = SphereRecordTraits
 SphereRecordsSlice.traits = SphereRecordTraits
 SphereRecordIndex.traits = SphereRecordTraits
+SPHERE = register(SystemType("Sphere", _SPHERE_FIELDS, SphereRecordTraits))
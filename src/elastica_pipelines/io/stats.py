@@ -0,0 +1,201 @@
+"""Instrumentation of IO performed by Elastica IO.
+
+Counters are collected by the layers issuing IO: files opened by file pools,
+temporal information read while scanning series keys, and datasets opened, read
+and transformed by system records. Counters are recorded into the ``Recorder`` of
+the series the IO is performed for, if made with ``stats=True`` (see
+``Series.stats``), and into every recorder made active by ``record``. IO is not
+timed when no recorder is involved.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import fields
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+
+@dataclass(frozen=True, eq=True)
+class IOStats:
+    """Statistics of IO.
+
+    Args:
+        files_opened: Number of files opened.
+        keys_read: Number of series keys read, with their temporal information.
+        datasets_opened: Number of datasets looked up in system records.
+        reads: Number of reads of datasets issued.
+        bytes_read: Number of bytes read from datasets.
+        cache_hits: Number of dataset reads served from the cache.
+        cache_misses: Number of dataset reads not served from the cache.
+        read_time: Time in seconds spent in backend lookups and reads.
+        transform_time: Time in seconds spent in transforms.
+
+    .. note::
+            Datasets returned lazily by records without transforms are read by the
+            caller, outside of Elastica IO, and so are only counted as opened.
+            Reads issued by transforms (e.g. ``transforms.ToArray``) are counted
+            in ``transform_time``.
+    """
+
+    files_opened: int = 0
+    keys_read: int = 0
+    datasets_opened: int = 0
+    reads: int = 0
+    bytes_read: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    read_time: float = 0.0
+    transform_time: float = 0.0
+
+    def __add__(self, other: IOStats) -> IOStats:  # noqa
+        return IOStats(
+            **{
+                f.name: getattr(self, f.name) + getattr(other, f.name)
+                for f in fields(self)
+            }
+        )
+
+    def __sub__(self, other: IOStats) -> IOStats:  # noqa
+        return IOStats(
+            **{
+                f.name: getattr(self, f.name) - getattr(other, f.name)
+                for f in fields(self)
+            }
+        )
+
+
+class Recorder:
+    """Thread-safe counters of IO.
+
+    Example:
+        >>> from elastica_pipelines.io.stats import Recorder
+        >>>
+        >>> recorder = Recorder()
+        >>> recorder.add(reads=1, bytes_read=264)
+        >>> recorder.stats().bytes_read # 264
+    """
+
+    def __init__(self) -> None:
+        """Initializer."""
+        self.counts: Dict[str, float] = {}
+        # Recorders are shared across prefetching threads.
+        self.lock = threading.Lock()
+
+    def add(self, **counts: float) -> None:
+        """Add to counters.
+
+        Args:
+            counts : Increments of counters, named after fields of ``IOStats``.
+        """
+        with self.lock:
+            for k, v in counts.items():
+                self.counts[k] = self.counts.get(k, 0) + v
+
+    def stats(self) -> IOStats:
+        """Obtain statistics from the counters.
+
+        Returns:
+            Statistics recorded so far.
+        """
+        with self.lock:
+            return IOStats(**self.counts)  # type: ignore[arg-type]
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self.lock:
+            self.counts.clear()
+
+
+# Recorders made active by ``record``, shared across threads.
+_active: List[Recorder] = []
+_active_lock = threading.Lock()
+
+
+def enabled(recorder: Optional[Recorder]) -> bool:
+    """Check if counts for ``recorder`` are recorded at all.
+
+    Args:
+        recorder (Recorder, Optional): Recorder of the series the IO is for.
+
+    Returns:
+        True if ``recorder`` is provided, or if any recorder is active.
+    """
+    return recorder is not None or bool(_active)
+
+
+def count(recorder: Optional[Recorder], **counts: float) -> None:
+    """Record counts into ``recorder`` and all active recorders.
+
+    Args:
+        recorder (Recorder, Optional): Recorder of the series the IO is for.
+        counts : Increments of counters, named after fields of ``IOStats``.
+    """
+    if recorder is not None:
+        recorder.add(**counts)
+    # Active recorders are replaced rather than mutated, so no lock is needed.
+    for r in _active:
+        r.add(**counts)
+
+
+@contextmanager
+def timed(
+    recorder: Optional[Recorder], counter: str, **counts: float
+) -> Iterator[Dict[str, float]]:
+    """Record the duration of a block along with counts, on exit.
+
+    Args:
+        recorder (Recorder, Optional): Recorder of the series the IO is for.
+        counter (str): Counter of the duration, e.g. ``"read_time"``.
+        counts : Increments of other counters.
+
+    Yields:
+        Increments of counters, to which the block can add counts known only once
+        it is done, e.g. ``"bytes_read"``.
+    """
+    if not enabled(recorder):
+        yield counts
+        return
+    start = time.perf_counter()
+    try:
+        yield counts
+    finally:
+        count(recorder, **counts, **{counter: time.perf_counter() - start})
+
+
+@contextmanager
+def record() -> Iterator[Recorder]:
+    """Record IO performed by Elastica IO within a block, across all series.
+
+    IO performed by other threads (e.g. prefetching threads) during the block is
+    recorded too.
+
+    Yields:
+        Recorder of the block, whose ``stats`` remain available after the block.
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>> from elastica_pipelines.io.stats import record
+        >>> from elastica_pipelines.io.transforms import ToArray
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> s = series(metadata=metadata_filename, transforms=ToArray())
+        >>> with record() as recorder:
+        >>>     for t, snapshot in s.iterations():
+        >>>         snapshot.cosserat_rods()[0]["Position"]
+        >>> stats = recorder.stats()
+        >>> print(stats.read_time, stats.transform_time)
+    """
+    global _active
+    recorder = Recorder()
+    with _active_lock:
+        _active = [*_active, recorder]
+    try:
+        yield recorder
+    finally:
+        with _active_lock:
+            _active = [r for r in _active if r is not recorder]
@@ -0,0 +1,213 @@
+"""Caching of the structure of series read by Elastica IO.
+
+The structure of a series (system types, system ids per type, fields of systems,
+and shapes and data types of fields) is usually the same at every iteration.
+Structural queries, e.g. ``len(records)`` or ``rod.keys()``, are then answered
+from memory once discovered, instead of walking the hierarchy of every snapshot.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Tuple
+from typing import TypeVar
+
+import numpy as np
+
+
+Path = Tuple[Hashable, ...]
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, eq=True)
+class FieldInfo:
+    """Shape and data type of a field of a system.
+
+    Args:
+        shape: Shape of the field.
+        dtype: Data type of the field.
+    """
+
+    shape: Tuple[int, ...]
+    dtype: np.dtype[Any]
+
+    @classmethod
+    def of(cls, data: Any) -> FieldInfo:
+        """Describe data, e.g. an HDF5 dataset, without reading it.
+
+        Args:
+            data (Any): Data to describe.
+
+        Returns:
+            Shape and data type of ``data``.
+        """
+        dtype = getattr(data, "dtype", None)
+        return cls(
+            tuple(np.shape(data)),
+            np.asarray(data).dtype if dtype is None else np.dtype(dtype),
+        )
+
+
+class StructureCache:
+    """Structure of the systems of a series, discovered once per series.
+
+    Keys of nodes (system types of snapshots, system ids of records, and fields of
+    systems) and descriptions of fields are discovered from the first iteration
+    they are queried at, and are reused at every other iteration.
+
+    Args:
+        validate (bool): Check the structure discovered at every iteration against
+            the cached structure, once per iteration. Structural queries still walk
+            the hierarchy of every snapshot once, but changes are detected.
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> s = series(metadata=metadata_filename, cache_structure=True)
+        >>> for t, snapshot in s.iterations():
+        >>>     len(snapshot.cosserat_rods()) # discovered at the first iteration
+    """
+
+    def __init__(self, validate: bool = False) -> None:
+        """Initializer."""
+        self.validate = validate
+        self.keys: Dict[Path, Tuple[str, ...]] = {}
+        self.fields: Dict[Path, FieldInfo] = {}
+        # Last iterate every path was checked at, when validating.
+        self.checked: Dict[Path, int] = {}
+        # Structures are shared across prefetching threads.
+        self.lock = threading.Lock()
+
+    def lookup(
+        self,
+        table: Dict[Path, T],
+        iterate: int,
+        path: Path,
+        discover: Callable[[], T],
+    ) -> T:
+        """Lookup a table of the structure, discovering the entry if needed.
+
+        Only the last iterate every entry was checked at is kept, so entries are
+        checked again when iterations are revisited out of order.
+
+        Args:
+            table (Dict[Path, T]): Table of keys or descriptions of fields.
+            iterate (int): Iterate the entry is looked up at.
+            path (Path): Path of the entry, e.g. ``("CosseratRod", 0)``.
+            discover (Callable): Discovers the entry, from the series.
+
+        Returns:
+            Cached entry.
+
+        Raises:
+            ValueError: If validating, and the entry discovered at ``iterate``
+                differs from the cached entry.
+        """
+        with self.lock:
+            cached = table.get(path)
+            check = self.validate and self.checked.get(path) != iterate
+        if cached is not None and not check:
+            return cached
+
+        discovered = discover()
+        with self.lock:
+            cached = table.setdefault(path, discovered)
+            if self.validate:
+                self.checked[path] = iterate
+        if cached != discovered:
+            raise ValueError(
+                f"Structure of the series changed at iteration {iterate}, at "
+                f"{'/'.join(map(str, path)) or 'the root'}: found {discovered}, "
+                f"expected {cached}."
+            )
+        return cached
+
+    def clear(self) -> None:
+        """Forget the structure discovered so far."""
+        with self.lock:
+            self.keys.clear()
+            self.fields.clear()
+            self.checked.clear()
+
+    def view(self, iterate: int) -> StructureView:
+        """Obtain a view of the structure at an iteration.
+
+        Args:
+            iterate (int): Iterate of the view.
+
+        Returns:
+            View of the structure.
+        """
+        return StructureView(self, iterate, ())
+
+
+class StructureView:
+    """View of the structure of a series, at an iteration and below a path.
+
+    Views are passed down from series to system records, and accumulate the system
+    type and system id into the path along the way.
+
+    Args:
+        structure (StructureCache): Structure being viewed.
+        iterate (int): Iterate of the view.
+        path (Path): Path of the view.
+    """
+
+    def __init__(self, structure: StructureCache, iterate: int, path: Path) -> None:
+        """Initializer."""
+        self.structure = structure
+        self.iterate = iterate
+        self.path = path
+
+    def keys(
+        self, node: Callable[[], Iterable[str]], *path: Hashable
+    ) -> Tuple[str, ...]:
+        """Obtain keys of a node, discovering them if needed.
+
+        Args:
+            node (Callable): Looks up the node, which is only done on discovery.
+            path : Path of the node, within the view.
+
+        Returns:
+            Keys of the node, in iteration order.
+        """
+        return self.structure.lookup(
+            self.structure.keys,
+            self.iterate,
+            (*self.path, *path),
+            lambda: tuple(node()),
+        )
+
+    def describe(self, data: Callable[[], Any], *path: Hashable) -> FieldInfo:
+        """Obtain the shape and data type of a field, discovering them if needed.
+
+        Args:
+            data (Callable): Looks up the field, which is only done on discovery.
+            path : Path of the field, within the view.
+
+        Returns:
+            Shape and data type of the field.
+        """
+        return self.structure.lookup(
+            self.structure.fields,
+            self.iterate,
+            (*self.path, *path),
+            lambda: FieldInfo.of(data()),
+        )
+
+    def view(self, *path: Hashable) -> StructureView:
+        """Obtain a view of the structure, below ``path``.
+
+        Args:
+            path : Additional path of the view.
+
+        Returns:
+            View of the structure.
+        """
+        return StructureView(self.structure, self.iterate, (*self.path, *path))
@@ -1,38 +1,77 @@
 """Temporal IO types."""
 from __future__ import annotations
 
+import asyncio
+import bisect
+import pathlib
+import threading
+import time
+import weakref
 from collections.abc import Iterator
+from concurrent.futures import Executor
 from dataclasses import dataclass
+from functools import cached_property
+from functools import partial
 from typing import Any
+from typing import AsyncIterator
+from typing import Callable
 from typing import ChainMap
 from typing import Dict
 from typing import ItemsView
+from typing import Iterable
+from typing import List
 from typing import Mapping
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
+from typing import TypeVar
 from typing import Union
+from typing import cast
+from typing import overload
 
+import numpy as np
+import numpy.typing as npt
 from typing_extensions import Protocol
 from typing_extensions import TypeAlias
 
+from elastica_pipelines.io import parallel
+from elastica_pipelines.io import registry
+from elastica_pipelines.io import stats
+from elastica_pipelines.io.arrays import apply
 from elastica_pipelines.io.backends import accessor
+from elastica_pipelines.io.cache import CacheView
+from elastica_pipelines.io.cache import DatasetCache
 from elastica_pipelines.io.core import RecordsIndexedOp
 from elastica_pipelines.io.core import RecordsSliceOp
 from elastica_pipelines.io.core import SystemRecords
+from elastica_pipelines.io.core import _expand
 from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.protocols import StackableNode
 from elastica_pipelines.io.protocols import SystemIndices
 from elastica_pipelines.io.protocols import name
+from elastica_pipelines.io.spatial import SpatialIndex
 from elastica_pipelines.io.specialize import CosseratRodRecords
 from elastica_pipelines.io.specialize import CosseratRodRecordTraits
 from elastica_pipelines.io.specialize import CosseratRodWithoutDampingRecords
 from elastica_pipelines.io.specialize import CosseratRodWithoutDampingRecordTraits
 from elastica_pipelines.io.specialize import SphereRecords
 from elastica_pipelines.io.specialize import SphereRecordTraits
+from elastica_pipelines.io.stats import IOStats
+from elastica_pipelines.io.stats import Recorder
+from elastica_pipelines.io.structure import StructureCache
+from elastica_pipelines.io.structure import StructureView
+from elastica_pipelines.io.transforms import supports_batch
 from elastica_pipelines.io.typing import FuncType
+from elastica_pipelines.io.typing import Indices
 from elastica_pipelines.io.typing import Node
+from elastica_pipelines.io.typing import Record
 from elastica_pipelines.io.typing import RecordLeafs
 
 
+R = TypeVar("R")
+T = TypeVar("T")
+
 """Implementation of snapshot-specific functionality."""
 
 
@@ -194,6 +233,10 @@ class Snapshot(
         transforms (Callable, Optional): A function/transform that takes in an array
             data-structure and returns a transformed version.
             E.g, ``transforms.ToArray``
+        cache (CacheView, Optional): Cache of raw arrays read from the snapshot.
+        recorder (Recorder, Optional): Recorder of IO of the snapshot.
+        structure (StructureView, Optional): Cached structure of the series, at the
+            iteration of the snapshot.
 
     Example:
         >>> from elastica_pipelines.io import series
@@ -210,25 +253,42 @@ class Snapshot(
         >>>     print(system_type, snap[system_type])
     """
 
-    def __init__(self, node: Node, transforms: Optional[FuncType] = None) -> None:
+    def __init__(
+        self,
+        node: Node,
+        transforms: Optional[FuncType] = None,
+        cache: Optional[CacheView] = None,
+        recorder: Optional[Recorder] = None,
+        structure: Optional[StructureView] = None,
+    ) -> None:
         """Initializer."""
         self.node = node
         self.transforms = transforms
-        # mypy complains about HasRecordTraits not being met.
-        self.return_lut: Dict[str, Type[SystemRecords]]
-        self.return_lut = {
-            name(x): x for x in SystemRecords.__subclasses__()  # type: ignore[arg-type]
-        }
+        self.cache = cache
+        self.recorder = recorder
+        self.structure = structure
+        # Shared with the registry, rather than rebuilt per snapshot.
+        self.return_lut: Mapping[str, Type[SystemRecords]] = registry.records_types()
 
     def __getitem__(self, k: str) -> SystemRecords:  # noqa
         return_type = self.return_lut[k]
-        return return_type(self.node[k], self.transforms)
+        return return_type(
+            self.node[k],
+            self.transforms,
+            None if self.cache is None else self.cache.view(k),
+            self.recorder,
+            None if self.structure is None else self.structure.view(k),
+        )
 
     def __iter__(self) -> Iterator[str]:  # noqa
-        return iter(self.node)
+        if self.structure is None:
+            return iter(self.node)
+        return iter(self.structure.keys(lambda: self.node))
 
     def __len__(self) -> int:  # noqa
-        return len(self.node)
+        if self.structure is None:
+            return len(self.node)
+        return len(self.structure.keys(lambda: self.node))
 
     def systems(self) -> ChainMap[RecordsAdapterKey, RecordLeafs]:
         """Access all system records.
@@ -252,6 +312,36 @@ class Snapshot(
         # map() does not play well with inference.
         return ChainMap(*map(RecordsAdapter, self.values()))  # type: ignore[arg-type]
 
+    def spatial_index(
+        self,
+        systems: Optional[Sequence[str]] = None,
+        cell_size: Optional[float] = None,
+    ) -> SpatialIndex:
+        """Index the positions of the systems of the snapshot, in a uniform grid.
+
+        Positions of all systems of a type are read in one call, e.g. nodes of all
+        rods and centers of all spheres.
+
+        Args:
+            systems (Sequence[str], Optional): System types to index, all if not
+                provided.
+            cell_size (float, Optional): Edge length of the cells of the grid,
+                chosen from the number and extent of positions if not provided.
+
+        Returns:
+            Spatial index, answering box, radius and nearest neighbour queries.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> index = series(metadata=metadata_filename)[50].spatial_index()
+            >>> hits = index.radius([0.0, 0.1, 0.0], r=0.05)
+            >>> hits.sys_ids("CosseratRod") # rods near the point
+        """
+        records = self if systems is None else {k: self[k] for k in systems}
+        return SpatialIndex.from_records(records, cell_size=cell_size)
+
 
 """Implementation of series functionality."""
 
@@ -277,27 +367,258 @@ class SeriesIterator:
 
     Args:
         node (Node): Node with series information.
+        recorder (Recorder, Optional): Recorder of temporal information read.
     """
 
-    def __init__(self, node: Node) -> None:
+    def __init__(self, node: Node, recorder: Optional[Recorder] = None) -> None:
         """Initializer."""
         self.node = node
         self.it = iter(self.node)
+        self.recorder = recorder
 
     def __iter__(self) -> SeriesIterator:  # noqa
         return self
 
     def __next__(self) -> SeriesKey:  # noqa
-        n = int(next(self.it))
-        record_node = self.node[ElasticaConvention.as_record_key(n)]
+        return _series_key(self.node, int(next(self.it)), self.recorder)
+
+
+def _series_key(node: Node, n: int, recorder: Optional[Recorder] = None) -> SeriesKey:
+    """Lookup the key of an iterate of a series.
+
+    Args:
+        node (Node): Node with series information.
+        n (int): Iterate to lookup.
+        recorder (Recorder, Optional): Recorder of temporal information read.
+
+    Returns:
+        Key of the iterate, with its temporal information.
+    """
+    # Time and dt are read as two scalars, per Elastica++ convention.
+    with stats.timed(recorder, "read_time", keys_read=1, reads=2) as counts:
+        record_node = node[ElasticaConvention.as_record_key(n)]
         backend = accessor(record_node)
+        t, dt = backend.access_time(record_node), backend.access_dt(record_node)
+        if stats.enabled(recorder):
+            counts["bytes_read"] = np.asarray(t).nbytes + np.asarray(dt).nbytes
+    return SeriesKey(n, t, dt)
+
+
+def _asarray(value: Any, recorder: Optional[Recorder] = None) -> npt.NDArray[Any]:
+    """Read a value of a record, which may be a lazily read dataset, into an array.
+
+    Args:
+        value (Any): Value of a record.
+        recorder (Recorder, Optional): Recorder of the read.
+
+    Returns:
+        Array of the value.
+    """
+    if isinstance(value, np.ndarray):
+        return value
+    with stats.timed(recorder, "read_time", reads=1) as counts:
+        data = np.asarray(value)
+        counts["bytes_read"] = data.nbytes
+    return data
+
+
+def _count(indices: Indices) -> int:
+    """Number of systems selected by indices, without any systems to index into.
+
+    Args:
+        indices (Indices): Indices of systems.
+
+    Returns:
+        Number of systems selected, none for slices.
+    """
+    if isinstance(indices, int):
+        return 1
+    return 0 if isinstance(indices, slice) else len(indices)
+
+
+@dataclass(frozen=True, eq=False)
+class SeriesIndex:
+    """Temporal index of a series, with keys stored as arrays sorted by iterate.
+
+    Args:
+        iterates: Unique iteration values
+        times: Time for each iteration
+        dts: Timestep for each iteration
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> index = series(metadata=metadata_filename).index()
+        >>> print(index.iterates, index.times, index.dts)
+    """
+
+    iterates: npt.NDArray[np.int64]
+    times: npt.NDArray[np.float64]
+    dts: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[SeriesKey]) -> SeriesIndex:
+        """Build an index from series keys.
+
+        Args:
+            keys (Iterable[SeriesKey]): Keys of the series, in any order.
+
+        Returns:
+            Index sorted by iterate.
+        """
+        ks = list(keys)
+        iterates = np.array([k.iterate for k in ks], dtype=np.int64)
+        order = np.argsort(iterates, kind="stable")
+        return cls(
+            iterates[order],
+            np.array([k.time for k in ks], dtype=np.float64)[order],
+            np.array([k.dt for k in ks], dtype=np.float64)[order],
+        )
+
+    @cached_property
+    def increasing(self) -> bool:
+        """Whether times do not decrease with iterates, for binary searches."""
+        return bool(np.all(np.diff(self.times) >= 0))
+
+    def _check_times(self) -> None:
+        """Check that times can be binary searched.
+
+        Raises:
+            ValueError: If times decrease with iterates, or are not numbers.
+        """
+        if not self.increasing:
+            raise ValueError(
+                "Cannot lookup times of the series, they are unknown or decrease "
+                "with iterates."
+            )
+
+    def locate(self, time: float, method: str = "nearest") -> int:
+        """Locate the position of a time in the index, by binary search.
+
+        Args:
+            time (float): Physical time to locate.
+            method (str): ``"nearest"`` for the closest time in the index, or
+                ``"before"`` for the latest time not after ``time``.
+
+        Returns:
+            Position into the index.
+
+        Raises:
+            KeyError: If there is no time in the index satisfying ``method``.
+            ValueError: If ``method`` is not supported.
+        """
+        self._check_times()
+        if not len(self):
+            raise KeyError(f"{time}")
+        if method == "before":
+            position = int(np.searchsorted(self.times, time, side="right")) - 1
+            if position < 0:
+                raise KeyError(f"{time}")
+            return position
+        elif method == "nearest":
+            position = int(np.searchsorted(self.times, time))
+            if position == len(self):
+                return position - 1
+            if position > 0 and (
+                time - self.times[position - 1] <= self.times[position] - time
+            ):
+                return position - 1
+            return position
+        else:
+            raise ValueError(f"Unsupported method {method}.")
+
+    def window(self, start: float, stop: float) -> SeriesIndex:
+        """Restrict the index to a time window, by binary search.
+
+        Args:
+            start (float): Start time of the window.
+            stop (float): Stop time of the window, inclusive.
+
+        Returns:
+            Index with times satisfying ``start <= time <= stop``.
+        """
+        self._check_times()
+        lo = int(np.searchsorted(self.times, start, side="left"))
+        hi = int(np.searchsorted(self.times, stop, side="right"))
+        return self.take(np.arange(lo, max(lo, hi)))
+
+    def take(self, positions: npt.NDArray[np.intp]) -> SeriesIndex:
+        """Restrict the index to a subset of positions.
+
+        Args:
+            positions (ndarray): Sorted positions into the index.
+
+        Returns:
+            Restricted index.
+        """
+        return SeriesIndex(
+            self.iterates[positions], self.times[positions], self.dts[positions]
+        )
+
+    def __contains__(self, iterate: object) -> bool:  # noqa
+        if not isinstance(iterate, (int, np.integer)):
+            return False
+        position = int(np.searchsorted(self.iterates, iterate))
+        return position < len(self) and bool(self.iterates[position] == iterate)
+
+    def __getitem__(self, position: int) -> SeriesKey:  # noqa
         return SeriesKey(
-            n, backend.access_time(record_node), backend.access_dt(record_node)
+            int(self.iterates[position]),
+            float(self.times[position]),
+            float(self.dts[position]),
         )
 
+    def __iter__(self) -> Iterator[SeriesKey]:  # noqa
+        for position in range(len(self)):
+            yield self[position]
+
+    def __len__(self) -> int:  # noqa
+        return len(self.iterates)
+
 
 SeriesKeys: TypeAlias = Union[int, SeriesKey]
 
+#: Selection of iterations of a series: a slice of iterates, with a step in number
+#: of iterations, or a sequence of iterates.
+IterationSlice: TypeAlias = Union[slice, Sequence[SeriesKeys], npt.NDArray[np.integer]]
+
+
+class _InterpolatedNode(Mapping[str, Any]):
+    """Node linearly interpolating between the data of two nodes.
+
+    Args:
+        a (Node): Node at the start of the interval.
+        b (Node): Node at the end of the interval.
+        weight (float): Interpolation weight, in [0, 1], of ``b``.
+
+    .. note::
+            Data that cannot be interpolated, such as integer data or data with
+            different shapes, is taken from the nearest node instead.
+    """
+
+    def __init__(self, a: Node, b: Node, weight: float) -> None:
+        """Initializer."""
+        self.a = a
+        self.b = b
+        self.weight = weight
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        a, b = self.a[k], self.b[k]
+        if isinstance(a, Mapping):
+            return _InterpolatedNode(a, b, self.weight)
+
+        x, y = np.asarray(a), np.asarray(b)
+        if np.issubdtype(x.dtype, np.inexact) and x.shape == y.shape:
+            return x + self.weight * (y - x)
+        return x if self.weight < 0.5 else y
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        return iter(self.a)
+
+    def __len__(self) -> int:  # noqa
+        return len(self.a)
+
 
 class Series(Mapping[SeriesKeys, Snapshot]):
     """Temporally evolving data-series.
@@ -309,6 +630,17 @@ class Series(Mapping[SeriesKeys, Snapshot]):
         transforms (Callable, Optional): A function/transform that takes in an array
             data-structure and returns a transformed version.
             E.g, ``transforms.ToArray``
+        index (SeriesIndex, Optional): Prebuilt temporal index of ``node``. If not
+            provided, the index is built on first use and cached.
+        opener (Callable, Optional): Picklable callable reopening the series in
+            another process, needed for mapping over the series with processes.
+        cache (DatasetCache, Optional): Cache of raw arrays read from the series,
+            before ``transforms`` are applied.
+        recorder (Recorder, Optional): Recorder of IO of the series, see ``stats``.
+            IO of the series is not recorded if not provided.
+        structure (StructureCache, Optional): Cache of the structure of the series,
+            answering structural queries (e.g. ``len(records)``) from memory once
+            discovered. Structure is looked up in every snapshot if not provided.
 
     Example:
         >>> from elastica_pipelines.io import series
@@ -320,33 +652,233 @@ class Series(Mapping[SeriesKeys, Snapshot]):
 
         >>> s[50] # lookup the data at iteration 50, iterates may not be continuous!
 
+        >>> # lazy views over iterations, with bounds in iterates and a step in
+        >>> # number of iterations, or over a list of iterates
+        >>> every_tenth = s[1000:5000:10]
+        >>> some = s[[50, 100, 400]]
+
         >>> for t in s.keys(): # obtain all iteration values
         >>>     print(t.iterate, t.time, t.dt)
         >>>     print(s[t])
     """
 
-    def __init__(self, node: Node, transforms: Optional[FuncType] = None) -> None:
+    #: Maximum number of snapshots read at once by ``aget`` calls on the series.
+    async_concurrency: int = 4
+
+    def __init__(
+        self,
+        node: Node,
+        transforms: Optional[FuncType] = None,
+        index: Optional[SeriesIndex] = None,
+        opener: Optional[Callable[[], Series]] = None,
+        cache: Optional[DatasetCache] = None,
+        recorder: Optional[Recorder] = None,
+        structure: Optional[StructureCache] = None,
+    ) -> None:
         """Initializer."""
         self.node = node
         self.transforms = transforms
+        self._index = index
+        self.opener = opener
+        self.cache = cache
+        self.recorder = recorder
+        self.structure = structure
+        # Views are restricted to the iterates in their index.
+        self._restricted = False
+        self._limiter = parallel.Limiter(self.async_concurrency)
+
+    def _view(self, index: SeriesIndex) -> Series:
+        """Lazy view of the series, restricted to the iterates in ``index``.
 
+        Args:
+            index (SeriesIndex): Index of iterates in the view.
+
+        Returns:
+            Series restricted to ``index``.
+        """
+        s = Series(
+            self.node,
+            self.transforms,
+            index,
+            self.opener,
+            self.cache,
+            self.recorder,
+            self.structure,
+        )
+        s._restricted = True
+        s._limiter = self._limiter
+        return s
+
+    def _raw(self) -> Series:
+        """View of the series without transforms, for reads of raw data in bulk.
+
+        Returns:
+            Series sharing the index, cache and statistics of this series.
+        """
+        s = Series(
+            self.node,
+            None,
+            self._index,
+            self.opener,
+            self.cache,
+            self.recorder,
+            self.structure,
+        )
+        s._restricted = self._restricted
+        s._limiter = self._limiter
+        return s
+
+    @overload
     def __getitem__(self, k: SeriesKeys) -> Snapshot:  # noqa
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, k: IterationSlice) -> Series:  # noqa
+        ...  # pragma: no cover
+
+    def __getitem__(  # noqa
+        self, k: Union[SeriesKeys, IterationSlice]
+    ) -> Union[Snapshot, Series]:
+        if isinstance(k, SeriesKey):
+            return self.__getitem__(k.iterate)
+        if not isinstance(k, (int, np.integer)):
+            return self._select(k)
         # convention
-        if isinstance(k, int):
-            return Snapshot(
-                ElasticaConvention.access(
-                    self.node[ElasticaConvention.as_record_key(k)]
-                ),
-                self.transforms,
+        iterate = int(k)
+        if self._restricted and iterate not in self.index():
+            raise KeyError(f"{iterate}")
+        return Snapshot(
+            ElasticaConvention.access(
+                self.node[ElasticaConvention.as_record_key(iterate)]
+            ),
+            self.transforms,
+            None if self.cache is None else self.cache.view(iterate),
+            self.recorder,
+            None if self.structure is None else self.structure.view(iterate),
+        )
+
+    def _select(self, k: IterationSlice) -> Series:
+        """Lazy view of the series over a slice or sequence of iterates.
+
+        Only the temporal information of the selected iterates is read, unless the
+        index of the series is already built.
+
+        Args:
+            k (IterationSlice): Slice of iterates, whose bounds are iterates (the stop
+                being excluded) and whose step is a number of iterations, or a
+                sequence of iterates (or keys) of the series.
+
+        Returns:
+            Series restricted to the selected iterates, in increasing order.
+
+        Raises:
+            KeyError: If a selected iterate is not in the series.
+            ValueError: If the step of a slice is not positive.
+        """
+        iterates = self._iterates()
+        if isinstance(k, slice):
+            step = 1 if k.step is None else int(k.step)
+            if step < 1:
+                raise ValueError(f"Step of iterations must be positive, got {step}.")
+            lo = 0 if k.start is None else bisect.bisect_left(iterates, k.start)
+            hi = (
+                len(iterates)
+                if k.stop is None
+                else bisect.bisect_left(iterates, k.stop)
             )
+            selected = iterates[lo:hi:step]
         else:
-            return self.__getitem__(k.iterate)
+            requested = {i.iterate if isinstance(i, SeriesKey) else int(i) for i in k}
+            missing = requested.difference(iterates)
+            if missing:
+                raise KeyError(f"{sorted(missing)}")
+            selected = sorted(requested)
+
+        if self._index is not None:
+            positions = np.searchsorted(self._index.iterates, selected)
+            return self._view(self._index.take(positions))
+        return self._view(
+            SeriesIndex.from_keys(
+                _series_key(self.node, i, self.recorder) for i in selected
+            )
+        )
 
-    def __iter__(self) -> SeriesIterator:  # noqa
-        return SeriesIterator(self.node)
+    def __iter__(self) -> Iterator[SeriesKey]:  # noqa
+        if self._index is None:
+            return self._scan()
+        return iter(self._index)
+
+    def _scan(self) -> Iterator[SeriesKey]:
+        """Lazily read the keys of the series, in increasing order of iterates.
+
+        The index is cached once the scan completes, as in ``index``.
+
+        Yields:
+            Key of every iterate, read as it is reached.
+        """
+        node = self.node
+        keys = []
+        for iterate in sorted(int(k) for k in node):
+            key = _series_key(node, iterate, self.recorder)
+            keys.append(key)
+            yield key
+        if self._index is None and self.node is node:
+            self._index = SeriesIndex.from_keys(keys)
 
     def __len__(self) -> int:  # noqa
-        return len(self.node)
+        return len(self.index()) if self._restricted else len(self.node)
+
+    def index(self) -> SeriesIndex:
+        """Obtain the temporal index of the series.
+
+        The index is built by a single scan over the series on first use, and is
+        cached for subsequent calls.
+
+        Returns:
+            Temporal index sorted by iterate.
+        """
+        if self._index is None:
+            self._index = SeriesIndex.from_keys(
+                SeriesIterator(self.node, self.recorder)
+            )
+        return self._index
+
+    def _iterates(self) -> List[int]:
+        """Iterates of the series, without any lookup of temporal information."""
+        if self._index is not None:
+            return [int(i) for i in self._index.iterates]
+        return sorted(int(k) for k in self.node)
+
+    def stats(self) -> IOStats:
+        """Obtain statistics of IO performed for the series.
+
+        Statistics are only recorded for series made with a recorder, e.g. by
+        ``series(..., stats=True)``. They accumulate over the lifetime of the
+        series, and are shared with its views (e.g. from ``time_range``). To record
+        IO of a block of code only, see ``stats.record``.
+
+        Returns:
+            Statistics of IO of the series.
+
+        Raises:
+            RuntimeError: If the series does not record statistics.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>> from elastica_pipelines.io.transforms import ToArray
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename, transforms=ToArray(), stats=True)
+            >>> for t, snapshot in s.iterations():
+            >>>     snapshot.cosserat_rods()[0]["Position"]
+            >>> print(s.stats())
+        """
+        if self.recorder is None:
+            raise RuntimeError(
+                "Statistics are not recorded for this series, make it with "
+                "series(..., stats=True)."
+            )
+        return self.recorder.stats()
 
     def temporal_select(self, indices: SystemIndices) -> SeriesSelection:
         """Obtain temporal evolution for a select subset of systems.
@@ -379,13 +911,567 @@ class Series(Mapping[SeriesKeys, Snapshot]):
         """
         return SeriesSelection(self, indices)
 
-    def iterations(self) -> ItemsView[SeriesKeys, Snapshot]:
+    def temporal_select_region(
+        self,
+        lo: Sequence[float],
+        hi: Sequence[float],
+        system_name: str = "CosseratRod",
+        at: Optional[SeriesKeys] = None,
+    ) -> SeriesSelection:
+        """Obtain temporal evolution of the systems inside a region.
+
+        Systems with any position inside the region at one iteration are selected,
+        through the spatial index of the snapshot at that iteration.
+
+        Args:
+            lo (Sequence[float]): Lower corner of the region.
+            hi (Sequence[float]): Upper corner of the region, inclusive.
+            system_name (str): System type of the systems to select.
+            at (SeriesKeys, Optional): Iteration at which systems are inside the
+                region, the first iteration if not provided.
+
+        Returns:
+            ``SeriesSelection`` of the systems inside the region.
+
+        Raises:
+            KeyError: If the series has no iterations.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename)
+            >>> near = s.temporal_select_region([-0.1, 0.0, -0.1], [0.1, 0.5, 0.1])
+            >>> near.stack("Position")
+        """
+        if at is None:
+            iterates = self._iterates()
+            if not iterates:
+                raise KeyError("Cannot select systems in a series without iterations.")
+            at = iterates[0]
+        index = self[at].spatial_index([system_name])
+        return self.temporal_select(index.select(system_name, lo, hi))
+
+    def iterations(
+        self,
+        prefetch: int = 0,
+        workers: int = 1,
+        fields: Optional[Sequence[str]] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Iterable[Tuple[SeriesKeys, Snapshot]]:
         """Obtain temporal iterations.
 
+        Args:
+            prefetch (int): Number of snapshots read ahead in the background, while
+                the current snapshot is processed. Snapshots are read lazily if
+                zero.
+            workers (int): Number of threads reading snapshots ahead.
+            fields (Sequence[str], Optional): Fields read ahead for every system,
+                e.g. ``["Position"]``. All fields are read ahead if not provided.
+            max_bytes (int, Optional): Budget in bytes for the snapshots read
+                ahead, which bounds the prefetch depth.
+
         Returns:
             Temporal iteration
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename)
+            >>> for t, snapshot in s.iterations(
+            >>>     prefetch=4, fields=["Position"], max_bytes=2**30
+            >>> ):
+            >>>     print(t.iterate, snapshot.cosserat_rods()[0]["Position"])
+
+        .. note::
+                Prefetched snapshots are held in memory, and only contain the
+                requested ``fields``.
         """
-        return self.items()
+        if not prefetch:
+            return self.items()
+
+        return parallel.prefetch(
+            self.keys(),
+            partial(self._fetch, fields=fields),
+            depth=prefetch,
+            workers=workers,
+            max_bytes=max_bytes,
+        )
+
+    def _fetch(
+        self, k: SeriesKeys, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[Snapshot, int]:
+        """Read a snapshot into memory.
+
+        Args:
+            k (SeriesKeys): Key of the snapshot.
+            fields (Sequence[str], Optional): Fields to be read, all if not provided.
+
+        Returns:
+            In-memory snapshot, and its size in bytes.
+        """
+        node, nbytes = parallel.load(self[k].node, fields, self.recorder)
+        return Snapshot(node, self.transforms, recorder=self.recorder), nbytes
+
+    async def aget(
+        self,
+        k: SeriesKeys,
+        fields: Optional[Sequence[str]] = None,
+        executor: Optional[Executor] = None,
+    ) -> Snapshot:
+        """Read a snapshot without blocking the event loop.
+
+        The snapshot is read into memory on an executor, so that accessing its
+        records does not block either. Reads from concurrent calls on the series
+        are bounded by ``async_concurrency``.
+
+        Args:
+            k (SeriesKeys): Key of the snapshot.
+            fields (Sequence[str], Optional): Fields to be read, e.g.
+                ``["Position"]``. All fields are read if not provided.
+            executor (Executor, Optional): Executor on which the snapshot is read,
+                the default executor of the event loop if not provided.
+
+        Returns:
+            In-memory snapshot.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename)
+            >>> snapshot = await s.aget(50, fields=["Position"])
+        """
+        loop = asyncio.get_running_loop()
+        async with self._limiter():
+            snapshot, _ = await loop.run_in_executor(
+                executor, partial(self._fetch, k, fields)
+            )
+        return snapshot
+
+    async def aiterations(
+        self,
+        concurrency: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[Tuple[SeriesKeys, Snapshot]]:
+        """Obtain temporal iterations without blocking the event loop.
+
+        Snapshots are read into memory on an executor, ahead of consumption. The
+        index of the series is also built on the executor, and reads count towards
+        the limit of ``async_concurrency`` shared with ``aget``.
+
+        Args:
+            concurrency (int, Optional): Maximum number of snapshots read at once,
+                defaults to ``async_concurrency``.
+            fields (Sequence[str], Optional): Fields to be read, e.g.
+                ``["Position"]``. All fields are read if not provided.
+            executor (Executor, Optional): Executor on which snapshots are read,
+                the default executor of the event loop if not provided.
+
+        Yields:
+            Pairs of keys and in-memory snapshots, in order of iterates.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename)
+            >>> async for t, snapshot in s.aiterations(fields=["Position"]):
+            >>>     print(t.iterate, snapshot.cosserat_rods()[0]["Position"])
+        """
+        # Building the index reads every record, so it is done on the executor.
+        loop = asyncio.get_running_loop()
+        index = await loop.run_in_executor(executor, self.index)
+        async for k, snapshot in parallel.aprefetch(
+            index,
+            partial(self._fetch, fields=fields),
+            concurrency or self.async_concurrency,
+            executor,
+            self._limiter(),
+        ):
+            yield k, snapshot
+
+    def at_time(self, time: float, method: str = "nearest") -> Snapshot:
+        """Lookup a snapshot by physical time.
+
+        Args:
+            time (float): Physical time of the snapshot.
+            method (str): ``"nearest"`` for the snapshot closest in time,
+                ``"before"`` for the latest snapshot not after ``time``, or
+                ``"interpolate"`` for a snapshot linearly interpolated in time
+                between its neighbors.
+
+        Returns:
+            Snapshot at ``time``.
+
+        Raises:
+            KeyError: If ``time`` is not within the series for ``"before"`` or
+                ``"interpolate"``.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename)
+            >>> snap = s.at_time(60.0) # snapshot at iteration 50, with time 50.0
+            >>> snap = s.at_time(60.0, method="interpolate")
+
+        .. note::
+                Times are binary searched, so that series whose times decrease with
+                iterates, see ``SeriesIndex.increasing``, raise a ``ValueError``.
+        """
+        index = self.index()
+        if method != "interpolate":
+            return self[int(index.iterates[index.locate(time, method)])]
+
+        before = index.locate(time, "before")
+        if index.times[before] == time:
+            return self[int(index.iterates[before])]
+        if before + 1 == len(index):
+            raise KeyError(f"{time}")
+
+        t0, t1 = index.times[before], index.times[before + 1]
+        return Snapshot(
+            _InterpolatedNode(
+                self[int(index.iterates[before])].node,
+                self[int(index.iterates[before + 1])].node,
+                float((time - t0) / (t1 - t0)),
+            ),
+            self.transforms,
+            recorder=self.recorder,
+        )
+
+    def time_range(self, start: float, stop: float) -> Series:
+        """Obtain a lazy view of the series within a time window.
+
+        Args:
+            start (float): Start time of the window.
+            stop (float): Stop time of the window, inclusive.
+
+        Returns:
+            ``Series`` restricted to times satisfying ``start <= time <= stop``.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename)
+            >>> for t, snapshot in s.time_range(0.0, 75.0).iterations():
+            >>>     print(t.iterate, t.time)
+
+        .. note::
+                Times are binary searched, so that series whose times decrease with
+                iterates, see ``SeriesIndex.increasing``, raise a ``ValueError``.
+        """
+        return self._view(self.index().window(start, stop))
+
+    def map(
+        self,
+        fn: Callable[[Snapshot], R],
+        processes: Optional[int] = None,
+        chunksize: int = 1,
+    ) -> Dict[SeriesKey, R]:
+        """Map a function over all snapshots, on a pool of processes.
+
+        Every process reopens the series, since file handles are not shared across
+        processes.
+
+        Args:
+            fn (Callable): Function applied to each snapshot. Must be picklable.
+            processes (int, Optional): Number of processes, defaults to the number
+                of CPUs. Snapshots are processed in the current process if one.
+            chunksize (int): Number of snapshots sent to a process at once.
+
+        Returns:
+            Results of ``fn`` for every key, ordered by key.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> def n_rods(snapshot):
+            >>>     return len(snapshot.rods())
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename)
+            >>> s.map(n_rods, processes=4)
+        """
+        return _map(self, self.opener, fn, processes, chunksize)
+
+    def reduce(
+        self,
+        fields: Sequence[str],
+        ops: Sequence[str] = ("mean",),
+        over: str = "time",
+        indices: Optional[SystemIndices] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Compute statistics of fields of systems, in one pass over iterations.
+
+        See ``SeriesSelection.reduce``.
+
+        Args:
+            fields (Sequence[str]): Fields of the systems, e.g. ``["Position"]``.
+            ops (Sequence[str]): Statistics among ``"min"``, ``"max"``, ``"mean"``,
+                ``"var"``, ``"std"`` and ``"quantile"``.
+            over (str): Either ``"time"`` or ``"systems"``.
+            indices (SystemIndices, Optional): Systems to reduce, all Cosserat rods
+                if not provided.
+            kwargs : Options of ``SeriesSelection.reduce``.
+
+        Returns:
+            Statistics by field and name.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> s = series(metadata=metadata_filename)
+            >>> mean = s.reduce(["Position"])["Position"]["mean"] # ragged over rods
+        """
+        if indices is None:
+            indices = CosseratRodRecordTraits.index_type()(slice(None))
+        return self.temporal_select(indices).reduce(fields, ops, over, **kwargs)
+
+
+def _close_node(node: Optional[Node]) -> None:
+    """Close a node, if it holds resources such as open files.
+
+    Args:
+        node (Node, Optional): Node to be closed.
+    """
+    close = getattr(node, "close", None)
+    if close is not None:
+        close()
+
+
+class LiveSeries(Series):
+    """Temporally evolving data-series of an in-progress simulation.
+
+    Iterations of the series follow records as they are appended to the series,
+    by reopening its node every ``poll_interval`` seconds. Replaced nodes are
+    closed if they have a ``close`` method, e.g. to release open files, once no
+    snapshot or view read from them is referenced anymore, or with the series.
+
+    Args:
+        reopen (Callable): Reopens the node with series information, to discover
+            appended records.
+        transforms (Callable, Optional): A function/transform that takes in an array
+            data-structure and returns a transformed version.
+        opener (Callable, Optional): Picklable callable reopening the series in
+            another process, needed for mapping over the series with processes.
+        cache (DatasetCache, Optional): Cache of raw arrays read from the series.
+        poll_interval (float): Time in seconds between polls for appended records.
+        timeout (float, Optional): Time in seconds without appended records after
+            which iterations stop. Iterations follow the series indefinitely if not
+            provided.
+        recorder (Recorder, Optional): Recorder of IO of the series.
+        structure (StructureCache, Optional): Cache of the structure of the series.
+
+    Raises:
+        ValueError: If ``poll_interval`` is not positive.
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> s = series(metadata=metadata_filename, follow=True, timeout=60.0)
+        >>> for t, snapshot in s.iterations(): # blocks for appended records
+        >>>     print(t.iterate, t.time)
+    """
+
+    def __init__(
+        self,
+        reopen: Callable[[], Node],
+        transforms: Optional[FuncType] = None,
+        opener: Optional[Callable[[], Series]] = None,
+        cache: Optional[DatasetCache] = None,
+        poll_interval: float = 1.0,
+        timeout: Optional[float] = None,
+        recorder: Optional[Recorder] = None,
+        structure: Optional[StructureCache] = None,
+    ) -> None:
+        """Initializer."""
+        if poll_interval <= 0:
+            raise ValueError(f"Poll interval should be positive, got {poll_interval}.")
+        super().__init__(reopen(), transforms, None, opener, cache, recorder, structure)
+        self.reopen = reopen
+        # Number of snapshots and views by id of the node they are read from, and
+        # replaced nodes still in use.
+        self._leases: Dict[int, int] = {}
+        self._replaced: Dict[int, Node] = {}
+        # Leases may be returned by the garbage collector while the lock is held.
+        self._lock = threading.RLock()
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+    def _lease(self, owner: T, node: Node) -> T:
+        """Keep a node open as long as an object read from it lives.
+
+        Args:
+            owner (T): Snapshot or view read from ``node``.
+            node (Node): Node of the series.
+
+        Returns:
+            ``owner``.
+        """
+        with self._lock:
+            self._leases[id(node)] = self._leases.get(id(node), 0) + 1
+            weakref.finalize(owner, self._return, node)
+        return owner
+
+    def _return(self, node: Node) -> None:
+        """Return a lease of a node, closing it if replaced and not leased.
+
+        Args:
+            node (Node): Leased node.
+        """
+        with self._lock:
+            key = id(node)
+            n = self._leases.pop(key, 1) - 1
+            if n > 0:
+                self._leases[key] = n
+            elif key in self._replaced:
+                _close_node(self._replaced.pop(key))
+
+    def _view(self, index: SeriesIndex) -> Series:
+        """Lazy view of the series, keeping the current node open while used.
+
+        Args:
+            index (SeriesIndex): Index of iterates in the view.
+
+        Returns:
+            Series restricted to ``index``.
+        """
+        with self._lock:
+            return self._lease(super()._view(index), self.node)
+
+    def _raw(self) -> Series:
+        """View of the series without transforms, keeping the node open while used.
+
+        Returns:
+            Series sharing the index, cache and statistics of this series.
+        """
+        with self._lock:
+            return self._lease(super()._raw(), self.node)
+
+    @overload
+    def __getitem__(self, k: SeriesKeys) -> Snapshot:  # noqa
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, k: IterationSlice) -> Series:  # noqa
+        ...  # pragma: no cover
+
+    def __getitem__(  # noqa
+        self, k: Union[SeriesKeys, IterationSlice]
+    ) -> Union[Snapshot, Series]:
+        with self._lock:
+            return self._lease(super().__getitem__(k), self.node)
+
+    def close(self) -> None:
+        """Close the node of the series, and replaced nodes still in use."""
+        with self._lock:
+            _close_node(self.node)
+            while self._replaced:
+                _close_node(self._replaced.popitem()[1])
+            self._leases.clear()
+
+    def refresh(self) -> int:
+        """Discover records appended to the series since the last refresh.
+
+        Returns:
+            Number of appended records.
+        """
+        index = self.index()
+        known = set(index.iterates.tolist())
+        node: Optional[Node] = None
+        try:
+            node = self.reopen()
+            appended = [
+                _series_key(node, n, self.recorder)
+                for n in sorted(int(k) for k in node)
+                if n not in known
+            ]
+        except (OSError, KeyError):
+            # Records may be briefly unavailable or incomplete while being appended.
+            _close_node(node)
+            return 0
+        with self._lock:
+            replaced, self.node = self.node, node
+            # Snapshots being read, e.g. ahead, may still use the replaced node.
+            if id(replaced) in self._leases:
+                self._replaced[id(replaced)] = replaced
+            else:
+                _close_node(replaced)
+            if appended:
+                self._index = SeriesIndex.from_keys([*index, *appended])
+        return len(appended)
+
+    def follow(self) -> Iterator[SeriesKey]:
+        """Keys of the series, followed by keys of records as they are appended.
+
+        Records appended with an iterate lower than that of the last key are
+        skipped.
+
+        Yields:
+            Keys of the series, in order of iterates.
+        """
+        last: Optional[int] = None
+        idle_since: Optional[float] = None
+        while True:
+            index = self.index()
+            start = (
+                0
+                if last is None
+                else int(np.searchsorted(index.iterates, last, side="right"))
+            )
+            for position in range(start, len(index)):
+                key = index[position]
+                last = key.iterate
+                idle_since = None
+                yield key
+
+            now = time.monotonic()
+            if idle_since is None:
+                idle_since = now
+            if self.timeout is not None and now - idle_since >= self.timeout:
+                return
+            time.sleep(self.poll_interval)
+            self.refresh()
+
+    def iterations(
+        self,
+        prefetch: int = 0,
+        workers: int = 1,
+        fields: Optional[Sequence[str]] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Iterable[Tuple[SeriesKeys, Snapshot]]:
+        """Obtain temporal iterations, following records as they are appended.
+
+        See ``Series.iterations``.
+
+        Args:
+            prefetch (int): Number of snapshots read ahead in the background.
+            workers (int): Number of threads reading snapshots ahead.
+            fields (Sequence[str], Optional): Fields read ahead for every system.
+            max_bytes (int, Optional): Budget in bytes for the snapshots read
+                ahead.
+
+        Returns:
+            Temporal iteration, which blocks while waiting for appended records.
+        """
+        if not prefetch:
+            return ((k, self[k]) for k in self.follow())
+
+        return parallel.prefetch(
+            self.follow(),
+            partial(self._fetch, fields=fields),
+            depth=prefetch,
+            workers=workers,
+            max_bytes=max_bytes,
+        )
 
 
 class SeriesSelection(Mapping[SeriesKeys, RecordLeafs]):
@@ -408,6 +1494,7 @@ class SeriesSelection(Mapping[SeriesKeys, RecordLeafs]):
         >>>
         >>> # Subset has same interface as Series
         >>> subset[50] # lookup the data at iteration 50
+        >>> subset[50:] # lookup the iterations from 50 on, lazily
         >>>
         >>> for t in subset.keys(): # obtain all iteration values for subsets
         >>>     print(t.iterate, t.time, t.dt)
@@ -419,11 +1506,24 @@ class SeriesSelection(Mapping[SeriesKeys, RecordLeafs]):
         self.parent = parent
         self.indices = indices
 
+    @overload
     def __getitem__(self, k: SeriesKeys) -> RecordLeafs:  # noqa
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, k: IterationSlice) -> SeriesSelection:  # noqa
+        ...  # pragma: no cover
+
+    def __getitem__(  # noqa
+        self, k: Union[SeriesKeys, IterationSlice]
+    ) -> Union[RecordLeafs, SeriesSelection]:
+        if not isinstance(k, (int, np.integer, SeriesKey)):
+            return SeriesSelection(self.parent[k], self.indices)
         # [Time][System][Index]
-        return self.parent[k][name(self.indices)][self.indices.indices]
+        snapshot = self.parent[k if isinstance(k, SeriesKey) else int(k)]
+        return snapshot[name(self.indices)][self.indices.indices]
 
-    def __iter__(self) -> SeriesIterator:  # noqa
+    def __iter__(self) -> Iterator[SeriesKey]:  # noqa
         return iter(self.parent)
 
     def __len__(self) -> int:  # noqa
@@ -440,6 +1540,7 @@ class SeriesSelection(Mapping[SeriesKeys, RecordLeafs]):
 
         Raises:
             TypeError: If index is out of bounds.
+            KeyError: If the series has no iterations.
 
         Example:
             >>> from elastica_pipelines.io import series
@@ -472,7 +1573,11 @@ class SeriesSelection(Mapping[SeriesKeys, RecordLeafs]):
                 f"not match with the selection{type(self.indices).__class__.__name__}"
             )
 
-        snap = next(iter(self.parent.values()))
+        # The first snapshot, without building the index of the series.
+        iterates = self.parent._iterates()
+        if not iterates:
+            raise KeyError("Cannot select systems in a series without iterations.")
+        snap = self.parent[iterates[0]]
         n_records = len(snap[name(self.indices)])
 
         i = self.indices.indices
@@ -499,3 +1604,512 @@ class SeriesSelection(Mapping[SeriesKeys, RecordLeafs]):
             Temporal iteration
         """
         return self.items()
+
+    def chunks(self, field: str, size: int) -> Iterator[npt.NDArray[Any]]:
+        """Stack a field of the selected systems, in blocks of iterations.
+
+        Only one block is held in memory at a time.
+
+        Args:
+            field (str): Field of the system to be stacked, e.g. ``"Position"``.
+            size (int): Maximum number of iterations in a block.
+
+        Yields:
+            Array of shape (n_iterations_in_block, n_selected_systems, ...).
+
+        Raises:
+            ValueError: If ``size`` is not positive, or if the field shapes
+                differ across systems or iterations.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>> from elastica_pipelines.io import CosseratRodRecordIndex as RodIndex
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> subset = series(metadata=metadata_filename).temporal_select(
+            >>>     RodIndex([0, 2])
+            >>> )
+            >>> for block in subset.chunks("Position", size=100):
+            >>>     print(block.shape) # (<= 100, 2, 3, n_nodes)
+        """
+        if size < 1:
+            raise ValueError(f"Block size should be positive, got {size}.")
+
+        iterates = self.parent._iterates()
+        system_name = name(self.indices)
+        node = self.parent.node
+        transforms = self.parent.transforms
+        # Batch transforms are applied once per block, to blocks of raw data.
+        batch = transforms is not None and supports_batch(transforms)
+        source = self.parent._raw() if batch else self.parent
+        # Stores laid out time-major are read in blocks, if data is not transformed.
+        bulk: Optional[StackableNode] = (
+            node
+            if isinstance(node, StackableNode)
+            and source.transforms is None
+            and source.cache is None
+            else None
+        )
+        for start in range(0, len(iterates), size):
+            block = iterates[start : start + size]
+            stacked: Optional[npt.NDArray[Any]]
+            if bulk is not None:
+                with stats.timed(source.recorder, "read_time", reads=1) as counts:
+                    stacked = bulk.stack(
+                        system_name, field, block, self.indices.indices
+                    )
+                    counts["bytes_read"] = stacked.nbytes
+            else:
+                stacked = self._stack_block(source, field, block)
+            if stacked is not None:
+                yield apply(transforms, stacked, source.recorder) if batch else stacked
+
+    def _stack_block(
+        self, source: Series, field: str, block: Sequence[int]
+    ) -> Optional[npt.NDArray[Any]]:
+        """Stack a field of the selected systems over a block of iterations.
+
+        Args:
+            source (Series): Series from which to read the selected systems.
+            field (str): Field of the system to be stacked.
+            block (Sequence[int]): Iterates of the block.
+
+        Returns:
+            Array of shape (n_iterations_in_block, n_selected_systems, ...), or None
+            if no systems are selected.
+
+        Raises:
+            ValueError: If the field shapes differ across systems or iterations.
+        """
+        system_name = name(self.indices)
+        # Raw fields are read directly into the block, once it is allocated.
+        direct = source.transforms is None
+        out: Optional[npt.NDArray[Any]] = None
+        for t, iterate in enumerate(block):
+            records = source[iterate][system_name]
+            sys_ids = _expand(self.indices.indices, len(records))
+            for s, sys_id in enumerate(sys_ids):
+                record = cast(Record, records[sys_id])
+                if direct and out is not None and out.shape[1] == len(sys_ids):
+                    try:
+                        record.read_into(field, out[t, s, ...])
+                    except ValueError as error:
+                        raise ValueError(
+                            f"Cannot stack field {field} for system {sys_id} at "
+                            f"iteration {iterate} into a block of shape {out.shape}, "
+                            f"the shapes differ."
+                        ) from error
+                    continue
+                value = _asarray(record[field], source.recorder)
+                if out is None:
+                    out = np.empty(
+                        (len(block), len(sys_ids), *value.shape), dtype=value.dtype
+                    )
+                if out.shape[1:] != (len(sys_ids), *value.shape):
+                    raise ValueError(
+                        f"Cannot stack field {field} of shape {value.shape} for "
+                        f"system {sys_id} at iteration {iterate} into a block of "
+                        f"shape {out.shape}, the shapes differ."
+                    )
+                out[t, s] = value
+        return out
+
+    def stack(self, field: str) -> npt.NDArray[Any]:
+        """Stack a field of the selected systems across all iterations.
+
+        Args:
+            field (str): Field of the system to be stacked, e.g. ``"Position"``.
+
+        Returns:
+            Array of shape (n_iterations, n_selected_systems, ...), laid out as in
+            ``empty`` if there are no iterations or systems to stack.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>> from elastica_pipelines.io import CosseratRodRecordIndex as RodIndex
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> subset = series(metadata=metadata_filename).temporal_select(
+            >>>     RodIndex([0, 2])
+            >>> )
+            >>> subset.stack("Position").shape # (n_iterations, 2, 3, n_nodes)
+
+        .. note::
+                A single integer index still has a systems axis of length one.
+        """
+        blocks = list(self.chunks(field, size=max(len(self), 1)))
+        return blocks[0] if blocks else self.empty(field)
+
+    def empty(self, field: str, n_elements: Optional[int] = None) -> npt.NDArray[Any]:
+        """Allocate an array to read a field of the selected systems into.
+
+        The shape and data type of the field are known ahead of time from the
+        schema of the system type (see ``registry``), so that only the number of
+        selected systems, and of elements if needed and not provided, is looked up.
+        Fields not in the schema are described from the first selected system,
+        without being read.
+
+        Args:
+            field (str): Field of the system, e.g. ``"Position"``.
+            n_elements (int, Optional): Number of elements of the selected systems.
+                Read from the first selected system if not provided.
+
+        Returns:
+            Uninitialized array of shape (n_iterations, n_selected_systems, ...),
+            for ``read_into``.
+
+        Raises:
+            KeyError: If the field is neither in the schema of the system type nor
+                in the selected systems.
+        """
+        system_name = name(self.indices)
+        system_type = registry.lookup(system_name)
+        schema = None if system_type is None else system_type.fields.get(field)
+        iterates = self.parent._iterates()
+        records = self.parent._raw()[iterates[0]][system_name] if iterates else {}
+        sys_ids = _expand(self.indices.indices, len(records)) if iterates else []
+        n_systems = len(sys_ids) if iterates else _count(self.indices.indices)
+        leading = (len(iterates), n_systems)
+        if schema is None:
+            if not sys_ids:
+                raise KeyError(f"Field {field} is not in the schema of {system_name}.")
+            info = cast(Record, records[sys_ids[0]]).describe(field)
+            return np.empty((*leading, *info.shape), dtype=info.dtype)
+
+        if n_elements is None and sys_ids and not schema.fixed:
+            n_element = _asarray(records[sys_ids[0]]["NElement"], self.parent.recorder)
+            n_elements = int(n_element.ravel()[0])
+        # Without systems to read, any number of elements gives an empty array.
+        n_elements = 1 if n_elements is None else n_elements
+        return np.empty((*leading, *schema.resolve(n_elements)), dtype=schema.dtype)
+
+    def read_into(self, field: str, out: npt.NDArray[Any]) -> npt.NDArray[Any]:
+        """Read a field of the selected systems across all iterations into an array.
+
+        Like ``stack``, but fills a preallocated array, reading directly into it
+        where possible. Reusing ``out`` across calls (e.g. over ``time_range`` views
+        of the same length) avoids allocating fresh arrays on every read.
+
+        Args:
+            field (str): Field of the system to be read, e.g. ``"Position"``.
+            out (ndarray): Array of shape (n_iterations, n_selected_systems, ...).
+
+        Returns:
+            ``out`` filled with the field data.
+
+        Raises:
+            ValueError: If the shape of ``out`` does not match the selection, or if
+                the number of selected systems differs across iterations.
+
+        Example:
+            >>> import numpy as np
+            >>> from elastica_pipelines.io import series
+            >>> from elastica_pipelines.io import CosseratRodRecordIndex as RodIndex
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> subset = series(metadata=metadata_filename).temporal_select(
+            >>>     RodIndex([0, 2])
+            >>> )
+            >>> out = subset.empty("Position") # (n_iterations, 2, 3, 11)
+            >>> subset.read_into("Position", out)
+        """
+        iterates = self.parent._iterates()
+        system_name = name(self.indices)
+        transforms = self.parent.transforms
+        # Batch transforms are applied once to the raw data read into out, and their
+        # result copied back into out.
+        batch = transforms is not None and supports_batch(transforms)
+        source = self.parent._raw() if batch else self.parent
+        n_systems = _count(self.indices.indices)
+        if iterates:
+            records = source[iterates[0]][system_name]
+            n_systems = len(_expand(self.indices.indices, len(records)))
+        if out.shape[:2] != (len(iterates), n_systems):
+            raise ValueError(
+                f"Cannot read {len(iterates)} iterations of {n_systems} systems into "
+                f"an array of shape {out.shape}."
+            )
+        for t, iterate in enumerate(iterates):
+            records = source[iterate][system_name]
+            sys_ids = _expand(self.indices.indices, len(records))
+            if len(sys_ids) != n_systems:
+                raise ValueError(
+                    f"Cannot read {len(sys_ids)} systems at iteration {iterate} into "
+                    f"an array of shape {out.shape}, the number of systems differs."
+                )
+            for s, sys_id in enumerate(sys_ids):
+                cast(Record, records[sys_id]).read_into(field, out[t, s, ...])
+        if batch:
+            transformed = apply(transforms, out, source.recorder)
+            if transformed is not out:
+                np.copyto(out, transformed)
+        return out
+
+    def _fetch(
+        self, k: SeriesKeys, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[RecordLeafs, int]:
+        """Read the selection at an iteration into memory.
+
+        Args:
+            k (SeriesKeys): Key of the iteration.
+            fields (Sequence[str], Optional): Fields to be read, all if not provided.
+
+        Returns:
+            In-memory records of the selection, and their size in bytes.
+        """
+        system_name = name(self.indices)
+        node = self.parent[k].node
+        loaded, nbytes = parallel.load(
+            {system_name: node[system_name]}, fields, self.parent.recorder
+        )
+        snapshot = Snapshot(
+            loaded, self.parent.transforms, recorder=self.parent.recorder
+        )
+        return snapshot[system_name][self.indices.indices], nbytes
+
+    async def aget(
+        self,
+        k: SeriesKeys,
+        fields: Optional[Sequence[str]] = None,
+        executor: Optional[Executor] = None,
+    ) -> RecordLeafs:
+        """Read the selection at an iteration without blocking the event loop.
+
+        See ``Series.aget``.
+
+        Args:
+            k (SeriesKeys): Key of the iteration.
+            fields (Sequence[str], Optional): Fields to be read, e.g.
+                ``["Position"]``. All fields are read if not provided.
+            executor (Executor, Optional): Executor on which records are read, the
+                default executor of the event loop if not provided.
+
+        Returns:
+            In-memory records of the selection.
+        """
+        loop = asyncio.get_running_loop()
+        async with self.parent._limiter():
+            records, _ = await loop.run_in_executor(
+                executor, partial(self._fetch, k, fields)
+            )
+        return records
+
+    async def aiterations(
+        self,
+        concurrency: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[Tuple[SeriesKeys, RecordLeafs]]:
+        """Obtain temporal iterations without blocking the event loop.
+
+        See ``Series.aiterations``.
+
+        Args:
+            concurrency (int, Optional): Maximum number of iterations read at once,
+                defaults to ``Series.async_concurrency``.
+            fields (Sequence[str], Optional): Fields to be read, e.g.
+                ``["Position"]``. All fields are read if not provided.
+            executor (Executor, Optional): Executor on which records are read, the
+                default executor of the event loop if not provided.
+
+        Yields:
+            Pairs of keys and in-memory records of the selection, in order of
+            iterates.
+        """
+        loop = asyncio.get_running_loop()
+        index = await loop.run_in_executor(executor, self.parent.index)
+        async for k, records in parallel.aprefetch(
+            index,
+            partial(self._fetch, fields=fields),
+            concurrency or self.parent.async_concurrency,
+            executor,
+            self.parent._limiter(),
+        ):
+            yield k, records
+
+    def to_arrow(
+        self,
+        path: Union[str, pathlib.Path],
+        fields: Sequence[str],
+        chunk_size: int = 64,
+    ) -> None:
+        """Write fields of the selection to an Arrow IPC file.
+
+        The selection is streamed out as one record batch per block of
+        ``chunk_size`` iterations, with one row per selected system and iteration.
+        Fields are stored as large list arrays, so that rods with different number
+        of elements are stored without padding. Requires ``pyarrow``, installed
+        with the ``arrow`` extra.
+
+        Args:
+            path (str, Path): Path of the Arrow IPC file.
+            fields (Sequence[str]): Fields of the selected systems to write.
+            chunk_size (int): Maximum number of iterations in a record batch.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>> from elastica_pipelines.io import CosseratRodRecordIndex as RodIndex
+            >>> from elastica_pipelines.io.arrow import read
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> subset = series(metadata=metadata_filename).temporal_select(
+            >>>     RodIndex(slice(None))
+            >>> )
+            >>> subset.to_arrow("rods.arrow", fields=["Position", "Radius"])
+            >>> table = read("rods.arrow") # memory-mapped, without copies
+        """
+        from elastica_pipelines.io import arrow
+
+        arrow.write(self, path, fields, chunk_size)
+
+    def map(
+        self,
+        fn: Callable[[RecordLeafs], R],
+        processes: Optional[int] = None,
+        chunksize: int = 1,
+    ) -> Dict[SeriesKey, R]:
+        """Map a function over the selection at all iterations, on a pool of processes.
+
+        Every process reopens the series, since file handles are not shared across
+        processes.
+
+        Args:
+            fn (Callable): Function applied to the selection at each iteration. Must
+                be picklable.
+            processes (int, Optional): Number of processes, defaults to the number
+                of CPUs. Selections are processed in the current process if one.
+            chunksize (int): Number of iterations sent to a process at once.
+
+        Returns:
+            Results of ``fn`` for every key, ordered by key.
+        """
+        opener = self.parent.opener
+        return _map(
+            self,
+            None if opener is None else partial(_reselect, opener, self.indices),
+            fn,
+            processes,
+            chunksize,
+        )
+
+    def reduce(
+        self,
+        fields: Sequence[str],
+        ops: Sequence[str] = ("mean",),
+        over: str = "time",
+        q: Union[float, Sequence[float]] = 0.5,
+        chunk_size: int = 64,
+        processes: int = 1,
+        reservoir_size: int = 1024,
+        seed: int = 0,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Compute statistics of fields of the selection, in one pass over iterations.
+
+        Fields are read in blocks of ``chunk_size`` iterations, so that memory is
+        bounded by the size of a block whatever the number of iterations.
+        Statistics are either computed over time, for every entry of every
+        selected system, or over systems, for every iteration:
+
+        - ``over="time"``: Statistics have the shape of the field stacked over
+          systems, e.g. ``(n_systems, 3, n_nodes)``, or are packed into a
+          ``RaggedArray`` for systems with different number of elements.
+        - ``over="systems"``: Statistics are over all entries along the last axis
+          of all selected systems, e.g. all nodes of all rods, and have shape
+          ``(n_iterations, ...)``, e.g. ``(n_iterations, 3)`` for positions.
+
+        Means and variances are accumulated in a numerically stable way. Quantiles
+        over time are estimated from a uniform sample of ``reservoir_size``
+        iterations, and are exact for fewer iterations.
+
+        Args:
+            fields (Sequence[str]): Fields of the systems, e.g. ``["Position"]``.
+            ops (Sequence[str]): Statistics among ``"min"``, ``"max"``, ``"mean"``,
+                ``"var"``, ``"std"`` and ``"quantile"``.
+            over (str): Either ``"time"`` or ``"systems"``.
+            q (float, Sequence[float]): Quantiles, for the ``"quantile"``
+                statistic. Quantiles have a leading axis if a sequence, as in
+                ``np.quantile``.
+            chunk_size (int): Maximum number of iterations read at once.
+            processes (int): Number of processes reducing consecutive ranges of
+                iterations, whose statistics are then merged. Requires the series
+                to be reopened in other processes, see ``Series.map``.
+            reservoir_size (int): Maximum number of iterations sampled for
+                quantiles over time.
+            seed (int): Seed of the sampling for quantiles over time.
+
+        Returns:
+            Statistics by field and name.
+
+        Example:
+            >>> from elastica_pipelines.io import series
+            >>> from elastica_pipelines.io import CosseratRodRecordIndex as RodIndex
+            >>>
+            >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+            >>> subset = series(metadata=metadata_filename).temporal_select(
+            >>>     RodIndex([0, 2])
+            >>> )
+            >>> stats = subset.reduce(["Position"], ops=["mean", "std"])
+            >>> stats["Position"]["mean"].shape # (2, 3, n_nodes)
+            >>> extent = subset.reduce(["Position"], ops=["min", "max"], over="systems")
+        """
+        from elastica_pipelines.io import reduction
+
+        return reduction.reduce(
+            self,
+            fields,
+            ops,
+            over,
+            q,
+            chunk_size,
+            processes,
+            reservoir_size,
+            seed,
+        )
+
+
+def _reselect(opener: Callable[[], Series], indices: SystemIndices) -> SeriesSelection:
+    """Reopen a series and select a subset of systems.
+
+    Args:
+        opener (Callable): Reopens the series.
+        indices(SystemIndices): indices (with Traits) for system selection.
+
+    Returns:
+        ``SeriesSelection`` of the reopened series.
+    """
+    return opener().temporal_select(indices)
+
+
+def _map(
+    source: Mapping[SeriesKeys, Any],
+    opener: Optional[Callable[[], Mapping[SeriesKeys, Any]]],
+    fn: Callable[[Any], R],
+    processes: Optional[int],
+    chunksize: int,
+) -> Dict[SeriesKey, R]:
+    """Map a function over the values of a source, on a pool of processes.
+
+    Args:
+        source (Mapping): Series or selection.
+        opener (Callable, Optional): Reopens the source in another process.
+        fn (Callable): Function applied to each value.
+        processes (int, Optional): Number of processes.
+        chunksize (int): Number of values sent to a process at once.
+
+    Returns:
+        Results of ``fn`` for every key, ordered by key.
+
+    Raises:
+        RuntimeError: If the source cannot be reopened in other processes.
+    """
+    keys: List[SeriesKey] = list(source.keys())  # type: ignore[arg-type]
+    if processes == 1:
+        return {k: fn(source[k]) for k in keys}
+    if opener is None:
+        raise RuntimeError(
+            "Series cannot be reopened in other processes, create it with an opener."
+        )
+    results = parallel.map_processes(
+        opener, fn, [k.iterate for k in keys], processes, chunksize
+    )
+    return {k: results[i] for i, k in enumerate(keys)}
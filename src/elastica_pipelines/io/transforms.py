@@ -1,5 +1,6 @@
 """Transformations to apply when reading/writing Elastica IO."""
 from typing import Any
+from typing import Optional
 from typing import Sequence
 from typing import Tuple
 
@@ -9,9 +10,57 @@ import numpy.typing as npt
 from elastica_pipelines.io.typing import FuncType
 
 
+def supports_batch(transform: FuncType) -> bool:
+    """Check if a transform can be applied once to stacked arrays.
+
+    See ``protocols.BatchTransform``.
+
+    Args:
+        transform (FuncType): Transform to check.
+
+    Returns:
+        True if the transform declares ``supports_batch``.
+    """
+    return bool(getattr(transform, "supports_batch", False))
+
+
+def is_elementwise(transform: FuncType) -> bool:
+    """Check if a transform commutes with selections of its input.
+
+    Elementwise transforms, e.g. unit conversions, give the same result whether
+    data is selected before or after transforming it, so that selections can be
+    read from file before transforming (see ``core.DatasetView``).
+
+    Args:
+        transform (FuncType): Transform to check.
+
+    Returns:
+        True if the transform declares ``elementwise``.
+    """
+    return bool(getattr(transform, "elementwise", False))
+
+
+def is_memory_mapped(transform: FuncType) -> bool:
+    """Check if a transform maps datasets into memory, see ``MemMap``.
+
+    Views of records with such transforms map eligible datasets, rather than
+    reading them through HDF5 (see ``core.DatasetView``).
+
+    Args:
+        transform (FuncType): Transform to check.
+
+    Returns:
+        True if the transform declares ``memory_mapped``.
+    """
+    return bool(getattr(transform, "memory_mapped", False))
+
+
 class Compose:
     """Composes several transforms together.
 
+    The composition supports batches if all transforms do, is elementwise if all
+    transforms are, and maps datasets into memory if any transform does.
+
     Args:
         transforms (list of ``Transform`` objects): list of transforms to compose.
 
@@ -26,6 +75,21 @@ class Compose:
         """Initializes transforms."""
         self.transforms: Tuple[FuncType, ...] = tuple(transforms)
 
+    @property
+    def supports_batch(self) -> bool:
+        """Whether all composed transforms can be applied to stacked arrays."""
+        return all(supports_batch(t) for t in self.transforms)
+
+    @property
+    def elementwise(self) -> bool:
+        """Whether all composed transforms are elementwise."""
+        return all(is_elementwise(t) for t in self.transforms)
+
+    @property
+    def memory_mapped(self) -> bool:
+        """Whether any composed transform maps datasets into memory."""
+        return any(is_memory_mapped(t) for t in self.transforms)
+
     def __call__(self, obj: Any) -> Any:
         """Applies transformation to object.
 
@@ -57,6 +121,9 @@ class ToArray:
         >>> ToArray()([1, 2, 3, 4]).shape
     """
 
+    supports_batch = True
+    elementwise = True
+
     def __init__(self) -> None:  # noqa
         pass
 
@@ -73,3 +140,146 @@ class ToArray:
 
     def __repr__(self) -> str:  # noqa
         return f"{self.__class__.__name__}()"
+
+
+class Batched:
+    """Declare a vectorized function as a transform applicable to stacked arrays.
+
+    ``fn`` receives arrays with any number of leading axes over systems (and
+    iterations), and should apply independently over them, e.g. unit conversions
+    or rotations broadcasting over leading axes. Bulk reads (``to_arrays``,
+    ``stack``, ``chunks``, ``read_into``) then apply it once per stacked array,
+    rather than once per field. Data is converted to ``numpy.ndarray`` first.
+
+    Args:
+        fn (Callable): Vectorized function of an array.
+        elementwise (bool): Whether ``fn`` applies to every element independently,
+            e.g. unit conversions but not rotations, so that selections of data
+            can be read before applying it.
+
+    Example:
+        >>> import numpy as np
+        >>> from elastica_pipelines.io import CosseratRodRecordIndex, series
+        >>> from elastica_pipelines.io.transforms import Batched, Compose
+        >>>
+        >>> rotation = np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        >>> to_mm = Batched(lambda x: 1e3 * x, elementwise=True)
+        >>> rotate = Batched(lambda x: np.einsum("ij,...jk->...ik", rotation, x))
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> s = series(metadata=metadata_filename, transforms=Compose([to_mm, rotate]))
+        >>> s.temporal_select(CosseratRodRecordIndex([0, 2])).stack("Position")
+    """
+
+    supports_batch = True
+
+    def __init__(self, fn: FuncType, elementwise: bool = False) -> None:  # noqa
+        self.fn = fn
+        self.elementwise = elementwise
+
+    def __call__(self, tensor: npt.ArrayLike) -> Any:
+        """Applies the function.
+
+        Args:
+            tensor (HDF5 dataset or numpy.ndarray): Tensor, possibly stacked.
+
+        Returns:
+            Any: Transformed data.
+        """
+        return self.fn(np.asarray(tensor))
+
+    def __repr__(self) -> str:  # noqa
+        return f"{self.__class__.__name__}({self.fn!r})"
+
+
+class MemMap:
+    """Map a contiguous, uncompressed ``HDF5 dataset`` into memory.
+
+    Returns a read-only ``numpy.memmap`` at the offset of the dataset in its file,
+    skipping reads through the HDF5 library. Data is then paged in lazily from the
+    page cache, without copies. Datasets that cannot be mapped (chunked, filtered,
+    unallocated, non-numeric or not backed by a plain file) and non-HDF5 data fall
+    back to ``numpy.asarray``.
+
+    Memory mapping is opt-in. Views (``DatasetView``) of records with this
+    transform, alone or composed, also map eligible datasets. Cached and bulk reads
+    are read through HDF5, as they are copied into memory anyway.
+
+    Example:
+        >>> from elastica_pipelines.io import series
+        >>> from elastica_pipelines.io.transforms import MemMap
+        >>>
+        >>> metadata_filename = "tests/io/data/elastica_metadata.h5"
+        >>> s = series(metadata=metadata_filename, transforms=MemMap())
+        >>> s[50].cosserat_rods()[0]["Position"] # numpy.memmap
+    """
+
+    memory_mapped = True
+
+    def __init__(self) -> None:  # noqa
+        pass
+
+    @staticmethod
+    def offset(dataset: Any) -> Optional[int]:
+        """Offset of a dataset in its file, if it can be mapped into memory.
+
+        Args:
+            dataset (Any): HDF5 dataset.
+
+        Returns:
+            Offset in bytes, or None if the dataset cannot be mapped.
+        """
+        try:
+            if (
+                dataset.chunks is not None
+                or dataset.compression is not None
+                or dataset.file.driver not in ("sec2", "stdio")
+                or dataset.file.userblock_size != 0
+                or dataset.dtype.kind not in "biufc"
+                or dataset.size == 0
+                or dataset.ndim == 0
+            ):
+                return None
+            offset: Optional[int] = dataset.id.get_offset()
+        except AttributeError:
+            # Not an HDF5 dataset.
+            return None
+        return offset
+
+    def __call__(self, tensor: npt.ArrayLike) -> npt.NDArray[Any]:
+        """Applies memory mapping.
+
+        Args:
+            tensor (HDF5 dataset or numpy.ndarray): Tensor to be mapped.
+
+        Returns:
+            Tensor: Mapped data, or converted data if the tensor cannot be mapped.
+        """
+        mapped = memory_map(tensor)
+        return np.asarray(tensor) if mapped is None else mapped
+
+    def __repr__(self) -> str:  # noqa
+        return f"{self.__class__.__name__}()"
+
+
+def memory_map(data: Any) -> Optional[npt.NDArray[Any]]:
+    """Map data into memory, if it is a contiguous, uncompressed HDF5 dataset.
+
+    ``MemMap`` and views of records with it use this as a zero-copy fast path.
+
+    Args:
+        data (Any): Raw data, e.g. an HDF5 dataset.
+
+    Returns:
+        Read-only ``numpy.memmap`` of the data, or None if it cannot be mapped.
+    """
+    offset = MemMap.offset(data)
+    if offset is None:
+        return None
+    return np.memmap(
+        data.file.filename,
+        dtype=data.dtype,
+        mode="r",
+        offset=offset,
+        shape=data.shape,
+    )
@@ -1,6 +1,7 @@
 """Elastica IO typing."""
 from __future__ import annotations
 
+from abc import abstractmethod
 from typing import Any
 from typing import Callable
 from typing import List
@@ -25,17 +26,42 @@ Indices: TypeAlias = Union[int, slice, List[int]]
 
 class _RecordImplementation(Mapping[str, npt.ArrayLike]):
     def __init__(
-        self, parent: Node, sys_id: int, transforms: Optional[FuncType]  # noqa
+        self,
+        parent: Node,
+        sys_id: int,
+        transforms: Optional[FuncType],
+        cache: Optional[Any] = None,  # noqa
+        recorder: Optional[Any] = None,  # noqa
+        structure: Optional[Any] = None,  # noqa
     ) -> None:
         ...  # pragma: no cover
 
+    @abstractmethod
+    def read_into(self, field: str, out: npt.NDArray[Any]) -> npt.NDArray[Any]:  # noqa
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def view(self, field: str) -> Any:  # noqa
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def describe(self, field: str) -> Any:  # noqa
+        ...  # pragma: no cover
+
 
 Record: TypeAlias = _RecordImplementation
 RecordLeafs = Union[Record, "RecordsSlice"]
 
 
 class _RecordsImplementation(Mapping[Key, RecordLeafs]):
-    def __init__(self, parent: Node, transforms: Optional[FuncType]) -> None:  # noqa
+    def __init__(  # noqa
+        self,
+        parent: Node,
+        transforms: Optional[FuncType],
+        cache: Optional[Any] = None,
+        recorder: Optional[Any] = None,
+        structure: Optional[Any] = None,
+    ) -> None:
         ...  # pragma: no cover
 
 
@@ -0,0 +1 @@
+"""Test suite for the elastica_pipelines analysis subpackage."""
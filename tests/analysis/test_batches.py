@@ -0,0 +1,45 @@
+"""Test cases for batches of systems."""
+import numpy as np
+import pytest
+
+from elastica_pipelines.analysis import batches
+from elastica_pipelines.io.arrays import RaggedArray
+
+
+@pytest.fixture
+def ragged() -> RaggedArray:
+    """Gets positions of two systems with different number of nodes."""
+    return RaggedArray.pack(
+        [np.arange(6.0).reshape(2, 3), 10.0 + np.arange(4.0).reshape(2, 2)]
+    )
+
+
+class TestBatches:
+    """Test helpers of batches."""
+
+    def test_consecutive(self, ragged) -> None:
+        """Test pairs of entries do not straddle systems."""
+        first, second = batches.consecutive(ragged)
+        assert np.all(first.offsets == [0, 2, 3])
+        assert np.all(first.values == [[0, 1, 10], [3, 4, 12]])
+        assert np.all(second.values == [[1, 2, 11], [4, 5, 13]])
+
+        first, second = batches.consecutive(np.arange(8.0).reshape(2, 4))
+        assert first.shape == second.shape == (2, 3)
+
+    def test_reduce(self, ragged) -> None:
+        """Test reductions per system, with systems before the axes of the field."""
+        assert np.all(batches.reduce(ragged, np.add, inner=1) == [[3, 12], [21, 25]])
+        stacked = np.stack([ragged[0][..., :2], ragged[1]])
+        assert batches.reduce(stacked, np.add).shape == (2, 2)
+
+        leading = RaggedArray(np.stack([ragged.values] * 4), ragged.offsets)
+        assert batches.reduce(leading, np.maximum, inner=1).shape == (4, 2, 2)
+
+        with pytest.raises(ValueError, match="without entries"):
+            batches.reduce(RaggedArray.pack([np.ones(2), np.ones(0)]), np.add)
+
+    def test_like(self, ragged) -> None:
+        """Test batches keep the layout of other batches."""
+        assert batches.like(ragged, 2 * ragged.values).offsets is ragged.offsets
+        assert np.all(batches.values(batches.like(np.ones(2), np.zeros(2))) == 0)
@@ -0,0 +1,218 @@
+"""Test cases for kernels of Cosserat rods."""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from elastica_pipelines.analysis import batches
+from elastica_pipelines.analysis import rods
+from elastica_pipelines.io.arrays import RaggedArray
+from elastica_pipelines.io.entry import series
+from elastica_pipelines.io.specialize import CosseratRodRecordIndex
+from tests.io.test_protocols import skip_if_env_has
+
+
+DATA_DIR = Path(__file__).parent.parent / "io" / "data"
+
+FIELDS = [
+    "Position",
+    "Velocity",
+    "Mass",
+    "Director",
+    "AngularVelocity",
+    "MassSecondMomentOfInertia",
+    "ElementLength",
+    "Tangent",
+    "ShearStretchStrain",
+    "Curvature",
+    "ReferenceElementLength",
+    "ReferenceVoronoiLength",
+]
+
+
+def twisted(n: int, alpha: float) -> np.ndarray:
+    """Directors of a straight rod twisted by ``alpha`` per element.
+
+    Args:
+        n: Number of elements.
+        alpha: Twist angle from an element to the next.
+
+    Returns:
+        Directors of shape (3, 3, n).
+    """
+    angle = alpha * np.arange(n)
+    c, s, z, o = np.cos(angle), np.sin(angle), np.zeros(n), np.ones(n)
+    return np.array([[c, s, z], [-s, c, z], [z, z, o]])
+
+
+def bent(n: int, radius: float, length: float) -> np.ndarray:
+    """Directors of a rod bent along a circular arc in the x-z plane.
+
+    The tangent ``d3`` turns from ``z`` towards ``d1``, about ``d2 = y``, by
+    ``length / radius`` per element.
+
+    Args:
+        n: Number of elements.
+        radius: Radius of the arc, negative to bend towards ``-d1``.
+        length: Rest length of the voronoi regions.
+
+    Returns:
+        Directors of shape (3, 3, n).
+    """
+    angle = length / radius * np.arange(n)
+    c, s, z, o = np.cos(angle), np.sin(angle), np.zeros(n), np.ones(n)
+    return np.array([[c, z, -s], [z, o, z], [s, z, c]])
+
+
+@pytest.fixture
+def helix() -> RaggedArray:
+    """Gets positions of helical rods with different number of elements."""
+
+    def nodes(n):
+        t = np.linspace(0.0, 2.0, n + 1)
+        return np.array([np.cos(t), np.sin(t), 0.1 * t])
+
+    return RaggedArray.pack([nodes(4), nodes(7), nodes(2)])
+
+
+class TestKernels:
+    """Test kernels against loops over rods."""
+
+    def test_geometry(self, helix) -> None:
+        """Test lengths, tangents and bounding boxes of ragged rods."""
+        lengths = rods.lengths(helix)
+        boxes = rods.bounding_boxes(helix)
+        tangents = rods.tangents(helix)
+        assert isinstance(tangents, RaggedArray)
+        assert lengths.shape == (3,) and boxes[0].shape == (3, 3)
+        assert np.all(tangents.lengths == [4, 7, 2])
+        for i, x in enumerate(helix):
+            edges = np.diff(x, axis=-1)
+            assert lengths[i] == pytest.approx(np.linalg.norm(edges, axis=0).sum())
+            assert np.allclose(boxes[0][i], x.min(axis=-1))
+            assert np.allclose(boxes[1][i], x.max(axis=-1))
+            assert np.allclose(tangents[i], edges / np.linalg.norm(edges, axis=0))
+
+    def test_trajectory(self, helix) -> None:
+        """Test kernels over leading axes, e.g. iterations."""
+        trajectory = RaggedArray(
+            np.stack([helix.values, 2.0 * helix.values]), helix.offsets
+        )
+        lengths = rods.lengths(trajectory)
+        assert lengths.shape == (2, 3)
+        assert np.allclose(lengths[1], 2.0 * lengths[0])
+
+        mass = RaggedArray(np.ones(helix.values.shape[-1]), helix.offsets)
+        com = rods.center_of_mass(trajectory, mass)
+        assert com.shape == (2, 3, 3)
+        assert np.allclose(com[1, 1], 2.0 * helix[1].mean(axis=-1))
+
+    def test_curvature(self) -> None:
+        """Test curvature of twisted rods."""
+        alpha, n = 0.1, 5
+        rest = np.full(n - 1, 0.5)
+        kappa = rods.curvature(twisted(n, alpha), rest)
+        assert np.allclose(kappa[2], alpha / 0.5)
+        assert np.allclose(kappa[:2], 0.0)
+
+        stacked = rods.curvature(
+            np.stack([twisted(n, alpha), twisted(n, 0.0)]), np.stack([rest, rest])
+        )
+        assert isinstance(stacked, np.ndarray)
+        assert stacked.shape == (2, 3, n - 1)
+        assert np.allclose(stacked[1], 0.0)
+
+        ragged = rods.curvature(
+            RaggedArray.pack([twisted(n, alpha), twisted(3, -alpha)]),
+            RaggedArray.pack([rest, np.ones(2)]),
+        )
+        assert isinstance(ragged, RaggedArray)
+        assert np.all(ragged.lengths == [n - 1, 2])
+        assert np.allclose(ragged[1][2], -alpha)
+
+    def test_curvature_convention(self) -> None:
+        """Test the sign of curvatures against arcs of known curvature.
+
+        With ``d_j' = kappa x d_j``, an arc of radius ``R`` turning its tangent
+        towards ``d1`` has ``kappa = (0, 1 / R, 0)``, and a rod twisting ``d1``
+        towards ``d2`` has a positive twist ``kappa_3``.
+        """
+        rest = np.full(7, 0.1)
+        for radius in (2.0, -0.5):
+            directors = bent(8, radius, 0.1)
+            kappa = rods.curvature(directors, rest)
+            assert np.allclose(kappa, [[0.0], [1.0 / radius], [0.0]])
+
+            # Derivatives of the directors along the arc, by central differences
+            middle = 0.5 * (directors[..., 1:] + directors[..., :-1])
+            darboux = np.einsum("ik,ijk->jk", kappa, middle)
+            derivative = np.diff(directors, axis=-1) / rest
+            expected = np.cross(darboux, middle, axisa=0, axisb=1, axisc=1)
+            assert np.allclose(derivative, expected, atol=1e-2)
+            assert not np.allclose(derivative, -expected, atol=1e-2)
+
+        kappa = rods.curvature(twisted(8, 0.05), rest)
+        assert np.allclose(kappa, [[0.0], [0.0], [0.5]])
+
+    def test_kinetic_energy(self) -> None:
+        """Test translational and rotational kinetic energies."""
+        velocity = np.ones((2, 3, 4))
+        mass = np.full((2, 4), 0.5)
+        assert np.allclose(rods.kinetic_energy(velocity, mass), 3.0)
+
+        omega = np.zeros((2, 3, 3))
+        omega[:, 2] = 2.0
+        inertia = np.broadcast_to(np.eye(3)[..., np.newaxis], (2, 3, 3, 3))
+        energy = rods.kinetic_energy(velocity, mass, omega, inertia)
+        assert np.allclose(energy, 3.0 + 6.0)
+        with pytest.raises(ValueError, match="Both"):
+            rods.kinetic_energy(velocity, mass, omega)
+
+
+# Needs Accessor which needs runtime checkable
+@skip_if_env_has("typeguard")
+def test_elastica_data() -> None:
+    """Test kernels reproduce fields computed by Elastica++."""
+    s = series(metadata=DATA_DIR / "elastica_metadata.h5")
+    data = s[50].cosserat_rods().to_arrays(FIELDS)
+    position = data["Position"]
+    assert isinstance(position, RaggedArray)
+
+    element_lengths = rods.element_lengths(position)
+    assert np.allclose(
+        batches.values(element_lengths), batches.values(data["ElementLength"])
+    )
+    tangents = rods.tangents(position)
+    assert np.allclose(batches.values(tangents), batches.values(data["Tangent"]))
+    strain = rods.shear_strain(
+        position, data["Director"], data["ReferenceElementLength"]
+    )
+    assert np.allclose(
+        batches.values(strain), batches.values(data["ShearStretchStrain"])
+    )
+    kappa = rods.curvature(data["Director"], data["ReferenceVoronoiLength"])
+    assert np.allclose(batches.values(kappa), batches.values(data["Curvature"]))
+
+    com = rods.center_of_mass(position, data["Mass"])
+    energy = rods.kinetic_energy(
+        data["Velocity"],
+        data["Mass"],
+        data["AngularVelocity"],
+        data["MassSecondMomentOfInertia"],
+    )
+    for i, x in enumerate(position):
+        m = data["Mass"][i]
+        assert np.allclose(com[i], (x * m).sum(axis=-1) / m.sum())
+        v, w = data["Velocity"][i], data["AngularVelocity"][i]
+        j = data["MassSecondMomentOfInertia"][i]
+        expected = 0.5 * (m * v * v).sum() + 0.5 * np.einsum("in,ijn,jn", w, j, w)
+        assert energy[i] == pytest.approx(expected)
+
+    # Rods with equal number of elements are stacked over a trajectory
+    subset = s.temporal_select(CosseratRodRecordIndex([0, 2, 3]))
+    trajectory = subset.stack("Position")
+    lengths = rods.lengths(trajectory)
+    assert lengths.shape == (len(s), 3)
+    assert np.allclose(lengths[0], rods.lengths(position)[[0, 2, 3]])
+    lo, hi = rods.bounding_boxes(trajectory)
+    assert lo.shape == hi.shape == (len(s), 3, 3)
@@ -0,0 +1,125 @@
+"""Test cases for bulk reading of IO records."""
+import numpy as np
+import pytest
+
+from elastica_pipelines.io.arrays import RaggedArray
+from elastica_pipelines.io.arrays import apply
+from elastica_pipelines.io.arrays import gather
+from elastica_pipelines.io.cache import DatasetCache
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.transforms import Batched
+
+
+@pytest.fixture
+def rods_node():
+    """Gets node data for rods with different number of elements."""
+
+    def node_data(n, radius):
+        return {
+            "Position": {"data": np.arange(3 * n).reshape(3, n)},
+            "Radius": {"data": np.full(1, radius)},
+        }
+
+    return {
+        ElasticaConvention.as_system_key(0): node_data(4, 1.0),
+        ElasticaConvention.as_system_key(1): node_data(2, 2.0),
+        ElasticaConvention.as_system_key(2): node_data(4, 3.0),
+    }
+
+
+class TestRaggedArray:
+    """Test ragged arrays."""
+
+    def test_pack(self) -> None:
+        """Test packing of arrays."""
+        arrays = [np.zeros((3, 4)), np.ones((3, 2)), np.zeros((3, 0))]
+        r = RaggedArray.pack(arrays)
+        assert r.values.shape == (3, 6)
+        assert np.all(r.offsets == [0, 4, 6, 6])
+        assert np.all(r.lengths == [4, 2, 0])
+        assert len(r) == 3
+        for i, a in enumerate(r):
+            assert np.all(a == arrays[i])
+            assert a.shape == arrays[i].shape
+
+
+class TestGather:
+    """Test gathering of records into arrays."""
+
+    def test_uniform(self, rods_node) -> None:
+        """Test stacking of uniformly shaped fields.
+
+        Args:
+            rods_node : The fixture to obtain rods node data.
+        """
+        data = gather(rods_node, [2, 0], ["Radius"])
+        assert np.all(data["Radius"] == [[3.0], [1.0]])
+
+        # Without systems, fields are laid out as the field of the first system
+        data = gather(rods_node, [], ["Radius", "Position"])
+        assert data["Radius"].shape == (0, 1)
+        assert data["Radius"].dtype == np.float64
+        assert data["Position"].shape == (0, 3, 4)
+        assert data["Position"].dtype == np.arange(1).dtype
+        assert gather(rods_node, [], ["Velocity"])["Velocity"].shape == (0,)
+        assert gather({}, [], ["Radius"])["Radius"].shape == (0,)
+
+    def test_ragged(self, rods_node) -> None:
+        """Test packing of ragged fields.
+
+        Args:
+            rods_node : The fixture to obtain rods node data.
+        """
+        data = gather(rods_node, [0, 1, 2], ["Position", "Radius"])
+        position = data["Position"]
+        assert isinstance(position, RaggedArray)
+        assert np.all(position.lengths == [4, 2, 4])
+        assert np.all(position[1] == np.arange(6).reshape(3, 2))
+
+    def test_transforms(self, rods_node) -> None:
+        """Test transforms are applied on every system.
+
+        Args:
+            rods_node : The fixture to obtain rods node data.
+        """
+        cache = DatasetCache(max_bytes=1024)
+        for _ in range(2):
+            data = gather(
+                rods_node, [0, 1], ["Radius"], lambda x: 2 * x, cache.view(50)
+            )
+            assert np.all(data["Radius"] == [[2.0], [4.0]])
+        assert cache.stats().hits == 2
+
+    def test_batch_transforms(self, rods_node) -> None:
+        """Test batch transforms are applied once on stacked fields.
+
+        Args:
+            rods_node : The fixture to obtain rods node data.
+        """
+        calls = []
+
+        def double(x):
+            calls.append(x.shape)
+            return 2 * x
+
+        data = gather(rods_node, [0, 1, 2], ["Position", "Radius"], Batched(double))
+        assert np.all(data["Radius"] == [[2.0], [4.0], [6.0]])
+        # Ragged fields are transformed once, as their packed values.
+        assert np.all(data["Position"][1] == 2 * np.arange(6).reshape(3, 2))
+        assert sorted(calls) == [(3, 1), (3, 10)]
+
+        with pytest.raises(ValueError, match="lengths differ"):
+            gather(rods_node, [0, 1], ["Position"], Batched(lambda x: x[..., 1:]))
+
+        raw = np.ones(3)
+        assert apply(None, raw) is raw
+        assert np.all(apply(Batched(double), raw) == 2.0)
+
+    def test_error(self) -> None:
+        """Test fields with incompatible shapes."""
+        node = {
+            ElasticaConvention.as_system_key(0): {"x": {"data": np.zeros((3, 4))}},
+            ElasticaConvention.as_system_key(1): {"x": {"data": np.zeros((2, 4))}},
+        }
+        with pytest.raises(ValueError, match="incompatible"):
+            gather(node, [0, 1], ["x"])
@@ -0,0 +1,113 @@
+"""Test cases for export of IO selections to Arrow."""
+import gc
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from elastica_pipelines.io import CosseratRodRecordIndex
+from elastica_pipelines.io import SphereRecordIndex
+from elastica_pipelines.io.entry import series
+from tests.io.test_protocols import skip_if_env_has
+
+
+pa = pytest.importorskip("pyarrow")
+
+from elastica_pipelines.io.arrow import read  # noqa: E402
+from elastica_pipelines.io.arrow import value  # noqa: E402
+
+
+THIS_DIR = Path(__file__).parent
+METADATA_FILE = THIS_DIR / "data" / "elastica_metadata.h5"
+
+
+# Needs Accessor which needs runtime checkable
+@skip_if_env_has("typeguard")
+class TestArrow:
+    """Test export to Arrow."""
+
+    def test_rods(self, tmp_path) -> None:
+        """Test export of rods, with ragged fields.
+
+        Args:
+            tmp_path: Temporary path fixture.
+        """
+        s = series(metadata=METADATA_FILE)
+        sel = s.temporal_select(CosseratRodRecordIndex(slice(None)))
+        path = tmp_path / "rods.arrow"
+        sel.to_arrow(path, fields=["Position", "Director"], chunk_size=1)
+
+        table = read(path)
+        # Tables remain valid without references to their memory map
+        gc.collect()
+        assert table.num_rows == 2 * 4
+        assert table.schema.field("Position").type == pa.large_list(pa.float64())
+        assert table.column("iterate").to_pylist() == [50] * 4 + [100] * 4
+        assert table.column("system").to_pylist() == [0, 1, 2, 3] * 2
+        assert table.column("time").to_pylist()[4] == s.index().times[1]
+        for row in range(table.num_rows):
+            iterate = table.column("iterate")[row].as_py()
+            rod = s[iterate].cosserat_rods()[table.column("system")[row].as_py()]
+            for field in ("Position", "Director"):
+                v = value(table, field, row)
+                assert v.shape == np.shape(rod[field])
+                assert np.all(v == np.asarray(rod[field]))
+
+    def test_batches(self, tmp_path) -> None:
+        """Test export in record batches.
+
+        Args:
+            tmp_path: Temporary path fixture.
+        """
+        s = series(metadata=METADATA_FILE, transforms=lambda x: 2 * np.asarray(x))
+        sel = s.temporal_select(SphereRecordIndex([4, 1]))
+        for chunk_size, n_batches in ((1, 2), (5, 1)):
+            path = tmp_path / f"spheres_{chunk_size}.arrow"
+            sel.to_arrow(path, fields=["Position"], chunk_size=chunk_size)
+            with pa.memory_map(str(path), "r") as source:
+                assert pa.ipc.open_file(source).num_record_batches == n_batches
+
+            table = read(path)
+            assert table.column("system").to_pylist() == [4, 1, 4, 1]
+            expected = sel.stack("Position")
+            for row in range(table.num_rows):
+                assert np.all(
+                    value(table, "Position", row) == expected[row // 2][row % 2]
+                )
+
+    def test_errors(self, tmp_path) -> None:
+        """Test invalid export.
+
+        Args:
+            tmp_path: Temporary path fixture.
+        """
+        sel = series(metadata=METADATA_FILE).temporal_select(SphereRecordIndex(0))
+        with pytest.raises(ValueError, match="positive"):
+            sel.to_arrow(tmp_path / "a.arrow", fields=["Position"], chunk_size=0)
+
+        with pytest.raises(KeyError):
+            sel.to_arrow(tmp_path / "a.arrow", fields=["Unknown"])
+        assert not (tmp_path / "a.arrow").exists()
+
+    def test_empty(self, tmp_path) -> None:
+        """Test export of selections without rows.
+
+        Args:
+            tmp_path: Temporary path fixture.
+        """
+        s = series(metadata=METADATA_FILE)
+        rods = s.temporal_select(CosseratRodRecordIndex(slice(None)))
+        rods.to_arrow(tmp_path / "rods.arrow", fields=["Position", "Director"])
+        expected = read(tmp_path / "rods.arrow").schema
+
+        selections = [
+            s.temporal_select(CosseratRodRecordIndex([])),
+            s.temporal_select(CosseratRodRecordIndex(slice(10, None))),
+            rods[1000:],
+        ]
+        for i, sel in enumerate(selections):
+            path = tmp_path / f"empty_{i}.arrow"
+            sel.to_arrow(path, fields=["Position", "Director"], chunk_size=1)
+            table = read(path)
+            assert table.num_rows == 0
+            assert table.schema.equals(expected, check_metadata=True)
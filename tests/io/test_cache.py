@@ -0,0 +1,87 @@
+"""Test cases for caching of IO data."""
+import numpy as np
+import pytest
+
+from elastica_pipelines.io.cache import CacheStats
+from elastica_pipelines.io.cache import DatasetCache
+
+
+class Loader:
+    """Loads arrays and counts the number of loads."""
+
+    def __init__(self, n: int) -> None:  # noqa
+        self.n = n
+        self.loads = 0
+
+    def __call__(self):  # noqa
+        self.loads += 1
+        return np.zeros(self.n)
+
+
+class TestDatasetCache:
+    """Test dataset caches."""
+
+    def test_get(self) -> None:
+        """Test reads from the cache."""
+        cache = DatasetCache(max_bytes=1024)
+        load = Loader(4)
+        a = cache.get("a", load)
+        assert cache.get("a", load) is a
+        assert load.loads == 1
+        assert len(cache) == 1
+        assert cache.stats() == CacheStats(
+            hits=1, misses=1, evictions=0, entries=1, nbytes=32
+        )
+
+        # Cached arrays are read-only
+        with pytest.raises(ValueError):
+            a[0] = 1.0
+
+    def test_eviction(self) -> None:
+        """Test least-recently-used arrays are evicted."""
+        cache = DatasetCache(max_bytes=64)
+        load = Loader(4)
+        cache.get("a", load)
+        cache.get("b", load)
+        # a is now more recently used than b
+        cache.get("a", load)
+        cache.get("c", load)
+        assert cache.stats() == CacheStats(
+            hits=1, misses=3, evictions=1, entries=2, nbytes=64
+        )
+        cache.get("a", load)
+        assert load.loads == 3
+        cache.get("b", load)
+        assert load.loads == 4
+
+    def test_too_large(self) -> None:
+        """Test arrays larger than the cache are not cached."""
+        cache = DatasetCache(max_bytes=16)
+        load = Loader(4)
+        assert cache.get("a", load).shape == (4,)
+        cache.get("a", load)
+        assert load.loads == 2
+        assert len(cache) == 0
+
+    def test_clear(self) -> None:
+        """Test clearing of the cache."""
+        cache = DatasetCache(max_bytes=1024)
+        cache.get("a", Loader(4))
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats().nbytes == 0
+
+    def test_view(self) -> None:
+        """Test views of the cache."""
+        cache = DatasetCache(max_bytes=1024)
+        view = cache.view(50).view("CosseratRod")
+        load = Loader(2)
+        view.get((0, "Position"), load)
+        assert (50, "CosseratRod", (0, "Position")) in cache.arrays
+        cache.view(50, "CosseratRod").get((0, "Position"), load)
+        assert load.loads == 1
+
+    def test_error(self) -> None:
+        """Test invalid caches."""
+        with pytest.raises(ValueError, match="negative"):
+            DatasetCache(max_bytes=-1)
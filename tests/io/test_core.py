@@ -1,8 +1,11 @@
 """Test cases for core IO."""
 from typing import Type
 
+import numpy as np
 import pytest
 
+from elastica_pipelines.io.cache import DatasetCache
+from elastica_pipelines.io.core import DatasetView
 from elastica_pipelines.io.core import RecordsIndexedOp
 from elastica_pipelines.io.core import RecordsSliceOp
 from elastica_pipelines.io.core import SystemRecord
@@ -10,6 +13,8 @@ from elastica_pipelines.io.core import SystemRecords
 from elastica_pipelines.io.core import SystemRecordsSlice
 from elastica_pipelines.io.core import _validate
 from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.stats import Recorder
+from elastica_pipelines.io.transforms import Batched
 from elastica_pipelines.io.typing import Record
 from elastica_pipelines.io.typing import RecordsSlice
 from tests.io.test_protocols import _Traits
@@ -48,6 +53,17 @@ class TestSystemRecord:
         assert ys["k1"] == 20
         assert ys["k2"] == 40
 
+    def test_to_arrays(self, node_v) -> None:
+        """Test bulk reading into arrays.
+
+        Args:
+            node_v : The fixture to obtain parents.
+        """
+        s = SystemRecords(node_v, transforms=lambda x: x + 1)
+        data = s.to_arrays(["k1", "k2"])
+        assert np.all(data["k1"] == [6, 21, 31])
+        assert np.all(data["k2"] == [11, 41, 61])
+
     def test_transforms(self, node_v) -> None:
         """Test transformation.
 
@@ -62,6 +78,127 @@ class TestSystemRecord:
         assert s["k1"] == trafo(5)
         assert s["k2"] == trafo(10)
 
+    def test_cache(self, node_v) -> None:
+        """Test caching of raw data.
+
+        Args:
+            node_v : The fixture to obtain parents.
+        """
+        cache = DatasetCache(max_bytes=1024)
+        s = SystemRecord(
+            node_v, sys_id=1, transforms=lambda x: x + 2, cache=cache.view(50)
+        )
+        assert s["k1"] == 22
+        assert s["k1"] == 22
+        # Raw data is cached, not transformed data
+        assert cache.arrays[(50, (1, "k1"))] == 20
+        assert cache.stats().hits == 1
+
+    def test_read_into(self, node_v) -> None:
+        """Test reading into preallocated arrays.
+
+        Args:
+            node_v : The fixture to obtain parents.
+        """
+        out = np.empty(())
+        assert SystemRecord(node_v, sys_id=1).read_into("k2", out) is out
+        assert out == 40
+
+        s = SystemRecord(node_v, sys_id=2, transforms=lambda x: x + 2)
+        assert s.read_into("k1", out) == 32
+
+        s = SystemRecord(node_v, sys_id=0, cache=DatasetCache(1024).view(50))
+        assert s.read_into("k1", out) == 5
+
+        with pytest.raises(ValueError, match="shape"):
+            s.read_into("k1", np.empty(2))
+
+    def test_read_into_direct(self) -> None:
+        """Test reading directly into preallocated arrays."""
+
+        class Dataset:
+            shape = (2,)
+
+            def read_direct(self, out):
+                out[:] = 7.0
+
+        node = {ElasticaConvention.as_system_key(0): {"k": {"data": Dataset()}}}
+        out = np.empty(2)
+        SystemRecord(node, sys_id=0).read_into("k", out)
+        assert np.all(out == 7.0)
+
+        # Transforms are applied to the data read directly
+        s = SystemRecord(node, sys_id=0, transforms=lambda x: x + 1)
+        assert np.all(s.read_into("k", out) == 8.0)
+        s = SystemRecord(node, sys_id=0, transforms=np.asarray)
+        assert s.read_into("k", out) is out
+        assert np.all(out == 7.0)
+        s = SystemRecord(node, sys_id=0, transforms=lambda x: x[:1])
+        with pytest.raises(ValueError, match="transformed"):
+            s.read_into("k", out)
+
+    def test_view(self) -> None:
+        """Test lazy views of fields."""
+        data = np.arange(24.0).reshape(2, 3, 4)
+        node = {ElasticaConvention.as_system_key(0): {"k": {"data": data}}}
+        view = SystemRecord(node, sys_id=0).view("k")
+        assert isinstance(view, DatasetView)
+        assert view.shape == (2, 3, 4) and view.ndim == 3 and len(view) == 2
+        assert view.dtype == np.float64
+        assert "DatasetView" in repr(view)
+        assert np.all(np.asarray(view) == data)
+
+        keys = [
+            -1,
+            (slice(None), -1),
+            (slice(None), slice(None, None, 2)),
+            (slice(None), slice(None, None, -2)),
+            (Ellipsis, slice(1, 3)),
+            (0, Ellipsis, slice(3, 0, -1)),
+            (slice(None), slice(2, 1)),
+            (slice(None), slice(1, 2, -1)),
+            (slice(None), [0, 2]),
+            (None, 1),
+            np.array([1, 0]),
+            np.array([False, True]),
+        ]
+        for key in keys:
+            assert np.all(view[key] == data[key])
+
+        for key in [(0, 0, 0, 0), (slice(None), 3), (Ellipsis, 0, Ellipsis)]:
+            with pytest.raises(IndexError):
+                view[key]
+
+    def test_view_transforms(self) -> None:
+        """Test lazy views compose with transforms."""
+        data = np.arange(12.0).reshape(3, 4)
+        node = {ElasticaConvention.as_system_key(0): {"k": {"data": data}}}
+        transforms = [
+            Batched(lambda x: 2 * x, elementwise=True),
+            Batched(lambda x: x.T),
+            lambda x: np.asarray(x) - np.mean(x),
+        ]
+        for transform in transforms:
+            view = SystemRecord(node, sys_id=0, transforms=transform).view("k")
+            for key in [(slice(None), -1), (slice(None, None, -2), 0)]:
+                assert np.allclose(view[key], transform(data)[key])
+
+    def test_view_pushdown(self) -> None:
+        """Test only the elements indexed by lazy views are read."""
+        data = np.arange(12.0).reshape(3, 4)
+        node = {ElasticaConvention.as_system_key(0): {"k": {"data": data}}}
+        recorder = Recorder()
+        view = SystemRecord(node, sys_id=0, recorder=recorder).view("k")
+        view[:, -1]
+        assert recorder.stats().bytes_read == 3 * 8
+        assert recorder.stats().datasets_opened == 1
+
+        recorder.reset()
+        transform = Batched(lambda x: x.T)
+        view = SystemRecord(node, 0, transform, recorder=recorder).view("k")
+        view[:, -1]
+        assert recorder.stats().bytes_read == data.nbytes
+
     def test_len(self, node_v) -> None:
         """Test length.
 
@@ -426,6 +563,16 @@ class TestSystemRecordsSlice:
         test(sl[[0, 1]])
 
     @skip_if_env_has("typeguard")
+    def test_to_arrays(self, records_v) -> None:
+        """Test bulk reading of slices into arrays.
+
+        Args:
+            records_v : The fixture to obtain records.
+        """
+        assert np.all(records_v[1:].to_arrays(["k1"])["k1"] == [20, 30])
+        assert np.all(records_v[::2].to_arrays(["k1"])["k1"] == [5, 30])
+        assert np.all(records_v[[2, 0]].to_arrays(["k2"])["k2"] == [60, 10])
+
     def test_getitem_type_error(self, records_v) -> None:
         """Getitem type error test.
 
@@ -1,18 +1,64 @@
 """Tests the entry points into IO module."""
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
 from pathlib import Path
 
+import h5py
+import numpy as np
 import pytest
 
+from elastica_pipelines.io import CosseratRodRecordIndex
+from elastica_pipelines.io.entry import _load_index
 from elastica_pipelines.io.entry import series
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.stats import IOStats
+from elastica_pipelines.io.stats import record
+from elastica_pipelines.io.temporal import LiveSeries
+from elastica_pipelines.io.transforms import Batched
+from elastica_pipelines.io.transforms import MemMap
+from elastica_pipelines.io.transforms import ToArray
 from tests.io.test_protocols import skip_if_env_has
 
 
 THIS_DIR = Path(__file__).parent
 
 
+def n_rods(snapshot):
+    """Number of rods in a snapshot."""
+    return len(snapshot.rods())
+
+
+def rod_position(rod):
+    """Position of a rod as an array."""
+    return np.asarray(rod["Position"])
+
+
+@pytest.fixture
+def data_dir(tmp_path) -> Path:
+    """Copies the test data to a temporary directory.
+
+    Args:
+        tmp_path: Temporary path fixture.
+
+    Returns:
+        Path of the directory with data.
+    """
+    for f in (THIS_DIR / "data").glob("elastica_*.h5"):
+        shutil.copy(f, tmp_path)
+    return tmp_path
+
+
 def iterate_series_metadata(metadata_file):
     """Iterate over a series with metadata."""
-    for t, snapshot in series(metadata=metadata_file).items():
+    iterate_series_metadata_like(series(metadata=metadata_file))
+
+
+def iterate_series_metadata_like(s):
+    """Iterate over a series."""
+    for t, snapshot in s.items():
         assert t.iterate > 0
         for rod_id, rod in snapshot.cosserat_rods().items():
             assert rod_id >= 0
@@ -57,11 +103,61 @@ class TestSeriesEntry:
             iterate_series_metadata(metadata_file)
         metadata_file.unlink()
 
-    def test_series_pattern(self):
+    def test_series_pattern_throw(self, data_dir):
+        """Test series with incorrect pattern."""
+        with pytest.raises(FileNotFoundError):
+            series(file_pattern="elastica_%T.h5")
+
+        with pytest.raises(FileNotFoundError):
+            series(file_pattern=str(data_dir / "elastica_rod_%T.h5"))
+
+        with pytest.raises(ValueError, match="%T"):
+            series(file_pattern=str(data_dir / "elastica_*.h5"))
+
+        (data_dir / "elastica_000150.yml").touch()
+        with pytest.raises(RuntimeError, match="Unsupported"):
+            series(file_pattern=str(data_dir / "elastica_%T.yml"))
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_pattern(self, data_dir):
         """Test series with pattern file."""
-        with pytest.raises(NotImplementedError):
-            file_pattern = "elastica_%T.h5"
-            series(file_pattern=file_pattern)
+        s = series(file_pattern=str(data_dir / "elastica_%T.h5"))
+        # Metadata files do not match the pattern
+        assert len(s) == 2
+        assert [k.iterate for k in s.keys()] == [50, 100]
+        assert all(np.isnan(k.time) and np.isnan(k.dt) for k in s.keys())
+        assert list(s.node) == [ElasticaConvention.as_record_key(i) for i in (50, 100)]
+
+        md = series(metadata=data_dir / "elastica_metadata.h5")
+        for it in (50, 100):
+            a, b = s[it].systems(), md[it].systems()
+            assert list(a.keys()) == list(b.keys())
+            for k in a:
+                assert list(a[k].keys()) == list(b[k].keys())
+                assert np.all(a[k]["Position"][()] == b[k]["Position"][()])
+
+        iterate_series_metadata_like(s)
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_pattern_max_open_files(self, data_dir):
+        """Test series with pattern file, with a bounded number of open files."""
+        s = series(file_pattern=str(data_dir / "elastica_%T.h5"), max_open_files=1)
+        rods = s[50].cosserat_rods()
+        position = rods[0]["Position"][()]
+        assert len(rods.node.pool) == 1
+
+        # Reading another file releases the first file from the pool...
+        s[100].cosserat_rods()[0]["Position"][()]
+        assert len(rods.node.pool) == 1
+        assert data_dir / "elastica_000050.h5" not in rods.node.pool
+
+        # ... but nodes from the first file remain valid.
+        assert np.all(rods[0]["Position"][()] == position)
+        assert len(rods) == 4
+
+        assert list(s.map(n_rods, processes=2).values()) == [4, 4]
 
     # Needs Accessor which needs runtime checkable
     @skip_if_env_has("typeguard")
@@ -69,3 +165,375 @@ class TestSeriesEntry:
         """Tests series with metadata file."""
         metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
         iterate_series_metadata(metadata_file)
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_read_into(self):
+        """Tests reading fields into arrays across a series with metadata file."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        s = series(metadata=metadata_file)
+        subset = s.temporal_select(CosseratRodRecordIndex([0, 2]))
+        out = np.empty((len(subset), 2, 3, 11))
+        subset.read_into("Position", out)
+        assert np.all(out == subset.stack("Position"))
+
+        rod = s[50].cosserat_rods()[1]
+        out = np.empty((3, 17))
+        assert np.all(rod.read_into("Position", out) == rod_position(rod))
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_stack(self):
+        """Tests stacking fields across a series with metadata file."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        s = series(metadata=metadata_file)
+        subset = s.temporal_select(CosseratRodRecordIndex([0, 2]))
+        stacked = subset.stack("Position")
+        assert stacked.shape == (2, 2, 3, 11)
+        for t, (_, rods) in enumerate(subset.iterations()):
+            assert np.all(stacked[t, 0] == rods[0]["Position"])
+            assert np.all(stacked[t, 1] == rods[1]["Position"])
+
+        # Rod 1 has a different number of elements.
+        with pytest.raises(ValueError, match="differ"):
+            s.temporal_select(CosseratRodRecordIndex([0, 1])).stack("Position")
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_sidecar(self, data_dir):
+        """Tests series with a sidecar index."""
+        metadata_file = data_dir / "elastica_metadata.h5"
+        sidecar_file = data_dir / "elastica_metadata.index.npz"
+        keys = list(series(metadata=metadata_file).keys())
+
+        s = series(metadata=metadata_file, sidecar=True)
+        assert sidecar_file.exists()
+        assert list(s.keys()) == keys
+
+        # Index is loaded from the sidecar
+        s = series(metadata=metadata_file, sidecar=True)
+        assert s._index is not None
+        assert list(s.keys()) == keys
+
+        # Stale sidecars are rebuilt
+        stat = metadata_file.stat()
+        os.utime(metadata_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        assert _load_index(metadata_file) is None
+        assert list(series(metadata=metadata_file, sidecar=True).keys()) == keys
+        assert _load_index(metadata_file) is not None
+
+        # Corrupt sidecars are ignored
+        sidecar_file.write_bytes(b"corrupt")
+        s = series(metadata=metadata_file, sidecar=True)
+        assert list(s.keys()) == keys
+
+        # Sidecars which cannot be written are skipped
+        sidecar_file.unlink()
+        sidecar_file.mkdir()
+        s = series(metadata=metadata_file, sidecar=True)
+        assert list(s.keys()) == keys
+        assert sidecar_file.is_dir()
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_at_time(self):
+        """Tests time-based lookup in series with metadata file."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        s = series(metadata=metadata_file)
+
+        def position(snap):
+            return np.asarray(snap.cosserat_rods()[1]["Position"])
+
+        assert np.all(position(s.at_time(60.0)) == position(s[50]))
+        assert np.all(position(s.at_time(60.0, method="before")) == position(s[50]))
+        assert np.allclose(
+            position(s.at_time(75.0, method="interpolate")),
+            0.5 * (position(s[50]) + position(s[100])),
+        )
+        assert [k.iterate for k in s.time_range(60.0, 100.0).keys()] == [100]
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_prefetch(self):
+        """Tests prefetched iterations of series with metadata file."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        s = series(metadata=metadata_file)
+        lazy = list(s.iterations())
+        prefetched = list(s.iterations(prefetch=2, workers=2, fields=["Position"]))
+        assert [t for t, _ in lazy] == [t for t, _ in prefetched]
+        for i, (_, a) in enumerate(lazy):
+            b = prefetched[i][1]
+            assert len(a.systems()) == len(b.systems())
+            for k in a.systems():
+                assert np.all(
+                    a.systems()[k]["Position"][()] == b.systems()[k]["Position"]
+                )
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_map(self):
+        """Tests mapping with processes over series with metadata file."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        s = series(metadata=metadata_file)
+        results = s.map(n_rods, processes=2)
+        assert results == {k: n_rods(v) for k, v in s.items()}
+
+        sel = s.temporal_select(CosseratRodRecordIndex(1))
+        results = sel.map(rod_position, processes=2, chunksize=2)
+        assert list(results.keys()) == list(s.keys())
+        for k, v in results.items():
+            assert np.all(v == rod_position(sel[k]))
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_pool(self, data_dir):
+        """Tests series with metadata file, with linked files opened from a pool."""
+        metadata_file = data_dir / "elastica_metadata.h5"
+        s = series(metadata=metadata_file)
+        iterate_series_metadata_like(s)
+        # Nodes of records resolve their file once, later reads reuse the handles.
+        hits = s.node.pool.stats().hits
+        assert len(s[50].cosserat_rods()) == 4
+        stats = s.node.pool.stats()
+        assert stats.misses == 2
+        assert stats.hits == hits + 1
+        assert stats.evictions == 0
+        assert stats.open == 2
+
+        s = series(metadata=metadata_file, max_open_files=1)
+        iterate_series_metadata_like(s)
+        stats = s.node.pool.stats()
+        assert stats.misses == 2
+        assert stats.evictions == 1
+        assert stats.open == 1
+
+        # Records link their data to the time-series files, other groups are kept.
+        record = s.node[ElasticaConvention.as_record_key(50)]
+        assert list(record) == ["TimeMetadata", "data"]
+        assert len(record["TimeMetadata"]) == 3
+
+        s = series(metadata=metadata_file, max_idle=0.0)
+        rods = s[50].cosserat_rods()
+        position = rods[0]["Position"][()]
+        s[100].cosserat_rods()[0]["Position"][()]
+        s.node.pool.release_idle()
+        assert s.node.pool.stats().open == 0
+        assert np.all(rods[0]["Position"][()] == position)
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_cache(self):
+        """Tests series with metadata file, with a dataset cache."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        s = series(metadata=metadata_file, cache_bytes=2**20)
+        iterate_series_metadata_like(s)
+        stats = s.cache.stats()
+        assert stats.hits == 0
+        assert stats.misses > 0
+        iterate_series_metadata_like(s)
+        assert s.cache.stats().hits == stats.misses
+        assert s.cache.stats().misses == stats.misses
+
+        assert series(metadata=metadata_file).cache is None
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_stats(self):
+        """Tests IO statistics of series with metadata file."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        s = series(
+            metadata=metadata_file,
+            transforms=np.asarray,
+            cache_bytes=2**20,
+            stats=True,
+        )
+        assert s.stats() == IOStats()
+
+        with record() as recorder:
+            for _, snapshot in s.iterations():
+                snapshot.cosserat_rods()[0]["Position"]
+        counted = s.stats()
+        assert recorder.stats() == counted
+        assert counted.keys_read == 2
+        assert counted.files_opened == 2
+        assert counted.datasets_opened == 2
+        assert counted.reads == 2 * 2 + 2
+        assert counted.bytes_read == 2 * 16 + 2 * 3 * 11 * 8
+        assert counted.cache_misses == 2
+        assert counted.cache_hits == 0
+        assert counted.read_time > 0
+        assert counted.transform_time > 0
+
+        # Views share statistics with their series
+        view = s.time_range(0.0, np.inf)
+        view[50].cosserat_rods()[0]["Position"]
+        assert s.stats().cache_hits == view.stats().cache_hits == 1
+
+        # Reads of lazy datasets are counted by bulk reads
+        lazy = series(metadata=metadata_file, stats=True)
+        lazy[50].cosserat_rods()[0]["Position"]
+        assert lazy.stats().datasets_opened == 1
+        assert lazy.stats().reads == 0
+        lazy.temporal_select(CosseratRodRecordIndex(0)).stack("Position")
+        lazy[50].cosserat_rods().to_arrays(["Position"])
+        assert lazy.stats().reads == 2 + 4
+        out = np.empty((3, 11))
+        lazy[50].cosserat_rods()[0].read_into("Position", out)
+        assert lazy.stats().bytes_read == (2 + 1) * out.nbytes + 3 * 11 * 8 + (
+            3 * 17 * 8 + 2 * 3 * 11 * 8
+        )
+        # Keys are read for prefetching, along with positions of 15 systems
+        list(lazy.iterations(prefetch=1, fields=["Position"]))
+        assert lazy.stats().reads == 2 + 4 + 1 + 2 * 2 + 2 * 15
+
+        # Series without statistics only record within ``record``
+        plain = series(metadata=metadata_file)
+        assert plain.recorder is None
+        with pytest.raises(RuntimeError, match="stats=True"):
+            plain.stats()
+        with record() as recorder:
+            plain.index()
+        assert recorder.stats().keys_read == 2
+        assert recorder.stats().bytes_read == 2 * 16
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_batch_transforms(self):
+        """Tests batch transforms are applied once to data read in bulk."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        rotation = np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        calls = []
+
+        def rotate(x):
+            calls.append(x.shape)
+            return np.einsum("ij,...jk->...ik", rotation, x)
+
+        raw = series(metadata=metadata_file).temporal_select(
+            CosseratRodRecordIndex([0, 2])
+        )
+        s = series(metadata=metadata_file, transforms=Batched(rotate), stats=True)
+        subset = s.temporal_select(CosseratRodRecordIndex([0, 2]))
+        expected = np.einsum("ij,tsjk->tsik", rotation, raw.stack("Position"))
+
+        assert np.allclose(subset.stack("Position"), expected)
+        assert calls == [(2, 2, 3, 11)]
+        out = np.empty((2, 2, 3, 11))
+        assert np.allclose(subset.read_into("Position", out), expected)
+        assert len(calls) == 2
+        assert s.stats().transform_time > 0
+
+        # Per-record access still applies the transform to every field
+        assert np.allclose(subset[50][0]["Position"], expected[0, 0])
+        assert calls[-1] == (3, 11)
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_view(self):
+        """Tests lazy views of fields select hyperslabs of HDF5 datasets."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        rod = series(metadata=metadata_file)[50].cosserat_rods()[1]
+        position = np.asarray(rod["Position"])
+        view = rod.view("Position")
+        for key in [(slice(None), -1), (slice(None), slice(None, None, -5)), 0]:
+            assert np.all(view[key] == position[key])
+
+        s = series(metadata=metadata_file, transforms=ToArray(), stats=True)
+        view = s[50].cosserat_rods()[1].view("Position")
+        before = s.stats()
+        assert np.all(view[:, ::10] == position[:, ::10])
+        assert (s.stats() - before).bytes_read == 3 * 2 * 8
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_to_arrays(self):
+        """Tests bulk reading of records from series with metadata file."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        s = series(metadata=metadata_file)
+        rods = s[50].cosserat_rods()
+        data = rods.to_arrays(["Position"])
+        position = data["Position"]
+        assert np.all(position.lengths == [11, 17, 11, 11])
+        for i in range(len(rods)):
+            assert np.all(position[i] == np.asarray(rods[i]["Position"]))
+        assert np.all(rods[2:].to_arrays(["Position"])["Position"][0] == position[2])
+
+        spheres = s[50].spheres().to_arrays(["Position"])["Position"]
+        assert spheres.shape[0] == 11
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_memmap(self):
+        """Tests memory-mapped reading from series with metadata file."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        rods = series(metadata=metadata_file)[50].cosserat_rods()
+        mapped = series(metadata=metadata_file, transforms=MemMap())
+        mapped_rods = mapped[50].cosserat_rods()
+        for i in range(len(rods)):
+            position = mapped_rods[i]["Position"]
+            assert isinstance(position, np.memmap)
+            assert np.all(position == rod_position(rods[i]))
+
+        # Views are mapped with the transform only
+        tip = mapped_rods[0].view("Position")[:, -1]
+        assert not tip.flags.owndata and not tip.flags.writeable
+        assert np.all(tip == rod_position(rods[0])[:, -1])
+        assert rods[0].view("Position")[:, -1].flags.writeable
+
+        # Other transforms are passed datasets, not mapped into memory
+        s = series(metadata=metadata_file, transforms=lambda x: x)
+        position = s[50].cosserat_rods()[0]["Position"]
+        assert isinstance(position, h5py.Dataset)
+        assert position.name.endswith("Position/data")
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_async(self):
+        """Tests asynchronous reads from series with metadata file."""
+        metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+        s = series(metadata=metadata_file)
+
+        async def read():
+            return [(t, snap) async for t, snap in s.aiterations(fields=["Position"])]
+
+        iterations = asyncio.run(read())
+        assert [t for t, _ in iterations] == list(s.keys())
+        for t, snap in iterations:
+            rods = s[t].cosserat_rods()
+            for i, rod in snap.cosserat_rods().items():
+                assert np.all(rod["Position"] == rod_position(rods[i]))
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_series_metadata_follow(self, data_dir):
+        """Tests following records appended to a metadata file."""
+        metadata_file = data_dir / "elastica_metadata.h5"
+        s = series(metadata=metadata_file, follow=True, poll_interval=0.01, timeout=1.0)
+        assert isinstance(s, LiveSeries)
+
+        # Append a record from another process, as a simulation would.
+        append = (
+            "import h5py\n"
+            f"with h5py.File({str(metadata_file)!r}, 'a') as f:\n"
+            "    f.copy('0000000100', '0000000150')\n"
+            "    f['0000000150/TimeMetadata/time'][()] = 150.0\n"
+        )
+        iterates = []
+        snapshots = []
+        for t, snapshot in s.iterations():
+            iterates.append(t.iterate)
+            snapshots.append(snapshot)
+            assert n_rods(snapshot) == 4
+            if t.iterate == 100:
+                subprocess.run([sys.executable, "-c", append], check=True)
+        assert iterates == [50, 100, 150]
+        assert s.index().times[-1] == 150.0
+        # Snapshots held over many polls remain readable
+        assert all(n_rods(snapshot) == 4 for snapshot in snapshots)
+
+        # Metadata files reopened on polls are closed with the series
+        f, handle = s.node.handles
+        s.close()
+        assert not f.id.valid and handle.closed
+
+        with pytest.raises(ValueError, match="followed"):
+            series(file_pattern=str(data_dir / "elastica_%T.h5"), follow=True)
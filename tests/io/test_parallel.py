@@ -0,0 +1,208 @@
+"""Test cases for concurrent reading of IO types."""
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from elastica_pipelines.io import parallel
+from elastica_pipelines.io.parallel import Limiter
+from elastica_pipelines.io.parallel import aprefetch
+from elastica_pipelines.io.parallel import load
+from elastica_pipelines.io.parallel import prefetch
+from elastica_pipelines.io.protocols import ElasticaConvention
+
+
+@pytest.fixture
+def snapshot_node():
+    """Gets node data for a snapshot with arrays."""
+
+    def wrap(x):
+        return {"data": x}
+
+    return {
+        "CosseratRod": {
+            ElasticaConvention.as_system_key(0): {
+                "Position": wrap(np.zeros((3, 4))),
+                "Velocity": wrap(np.ones((3, 4))),
+            }
+        },
+        "Sphere": {
+            ElasticaConvention.as_system_key(0): {"Radius": wrap(np.ones(1))},
+        },
+    }
+
+
+def test_load(snapshot_node) -> None:
+    """Test loading of node data into memory.
+
+    Args:
+        snapshot_node : The fixture to obtain snapshot node data.
+    """
+    node, nbytes = load(snapshot_node)
+    assert nbytes == (12 + 12 + 1) * 8
+    rod = node["CosseratRod"][ElasticaConvention.as_system_key(0)]
+    assert np.all(rod["Velocity"]["data"] == 1.0)
+
+    node, nbytes = load(snapshot_node, fields=["Position", "Radius"])
+    assert nbytes == (12 + 1) * 8
+    rod = node["CosseratRod"][ElasticaConvention.as_system_key(0)]
+    assert list(rod.keys()) == ["Position"]
+    sphere = node["Sphere"][ElasticaConvention.as_system_key(0)]
+    assert list(sphere.keys()) == ["Radius"]
+
+
+class CountingKeys:
+    """Iterable of keys that counts the number of keys drawn."""
+
+    def __init__(self, n: int) -> None:  # noqa
+        self.n = n
+        self.drawn = 0
+
+    def __iter__(self):  # noqa
+        for k in range(self.n):
+            self.drawn += 1
+            yield k
+
+
+class TestPrefetch:
+    """Test prefetching."""
+
+    def test_order(self) -> None:
+        """Test values are yielded in order."""
+        values = list(prefetch(range(20), lambda k: (k * k, 1), depth=3, workers=4))
+        assert values == [(k, k * k) for k in range(20)]
+
+    def test_depth(self) -> None:
+        """Test values are not fetched beyond the depth."""
+        keys = CountingKeys(10)
+        for k, _ in prefetch(keys, lambda k: (k, 1), depth=3):
+            assert keys.drawn == min(10, k + 3)
+
+    def test_max_bytes(self) -> None:
+        """Test values are not fetched beyond the byte budget."""
+        keys = CountingKeys(10)
+        for k, _ in prefetch(keys, lambda k: (k, 10), depth=5, max_bytes=25):
+            # A single value is fetched until the size of values is known
+            assert keys.drawn == (1 if k == 0 else min(10, k + 2))
+
+        # At least one value is fetched ahead.
+        values = list(prefetch(range(4), lambda k: (k, 10), depth=5, max_bytes=5))
+        assert values == [(k, k) for k in range(4)]
+
+    def test_close(self) -> None:
+        """Test values are not fetched after iteration stops."""
+        keys = CountingKeys(10)
+        it = prefetch(keys, lambda k: (k, 1), depth=2)
+        assert next(it) == (0, 0)
+        it.close()
+        assert keys.drawn == 2
+
+    def test_errors(self) -> None:
+        """Test invalid arguments."""
+        with pytest.raises(ValueError, match="positive"):
+            next(prefetch(range(2), lambda k: (k, 1), depth=0))
+
+        with pytest.raises(ValueError, match="positive"):
+            next(prefetch(range(2), lambda k: (k, 1), depth=1, workers=0))
+
+
+async def collect(it):
+    """Collect values of an asynchronous iterator."""
+    return [v async for v in it]
+
+
+class TestAsyncPrefetch:
+    """Test asynchronous prefetching."""
+
+    def test_order(self) -> None:
+        """Test values are yielded in order."""
+        values = asyncio.run(collect(aprefetch(range(20), lambda k: (k * k, 1), 3)))
+        assert values == [(k, k * k) for k in range(20)]
+
+    def fetcher(self):
+        """Fetches keys, tracking the maximum number of concurrent fetches.
+
+        Returns:
+            Fetch, and number of running fetches and their maximum.
+        """
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def fetch(k):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            threading.Event().wait(0.01)
+            with lock:
+                running[0] -= 1
+            return k, 1
+
+        return fetch, running
+
+    def test_concurrency(self) -> None:
+        """Test values are not fetched beyond the concurrency limit."""
+        fetch, running = self.fetcher()
+        asyncio.run(collect(aprefetch(range(10), fetch, 2)))
+        assert 1 <= running[1] <= 2
+
+    def test_limiter(self) -> None:
+        """Test fetches hold the limiter shared with other fetches."""
+        fetch, running = self.fetcher()
+
+        async def fetch_all():
+            limiter = asyncio.Semaphore(1)
+            values = await collect(aprefetch(range(10), fetch, 4, limiter=limiter))
+            return values, limiter.locked()
+
+        values, locked = asyncio.run(fetch_all())
+        assert values == [(k, k) for k in range(10)]
+        assert running[1] == 1
+        assert not locked
+
+    def test_close(self) -> None:
+        """Test values are not fetched after iteration stops."""
+        keys = CountingKeys(10)
+
+        async def first():
+            it = aprefetch(keys, lambda k: (k, 1), 2)
+            value = await it.__anext__()
+            await it.aclose()
+            return value
+
+        assert asyncio.run(first()) == (0, 0)
+        assert keys.drawn == 2
+
+    def test_errors(self) -> None:
+        """Test invalid arguments."""
+        with pytest.raises(ValueError, match="positive"):
+            asyncio.run(collect(aprefetch(range(2), lambda k: (k, 1), 0)))
+
+        with pytest.raises(ValueError, match="positive"):
+            Limiter(0)
+
+
+def test_limiter() -> None:
+    """Test limiters across event loops."""
+    limiter = Limiter(3)
+
+    async def semaphore():
+        return limiter()
+
+    a = asyncio.run(semaphore())
+    b = asyncio.run(semaphore())
+    assert a is not b
+
+    async def same():
+        return limiter() is limiter()
+
+    assert asyncio.run(same())
+
+
+def test_worker_source() -> None:
+    """Test workers open their source once and apply functions to its values."""
+    parallel._open_source(lambda: {"a": 1, "b": 2})
+    try:
+        assert parallel._apply(lambda x: 10 * x, "b") == 20
+    finally:
+        parallel._worker_source.clear()
@@ -0,0 +1,175 @@
+"""Test cases for pooling of file handles."""
+import gc
+from pathlib import Path
+
+import h5py
+import pytest
+
+from elastica_pipelines.io.pool import FilePool
+from elastica_pipelines.io.pool import PooledNode
+from elastica_pipelines.io.pool import PoolStats
+
+
+THIS_DIR = Path(__file__).parent
+
+
+class FakeFile(dict):
+    """Dictionary with a file-like close."""
+
+    def __init__(self, path, *args, **kwargs) -> None:  # noqa
+        super().__init__(*args, **kwargs)
+        self.path = path
+        self.closed = False
+
+    def close(self) -> None:
+        """Closes the file."""
+        self.closed = True
+
+
+def fake_opener(path):
+    """Opens a fake file with nested data."""
+    return FakeFile(path, {"group": {"leaf": str(path)}, "value": 2})
+
+
+class TestFilePool:
+    """Test file pools."""
+
+    def test_open(self) -> None:
+        """Test opening of files."""
+        pool = FilePool(fake_opener, max_open=2)
+        a = pool.open(Path("a"))
+        assert pool.open(Path("a")) is a
+        assert len(pool) == 1
+        assert Path("a") in pool
+
+    def test_eviction(self) -> None:
+        """Test least-recently-used files are released."""
+        pool = FilePool(fake_opener, max_open=2)
+        a = pool.open(Path("a"))
+        b = pool.open(Path("b"))
+        # a is now more recently used than b
+        pool.open(Path("a"))
+        pool.open(Path("c"))
+        assert len(pool) == 2
+        assert Path("b") not in pool
+        assert pool.open(Path("a")) is a
+        # Released handles are closed by the pool, unless leased.
+        assert b.closed and not a.closed
+
+    def test_lease(self) -> None:
+        """Test released handles are closed once their last lease is returned."""
+        pool = FilePool(fake_opener, max_open=1)
+        owners = [FakeFile("owner"), FakeFile("owner")]
+        a = pool.acquire(Path("a"), owners[0])
+        pool.lease(a, owners[1])
+        # Plain values do not lease handles
+        pool.lease(a, 2)
+        pool.open(Path("b"))
+        assert Path("a") not in pool and not a.closed
+        owners.pop()
+        assert not a.closed
+        owners.pop()
+        assert a.closed
+
+    def test_stats(self) -> None:
+        """Test statistics of pools."""
+        pool = FilePool(fake_opener, max_open=2)
+        assert pool.stats() == PoolStats(hits=0, misses=0, evictions=0, open=0)
+        for p in "abacab":
+            pool.open(Path(p))
+        assert pool.stats() == PoolStats(hits=2, misses=4, evictions=2, open=2)
+
+    def test_idle(self) -> None:
+        """Test idle files are released."""
+        pool = FilePool(fake_opener, max_idle=0.0)
+        pool.open(Path("a"))
+        pool.open(Path("b"))
+        assert Path("a") not in pool
+        assert Path("b") in pool
+        pool.release_idle()
+        assert len(pool) == 0
+        assert pool.stats().evictions == 2
+
+        pool = FilePool(fake_opener, max_idle=3600.0)
+        pool.open(Path("a"))
+        pool.open(Path("b"))
+        pool.release_idle()
+        assert len(pool) == 2
+
+        # Idle files are kept without a limit
+        pool = FilePool(fake_opener)
+        pool.open(Path("a"))
+        pool.release_idle()
+        assert len(pool) == 1
+
+    def test_close(self) -> None:
+        """Test closing of pools."""
+        pool = FilePool(fake_opener, max_open=2)
+        owner = FakeFile("owner")
+        handles = [pool.acquire(Path(p), owner) for p in "abc"]
+        pool.close()
+        assert len(pool) == 0
+        assert all(h.closed for h in handles)
+        # Leases returned after closing are ignored
+        del owner
+
+    def test_error(self) -> None:
+        """Test invalid pools."""
+        with pytest.raises(ValueError, match="positive"):
+            FilePool(fake_opener, max_open=0)
+
+
+def test_pooled_node() -> None:
+    """Test nodes obtained from pools."""
+    pool = FilePool(fake_opener, max_open=1)
+    node = PooledNode(pool, Path("a"))
+    group = node["group"]
+    assert isinstance(group, PooledNode)
+    assert group.parts == ("group",)
+    assert node["value"] == 2
+    assert len(node) == 2
+    assert list(node) == ["group", "value"]
+
+    # Nodes remain valid after release.
+    PooledNode(pool, Path("b"))["value"]
+    assert Path("a") not in pool
+    assert group["leaf"] == "a"
+    assert not node.handle.closed
+
+    # Nodes are resolved once, children from their parent.
+    hits = pool.stats().hits
+    assert group["leaf"] == "a" and node["group"]["leaf"] == "a"
+    assert pool.stats().hits == hits
+    assert group.handle is node.handle
+    assert PooledNode(pool, Path("a"), ("group",))["leaf"] == "a"
+
+
+def test_pooled_node_hdf5() -> None:
+    """Test files released by pools are closed once their nodes are dropped."""
+    opened = []
+
+    def opener(p):
+        opened.append(h5py.File(p, "r"))
+        return opened[-1]
+
+    pool = FilePool(opener, max_open=1)
+    files = [THIS_DIR / "data" / f"elastica_{i:06d}.h5" for i in (50, 100)]
+    for _ in range(3):
+        for p in files:
+            assert len(PooledNode(pool, p)["CosseratRod"]) == 4
+    assert len(opened) == 6
+    assert sum(f.id.valid for f in opened) == 1
+
+    # Datasets and nodes keep their file open.
+    rods = PooledNode(pool, files[0])["CosseratRod"]
+    data = rods[next(iter(rods))]["Position"]["data"]
+    PooledNode(pool, files[1])["CosseratRod"]
+    assert sum(f.id.valid for f in opened) == 2
+    del rods
+    gc.collect()
+    assert data.shape[0] == 3
+    del data
+    gc.collect()
+    assert sum(f.id.valid for f in opened) == 1
+    pool.close()
+    assert sum(f.id.valid for f in opened) == 0
@@ -0,0 +1,236 @@
+"""Test cases for streaming reductions over series."""
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pytest
+
+from elastica_pipelines.io.arrays import RaggedArray
+from elastica_pipelines.io.entry import series
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.reduction import Accumulator
+from elastica_pipelines.io.reduction import _ragged
+from elastica_pipelines.io.specialize import CosseratRodRecordIndex
+from elastica_pipelines.io.specialize import SphereRecordIndex
+from elastica_pipelines.io.temporal import Series
+from elastica_pipelines.io.typing import Node
+from tests.io.test_protocols import skip_if_env_has
+from tests.io.test_temporal import temporal_information
+
+
+THIS_DIR = Path(__file__).parent
+
+ITERATES = list(range(10, 110, 10))
+
+
+def position(it: int, n_nodes: int, sys_id: int) -> np.ndarray:
+    """Position of a rod at an iteration.
+
+    Args:
+        it: Iterate.
+        n_nodes: Number of nodes of the rod.
+        sys_id: Id of the rod.
+
+    Returns:
+        Position of shape (3, n_nodes).
+    """
+    return np.sin(it + sys_id + np.arange(3 * n_nodes).reshape(3, n_nodes))
+
+
+def make_node(n_nodes: Sequence[int]) -> Node:
+    """Make series node data with rods of a given number of nodes.
+
+    Args:
+        n_nodes: Number of nodes per rod.
+
+    Returns:
+        node with data.
+    """
+    return {
+        ElasticaConvention.as_record_key(it): dict(
+            data={
+                "CosseratRod": {
+                    ElasticaConvention.as_system_key(i): {
+                        "Position": {"data": position(it, n, i)}
+                    }
+                    for i, n in enumerate(n_nodes)
+                }
+            },
+            **temporal_information(it),
+        )
+        for it in ITERATES
+    }
+
+
+class TestAccumulator:
+    """Test streaming statistics."""
+
+    def test_blocks(self) -> None:
+        """Test statistics of blocks match those of all samples at once."""
+        rng = np.random.default_rng(0)
+        samples = rng.normal(size=(100, 3, 4))
+        acc = Accumulator(reservoir_size=200)
+        for start in range(0, 100, 7):
+            acc.update(samples[start : start + 7])
+        acc.update(samples[:0])
+        result = acc.result(["min", "max", "mean", "var", "std", "quantile"], q=0.3)
+        assert np.allclose(result["mean"], samples.mean(axis=0))
+        assert np.allclose(result["var"], samples.var(axis=0))
+        assert np.allclose(result["std"], samples.std(axis=0))
+        assert np.all(result["min"] == samples.min(axis=0))
+        assert np.all(result["max"] == samples.max(axis=0))
+        # Quantiles are exact with fewer samples than the reservoir size
+        assert np.allclose(result["quantile"], np.quantile(samples, 0.3, axis=0))
+
+    def test_stability(self) -> None:
+        """Test variances of samples with a large offset."""
+        samples = 1e9 + np.arange(1000.0)[:, np.newaxis] % 7
+        acc = Accumulator()
+        for block in np.split(samples, 10):
+            acc.update(block)
+        assert acc.result(["var"])["var"] == pytest.approx(samples.var(axis=0))
+
+    def test_merge(self) -> None:
+        """Test merged accumulators of ranges of samples."""
+        rng = np.random.default_rng(1)
+        samples = rng.uniform(size=(5000, 2))
+        parts = [Accumulator(100, seed) for seed in range(3)]
+        for i, block in enumerate(np.split(samples, [1000, 1500])):
+            parts[i].update(block)
+        merged = Accumulator(100).merge(parts[0]).merge(parts[1]).merge(parts[2])
+        result = merged.result(["mean", "var", "max", "quantile"], q=[0.25, 0.75])
+        assert merged.count == 5000
+        assert np.allclose(result["mean"], samples.mean(axis=0))
+        assert np.allclose(result["var"], samples.var(axis=0))
+        assert np.all(result["max"] == samples.max(axis=0))
+        # Quantiles are estimated from a sample of the reservoir size
+        assert result["quantile"].shape == (2, 2)
+        assert np.allclose(result["quantile"], [[0.25] * 2, [0.75] * 2], atol=0.15)
+
+        # Accumulators without samples are neutral
+        assert merged.merge(Accumulator()) is merged and merged.count == 5000
+        merged._merge_extrema(None, None)
+        assert np.all(merged.result(["max"])["max"] == result["max"])
+
+    def test_errors(self) -> None:
+        """Test statistics cannot be computed without samples or reservoir."""
+        acc = Accumulator()
+        with pytest.raises(ValueError, match="without samples"):
+            acc.result(["mean"])
+        acc.update(np.ones((2, 3)))
+        with pytest.raises(ValueError, match="without a reservoir"):
+            acc.result(["quantile"])
+
+
+class TestReduce:
+    """Test reductions of series."""
+
+    def test_over_time(self) -> None:
+        """Test statistics over time of rods with equal number of nodes."""
+        s = Series(make_node([4, 4, 4]))
+        subset = s.temporal_select(CosseratRodRecordIndex([0, 2]))
+        stacked = subset.stack("Position")
+        ops = ["min", "max", "mean", "std", "quantile"]
+        for chunk_size in (1, 3, 64):
+            result = subset.reduce(["Position"], ops, chunk_size=chunk_size)
+            result = result["Position"]
+            assert result["mean"].shape == (2, 3, 4)
+            assert np.allclose(result["mean"], stacked.mean(axis=0))
+            assert np.allclose(result["std"], stacked.std(axis=0))
+            assert np.all(result["min"] == stacked.min(axis=0))
+            assert np.allclose(result["quantile"], np.median(stacked, axis=0))
+
+        assert s[30:70:2].reduce(["Position"])["Position"]["mean"].shape == (3, 3, 4)
+        selected = s.reduce(["Position"], indices=CosseratRodRecordIndex([0, 2]))
+        assert np.allclose(selected["Position"]["mean"], stacked.mean(axis=0))
+
+    def test_ragged(self) -> None:
+        """Test statistics of rods with different number of nodes."""
+        s = Series(make_node([4, 2, 5]))
+        result = s.reduce(["Position"], ops=["mean", "max"])["Position"]
+        assert isinstance(result["mean"], RaggedArray)
+        assert np.all(result["mean"].lengths == [4, 2, 5])
+        for i, n in enumerate([4, 2, 5]):
+            expected = np.stack([position(it, n, i) for it in ITERATES])
+            assert np.allclose(result["mean"][i], expected.mean(axis=0))
+            assert np.all(result["max"][i] == expected.max(axis=0))
+
+    def test_changed_shapes(self) -> None:
+        """Test ragged fields whose shapes change over time cannot be reduced."""
+        node = make_node([4, 2])
+        last = node[ElasticaConvention.as_record_key(ITERATES[-1])]["data"]
+        last["CosseratRod"][ElasticaConvention.as_system_key(1)] = {
+            "Position": {"data": position(ITERATES[-1], 4, 1)}
+        }
+        s = Series(node)
+        with pytest.raises(ValueError, match="changed at iteration"):
+            s.reduce(["Position"], chunk_size=4)
+        assert not _ragged(s[[]].temporal_select(CosseratRodRecordIndex(0)), "Position")
+
+    def test_over_systems(self) -> None:
+        """Test statistics over all nodes of all rods, at every iteration."""
+        n_nodes = [4, 2, 5]
+        for node in (make_node(n_nodes), make_node([4, 4, 4])):
+            s = Series(node)
+            result = s.reduce(
+                ["Position"],
+                ops=["mean", "std", "min", "quantile"],
+                over="systems",
+                q=[0.5],
+                chunk_size=4,
+            )["Position"]
+            rods = s.temporal_select(CosseratRodRecordIndex(slice(None)))
+            expected = np.stack(
+                [
+                    np.concatenate([rod["Position"] for rod in rods[it].values()], -1)
+                    for it in ITERATES
+                ]
+            )
+            assert result["mean"].shape == (len(ITERATES), 3)
+            assert np.allclose(result["mean"], expected.mean(axis=-1))
+            assert np.allclose(result["std"], expected.std(axis=-1))
+            assert np.all(result["min"] == expected.min(axis=-1))
+            assert np.allclose(result["quantile"][0], np.median(expected, axis=-1))
+
+        # Scalar fields, one entry per system
+        node = make_node([4, 4])
+        for it in ITERATES:
+            rods = node[ElasticaConvention.as_record_key(it)]["data"]["CosseratRod"]
+            for i, rod in enumerate(rods.values()):
+                rod["Energy"] = {"data": np.float64(it + i)}
+        result = Series(node).reduce(["Energy"], ["mean"], over="systems")
+        assert np.allclose(result["Energy"]["mean"], np.array(ITERATES) + 0.5)
+
+    def test_errors(self) -> None:
+        """Test invalid reductions."""
+        s = Series(make_node([4]))
+        with pytest.raises(ValueError, match="Invalid reduction"):
+            s.reduce(["Position"], ops=["median"])
+        with pytest.raises(ValueError, match="Invalid reduction"):
+            s.reduce(["Position"], over="space")
+        with pytest.raises(ValueError, match="empty"):
+            s[[]].reduce(["Position"])
+        with pytest.raises(RuntimeError, match="opener"):
+            s.reduce(["Position"], processes=2)
+
+
+# Needs Accessor which needs runtime checkable
+@skip_if_env_has("typeguard")
+def test_series_metadata_reduce() -> None:
+    """Test reductions over series with metadata file, on processes."""
+    s = series(metadata=THIS_DIR / "data" / "elastica_metadata.h5")
+    ops = ["mean", "var", "min", "max"]
+    serial = s.reduce(["Position", "Velocity"], ops)
+    parallel = s.reduce(["Position", "Velocity"], ops, processes=2)
+    for field, result in serial.items():
+        for op, value in result.items():
+            assert np.allclose(parallel[field][op].values, value.values)
+
+    rods = s.temporal_select(CosseratRodRecordIndex(slice(None)))
+    positions = [rods[k].to_arrays(["Position"])["Position"].values for k in s]
+    assert np.allclose(serial["Position"]["mean"].values, np.mean(positions, axis=0))
+    assert np.allclose(serial["Position"]["var"].values, np.var(positions, axis=0))
+
+    spheres = s.temporal_select(SphereRecordIndex(slice(None)))
+    radius = spheres.reduce(["Radius"], ["mean"], over="systems")["Radius"]["mean"]
+    assert radius.shape == (len(s),)
@@ -0,0 +1,192 @@
+"""Test cases for the registry of system types."""
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pytest
+
+from elastica_pipelines.io import registry
+from elastica_pipelines.io.entry import series
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.registry import NODES
+from elastica_pipelines.io.registry import VORONOI
+from elastica_pipelines.io.registry import FieldSchema
+from elastica_pipelines.io.registry import SystemType
+from elastica_pipelines.io.registry import declare
+from elastica_pipelines.io.registry import register
+from elastica_pipelines.io.registry import registered
+from elastica_pipelines.io.specialize import CosseratRodRecordIndex
+from elastica_pipelines.io.specialize import CosseratRodRecords
+from elastica_pipelines.io.temporal import Series
+from elastica_pipelines.io.temporal import Snapshot
+from tests.io.test_protocols import skip_if_env_has
+from tests.io.test_temporal import temporal_information
+
+
+THIS_DIR = Path(__file__).parent
+
+
+@pytest.fixture
+def cylinder() -> Iterator[SystemType]:
+    """Registers a system type for testing."""
+    system_type = register(
+        declare(
+            "Cylinder",
+            {
+                "Position": FieldSchema((3, 1)),
+                "Radius": FieldSchema((1,), static=True),
+            },
+        )
+    )
+    yield system_type
+    registry.unregister("Cylinder")
+
+
+class TestSchema:
+    """Test schemas of fields and system types."""
+
+    def test_field_schema(self) -> None:
+        """Test resolution of shape rules."""
+        assert FieldSchema((3, NODES)).resolve(10) == (3, 11)
+        assert FieldSchema((3, 3, "n")).resolve(10) == (3, 3, 10)
+        assert FieldSchema((VORONOI,)).resolve(10) == (9,)
+        assert FieldSchema((3, "n + 2")).resolve(10) == (3, 12)
+        with pytest.raises(ValueError, match="Invalid dimension"):
+            FieldSchema((3, "m"))
+
+    def test_system_type(self) -> None:
+        """Test shapes and allocation of fields of builtin system types."""
+        rods = registered()["CosseratRod"]
+        assert rods.records_type() is CosseratRodRecords
+        assert rods.index_type() is CosseratRodRecordIndex
+        assert rods.shape("Director", 10) == (3, 3, 10)
+        out = rods.empty("NElement", 10, leading=(2, 4))
+        assert out.shape == (2, 4, 1) and out.dtype == np.uint64
+        assert "Position" in rods.time_varying()
+        assert "Mass" not in rods.time_varying()
+        with pytest.raises(KeyError, match="schema"):
+            rods.shape("Unknown", 10)
+
+        assert (
+            registry.records_types()["Sphere"] is registered()["Sphere"].records_type()
+        )
+        assert registry.lookup("Unknown") is None
+
+    # Needs Accessor which needs runtime checkable
+    @skip_if_env_has("typeguard")
+    def test_schema_matches_data(self) -> None:
+        """Test schemas of builtin system types describe Elastica++ data."""
+        snapshot = series(metadata=THIS_DIR / "data" / "elastica_metadata.h5")[50]
+        for system_name, records in snapshot.items():
+            system_type = registered()[system_name]
+            for record in records.values():
+                n_elements = int(np.asarray(record["NElement"])[0])
+                for field in record:
+                    if field in system_type.fields:
+                        data = record[field]
+                        assert data.shape == system_type.shape(field, n_elements)
+                        assert data.dtype == system_type.fields[field].dtype
+
+
+class TestRegistry:
+    """Test registration of system types."""
+
+    def test_declare(self, cylinder) -> None:
+        """Test snapshots read records of registered system types."""
+        node = {
+            "Cylinder": {
+                ElasticaConvention.as_system_key(i): {
+                    "Position": {"data": np.full((3, 1), float(i))},
+                    "Radius": {"data": np.ones(1)},
+                }
+                for i in range(3)
+            }
+        }
+        snapshot = Snapshot(node)
+        records = snapshot["Cylinder"]
+        assert isinstance(records, cylinder.records_type())
+        assert np.all(records[2]["Position"] == 2.0)
+        assert np.all(records[1:][0]["Position"] == 1.0)
+
+        s = Series(
+            {
+                ElasticaConvention.as_record_key(it): dict(
+                    data=node, **temporal_information(it)
+                )
+                for it in (50, 100)
+            }
+        )
+        selection = s.temporal_select(cylinder.index_type()([0, 2]))
+        assert selection.stack("Position").shape == (2, 2, 3, 1)
+        out = selection.empty("Position")
+        assert out.shape == (2, 2, 3, 1)
+        assert np.all(selection.read_into("Position", out)[:, 1] == 2.0)
+
+    def test_register_conflict(self, cylinder) -> None:
+        """Test system types with the same name cannot be registered twice."""
+        assert register(cylinder) is cylinder
+        with pytest.raises(ValueError, match="already registered"):
+            register(declare("Cylinder", {}))
+
+    def test_plugins(self, monkeypatch) -> None:
+        """Test system types are registered from entry points."""
+
+        class EntryPoint:
+            def __init__(self, name, value, loaded):
+                self.name = name
+                self.value = value
+                self.loaded = loaded
+
+            def load(self):
+                return self.loaded
+
+        def broken():
+            raise ImportError("broken plugin")
+
+        capsule = declare("Capsule", {"Position": FieldSchema((3, 1))})
+        entry_points = [
+            EntryPoint("Capsule", "plugin:CAPSULE", capsule),
+            EntryPoint("Cone", "plugin:cone", lambda: declare("Cone", {})),
+            EntryPoint("Broken", "plugin:broken", broken),
+        ]
+        monkeypatch.setattr(registry, "_entry_points", lambda: entry_points)
+        monkeypatch.setattr(registry, "_plugins_loaded", False)
+        try:
+            with pytest.warns(UserWarning, match="Broken"):
+                assert registered()["Capsule"] is capsule
+            assert "Cone" in registry.records_types()
+            assert "Broken" not in registered()
+        finally:
+            registry.unregister("Capsule")
+            registry.unregister("Cone")
+
+    def test_entry_points(self) -> None:
+        """Test lookup of entry points of installed packages."""
+        assert all(
+            ep.group == registry.ENTRY_POINT_GROUP for ep in registry._entry_points()
+        )
+
+
+# Needs Accessor which needs runtime checkable
+@skip_if_env_has("typeguard")
+def test_selection_empty() -> None:
+    """Test allocation of arrays to read selections into."""
+    s = series(metadata=THIS_DIR / "data" / "elastica_metadata.h5")
+    subset = s.temporal_select(CosseratRodRecordIndex([0, 2]))
+    out = subset.empty("Director")
+    assert out.shape == (2, 2, 3, 3, 10)
+    assert subset.empty("Position", n_elements=4).shape == (2, 2, 3, 5)
+    assert subset[[]].empty("Curvature").shape == (0, 2, 3, 0)
+    # Empty selections stack into empty arrays laid out as the field.
+    assert subset[[]].stack("Position").shape == (0, 2, 3, 2)
+    none = s.temporal_select(CosseratRodRecordIndex([]))
+    assert none.stack("Director").shape == (2, 0, 3, 3, 1)
+    one = s.temporal_select(CosseratRodRecordIndex(1))[[]]
+    assert one.stack("Mass").shape == (0, 1, 2)
+    every = s.temporal_select(CosseratRodRecordIndex(slice(None)))[[]]
+    assert every.stack("Mass").shape == (0, 0, 2)
+    with pytest.raises(KeyError):
+        subset.empty("Unknown")
+    # Fields not in the schema cannot be described without systems.
+    with pytest.raises(KeyError, match="schema"):
+        subset[[]].empty("Unknown")
@@ -0,0 +1,248 @@
+"""Test cases for repacking of IO series."""
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from elastica_pipelines.io import CosseratRodRecordIndex
+from elastica_pipelines.io import SphereRecordIndex
+from elastica_pipelines.io.entry import series
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.repack import StoreNode
+from elastica_pipelines.io.repack import _layout
+from elastica_pipelines.io.repack import is_repacked
+from elastica_pipelines.io.repack import repack
+from elastica_pipelines.io.temporal import Series
+from elastica_pipelines.io.transforms import Batched
+from tests.io.test_protocols import skip_if_env_has
+from tests.io.test_temporal import temporal_information
+
+
+THIS_DIR = Path(__file__).parent
+METADATA_FILE = THIS_DIR / "data" / "elastica_metadata.h5"
+
+
+@pytest.fixture
+def store(tmp_path) -> Path:
+    """Repacks the test data into a store.
+
+    Args:
+        tmp_path: Temporary path fixture.
+
+    Returns:
+        Path of the store.
+    """
+    path = tmp_path / "repacked.h5"
+    repack(series(metadata=METADATA_FILE), path, chunk_iterations=1)
+    return path
+
+
+# Needs Accessor which needs runtime checkable
+@skip_if_env_has("typeguard")
+class TestRepack:
+    """Test repacked stores."""
+
+    def test_layout(self, store) -> None:
+        """Test layout of the store.
+
+        Args:
+            store : The fixture to obtain a store.
+        """
+        with h5py.File(store, "r") as f:
+            assert is_repacked(f)
+            position = f["CosseratRod"]["Position"]
+            assert position["data"].shape == (2, 4, 3, 17)
+            assert position["data"].chunks == (1, 1, 3, 17)
+            assert position["data"].compression == "gzip"
+            assert np.all(position["lengths"][()] == [11, 17, 11, 11])
+            assert "lengths" not in f["CosseratRod"]["NElement"]
+        with h5py.File(METADATA_FILE, "r") as f:
+            assert not is_repacked(f)
+
+    def test_series(self, store) -> None:
+        """Test stores are served as series.
+
+        Args:
+            store : The fixture to obtain a store.
+        """
+        original = series(metadata=METADATA_FILE)
+        s = series(metadata=store)
+        assert isinstance(s.node, StoreNode)
+        assert list(s.keys()) == list(original.keys())
+        for t, snapshot in s.items():
+            expected = original[t]
+            assert list(snapshot.keys()) == list(expected.keys())
+            for name in expected:
+                assert len(snapshot[name]) == len(expected[name])
+                for sys_id, system in expected[name].items():
+                    for field, data in system.items():
+                        value = snapshot[name][sys_id][field]
+                        assert value.shape == data.shape
+                        assert np.all(value == np.asarray(data))
+
+        for option in ("follow", "sidecar"):
+            with pytest.raises(ValueError, match="Repacked"):
+                series(metadata=store, **{option: True})
+
+    def test_stack(self, store) -> None:
+        """Test stacking of fields from stores.
+
+        Args:
+            store : The fixture to obtain a store.
+        """
+        original = series(metadata=METADATA_FILE)
+        s = series(metadata=store)
+        for indices in ([2, 0], [3, 2, 2, 0], slice(None, None, 2), 3):
+            stacked = s.temporal_select(CosseratRodRecordIndex(indices)).stack(
+                "Position"
+            )
+            expected = original.temporal_select(CosseratRodRecordIndex(indices)).stack(
+                "Position"
+            )
+            assert np.all(stacked == expected)
+
+        sel = s.temporal_select(SphereRecordIndex([1, 5]))
+        blocks = list(sel.chunks("Position", size=1))
+        assert [b.shape[0] for b in blocks] == [1, 1]
+        assert np.all(np.concatenate(blocks) == sel.stack("Position"))
+
+        with pytest.raises(ValueError, match="differ"):
+            s.temporal_select(CosseratRodRecordIndex([0, 1])).stack("Position")
+
+        # Iterations and systems selected out of order, or not contiguous
+        node = s.node
+        assert np.all(
+            node.stack("Sphere", "Position", [100, 50, 100], [4, 1, 2])
+            == np.stack(
+                [
+                    [s[t].spheres()[i]["Position"] for i in (4, 1, 2)]
+                    for t in (100, 50, 100)
+                ]
+            )
+        )
+        assert node.stack("Sphere", "Position", [], [1]).shape == (0, 1, 3, 1)
+
+        # Batch transforms are applied to blocks read in bulk
+        doubled = series(metadata=store, transforms=Batched(lambda x: 2 * x))
+        assert np.all(
+            doubled.temporal_select(SphereRecordIndex([1, 5])).stack("Position")
+            == 2 * sel.stack("Position")
+        )
+
+    def test_stack_empty(self, store) -> None:
+        """Test stacking nothing, as laid out by ``SeriesSelection.empty``.
+
+        Args:
+            store : The fixture to obtain a store.
+        """
+        with h5py.File(store, "a") as f:
+            rods = f["CosseratRod"]
+            rods.create_dataset("Padded/data", data=np.zeros((2, 4, 3, 17), "i4"))
+            rods.create_dataset("Padded/lengths", data=[11, 17, 11, 11])
+            rods.create_dataset("Fixed/data", data=np.zeros((2, 4, 2), "i4"))
+        original = series(metadata=METADATA_FILE)
+        s = series(metadata=store)
+        for index in (CosseratRodRecordIndex([]), SphereRecordIndex([])):
+            for field in ("Position", "NElement"):
+                stacked = s.temporal_select(index).stack(field)
+                expected = original.temporal_select(index).empty(field)
+                assert stacked.shape == expected.shape
+                assert stacked.dtype == expected.dtype
+
+        node = s.node
+        expected = original.temporal_select(CosseratRodRecordIndex([])).empty(
+            "Position"
+        )
+        stacked = node.stack("CosseratRod", "Position", [50, 100], [])
+        assert stacked.shape == expected.shape
+        assert stacked.dtype == expected.dtype
+        assert node.stack("CosseratRod", "Position", [], [1]).shape == (0, 1, 3, 2)
+
+        # Fields outside of the schema are laid out as the selected systems
+        padded = node.stack("CosseratRod", "Padded", [], [1])
+        assert padded.shape == (0, 1, 3, 17)
+        assert padded.dtype == np.int32
+        assert node.stack("CosseratRod", "Fixed", [50], []).shape == (1, 0, 2)
+        with pytest.raises(KeyError, match="schema"):
+            node.stack("CosseratRod", "Padded", [50], [])
+
+    def test_mappings(self, store) -> None:
+        """Test the mappings emulating the layout of a series.
+
+        Args:
+            store : The fixture to obtain a store.
+        """
+        with h5py.File(store, "r") as f:
+            node = StoreNode(f)
+            key = ElasticaConvention.as_record_key
+            assert list(node) == [key(50), key(100)]
+            with pytest.raises(KeyError):
+                node[key(75)]
+            with pytest.raises(KeyError):
+                node[key(200)]
+
+            snapshot = node[key(50)]["data"]
+            assert len(snapshot) == len(list(snapshot)) == 2
+            with pytest.raises(KeyError):
+                snapshot["TimeMetadata"]
+
+            rods = snapshot["CosseratRod"]
+            sys_key = ElasticaConvention.as_system_key
+            assert list(rods) == [sys_key(s) for s in range(4)]
+            with pytest.raises(KeyError):
+                rods[sys_key(4)]
+
+            rod = rods[sys_key(1)]
+            assert len(rod) == len(list(rod))
+            assert "Position" in list(rod)
+            assert list(rod["Position"]) == ["data"]
+            assert len(rod["Position"]) == 1
+            with pytest.raises(KeyError):
+                rod["Position"]["attrs"]
+
+    def test_empty_fields(self, tmp_path) -> None:
+        """Test repacking fields without entries.
+
+        Args:
+            tmp_path: Temporary path fixture.
+        """
+        rod = {"Position": {"data": np.zeros((3, 0))}}
+        node = {
+            ElasticaConvention.as_record_key(50): dict(
+                data={"CosseratRod": {ElasticaConvention.as_system_key(0): rod}},
+                **temporal_information(50),
+            )
+        }
+        repack(Series(node), tmp_path / "a.h5")
+        with h5py.File(tmp_path / "a.h5", "r") as f:
+            assert f["CosseratRod"]["Position"]["data"].shape == (1, 1, 3, 0)
+            assert f["CosseratRod"]["Position"]["data"].chunks is None
+
+    def test_errors(self, tmp_path) -> None:
+        """Test invalid repacking.
+
+        Args:
+            tmp_path: Temporary path fixture.
+        """
+        with pytest.raises(ValueError, match="positive"):
+            repack(series(metadata=METADATA_FILE), tmp_path / "a.h5", 0)
+
+        with pytest.raises(ValueError, match="empty"):
+            repack(Series({}), tmp_path / "a.h5")
+
+        def prepare_node(it, n):
+            rod = {"Position": {"data": np.zeros((3, n))}}
+            return {
+                ElasticaConvention.as_record_key(it): dict(
+                    data={"CosseratRod": {ElasticaConvention.as_system_key(0): rod}},
+                    **temporal_information(it),
+                )
+            }
+
+        s = Series(dict(**prepare_node(50, 3), **prepare_node(100, 4)))
+        with pytest.raises(ValueError, match="expected"):
+            repack(s, tmp_path / "a.h5")
+
+        with pytest.raises(ValueError, match="more than their last axis"):
+            _layout([(3, 2), (4, 3)])
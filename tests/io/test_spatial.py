@@ -0,0 +1,193 @@
+"""Test cases for spatial indexing of snapshots."""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from elastica_pipelines.io.entry import series
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.spatial import SpatialIndex
+from elastica_pipelines.io.specialize import CosseratRodRecordIndex
+from elastica_pipelines.io.temporal import Series
+from elastica_pipelines.io.temporal import Snapshot
+from elastica_pipelines.io.typing import Node
+from tests.io.test_protocols import skip_if_env_has
+from tests.io.test_temporal import temporal_information
+
+
+THIS_DIR = Path(__file__).parent
+
+
+@pytest.fixture
+def points() -> np.ndarray:
+    """Gets random points, clustered along a line."""
+    rng = np.random.default_rng(0)
+    line = np.linspace(0.0, 10.0, 300)[:, np.newaxis] * [1.0, 0.0, 0.0]
+    return np.concatenate([rng.uniform(-1.0, 1.0, (200, 3)), line])
+
+
+def make_index(points: np.ndarray, cell_size=None) -> SpatialIndex:
+    """Index points as nodes of a single system.
+
+    Args:
+        points: Points of shape (n, 3).
+        cell_size: Edge length of the cells of the grid.
+
+    Returns:
+        Spatial index.
+    """
+    n = len(points)
+    zeros = np.zeros(n, dtype=np.intp)
+    return SpatialIndex(points, ("A",), zeros, zeros, np.arange(n), cell_size)
+
+
+def make_snapshot_node(n_nodes, it: int = 0) -> Node:
+    """Make snapshot node data with rods along x and spheres.
+
+    Args:
+        n_nodes: Number of nodes per rod.
+        it: Offset along z of the rods.
+
+    Returns:
+        node with data.
+    """
+
+    def rod(i, n):
+        x = np.linspace(0.0, 1.0, n)
+        return {"Position": {"data": np.array([x, np.full(n, i), np.full(n, it)])}}
+
+    return {
+        "CosseratRod": {
+            ElasticaConvention.as_system_key(i): rod(i, n)
+            for i, n in enumerate(n_nodes)
+        },
+        "Sphere": {
+            ElasticaConvention.as_system_key(i): {
+                "Position": {"data": np.array([[5.0], [float(i)], [0.0]])}
+            }
+            for i in range(2)
+        },
+    }
+
+
+class TestSpatialIndex:
+    """Test queries of spatial indices against brute force."""
+
+    @pytest.mark.parametrize("cell_size", [None, 0.05, 0.5, 100.0])
+    def test_box(self, points, cell_size) -> None:
+        """Test box queries."""
+        index = make_index(points, cell_size)
+        for lo, hi in [
+            ([-0.5, -0.5, -0.5], [0.5, 0.5, 0.5]),
+            ([2.0, -0.1, -0.1], [3.0, 0.1, 0.1]),
+            ([-5.0, -5.0, -5.0], [20.0, 5.0, 5.0]),
+            ([20.0, 0.0, 0.0], [30.0, 1.0, 1.0]),
+            ([1.0, 1.0, 1.0], [0.0, 0.0, 0.0]),
+        ]:
+            expected = np.flatnonzero(np.all((points >= lo) & (points <= hi), -1))
+            assert sorted(index.box(lo, hi).element) == expected.tolist()
+
+    @pytest.mark.parametrize("cell_size", [None, 0.05, 100.0])
+    def test_radius_knn(self, points, cell_size) -> None:
+        """Test radius and nearest neighbour queries."""
+        index = make_index(points, cell_size)
+        for center in ([0.0, 0.0, 0.0], [5.0, 0.2, 0.0], [-3.0, 2.0, 1.0]):
+            distance = np.linalg.norm(points - center, axis=-1)
+            hits = index.radius(center, 0.4)
+            assert sorted(hits.element) == np.flatnonzero(distance <= 0.4).tolist()
+            assert np.all(np.diff(hits.distance) >= 0)
+
+            hits = index.knn(center, 7)
+            assert np.allclose(hits.distance, np.sort(distance)[:7])
+            assert np.allclose(distance[hits.element], hits.distance)
+        assert len(index.knn([0.0, 0.0, 0.0], 10000)) == len(points)
+
+    def test_empty(self) -> None:
+        """Test queries of an index without points."""
+        index = make_index(np.empty((0, 3)))
+        assert len(index) == 0
+        assert len(index.box([0.0] * 3, [1.0] * 3)) == 0
+        assert len(index.knn([0.0] * 3, 3)) == 0
+
+        index = SpatialIndex.from_records({})
+        assert index.systems == () and len(index) == 0
+        assert len(index.radius([0.0] * 3, 1.0)) == 0
+
+    def test_scan(self, points) -> None:
+        """Test boxes over more cells than points scan all points."""
+        index = make_index(points, 0.05)
+        lo, hi = np.array([-1.0, -1.0, -1.0]), np.array([10.0, 1.0, 1.0])
+        assert np.all(index._candidates(lo, hi) == np.arange(len(points)))
+        assert len(index.box(lo, hi)) == len(points)
+        # Boxes over few cells only look at the points of the cells.
+        assert len(index._candidates(lo, lo + 0.01)) < len(points)
+
+
+class TestSnapshotIndex:
+    """Test spatial indices of snapshots."""
+
+    def test_snapshot(self) -> None:
+        """Test hits refer to systems and elements of a snapshot."""
+        snapshot = Snapshot(make_snapshot_node([3, 5, 2]))
+        index = snapshot.spatial_index()
+        assert len(index) == 3 + 5 + 2 + 2
+
+        hits = index.box([0.4, 0.5, -0.1], [1.0, 2.0, 0.1])
+        assert sorted(hits) == [
+            ("CosseratRod", 1, 2),
+            ("CosseratRod", 1, 3),
+            ("CosseratRod", 1, 4),
+            ("CosseratRod", 2, 1),
+        ]
+        hits = index.knn([5.0, 1.1, 0.0], 1)
+        assert list(hits) == [("Sphere", 1, 0)]
+        assert hits.sys_ids("Sphere") == [1] and hits.sys_ids("CosseratRod") == []
+        assert hits.sys_ids("Unknown") == []
+
+        rods = snapshot.spatial_index(["CosseratRod"])
+        assert rods.systems == ("CosseratRod",) and len(rods) == 10
+        assert rods.select("CosseratRod", [0.9, -1, -1], [2, 1.5, 1]) == (
+            CosseratRodRecordIndex([0, 1])
+        )
+        with pytest.raises(KeyError, match="registered"):
+            rods.select("Unknown", [0, 0, 0], [1, 1, 1])
+
+    def test_temporal_select_region(self) -> None:
+        """Test selection of the systems inside a region at an iteration."""
+        s = Series(
+            {
+                ElasticaConvention.as_record_key(it): dict(
+                    data=make_snapshot_node([3, 3, 3], it), **temporal_information(it)
+                )
+                for it in (10, 20)
+            }
+        )
+        selection = s.temporal_select_region([0.0, 0.5, 5.0], [1.0, 3.0, 15.0])
+        assert selection.indices == CosseratRodRecordIndex([1, 2])
+        assert selection.stack("Position").shape == (2, 2, 3, 3)
+        selection = s.temporal_select_region([0.0, 0.5, 5.0], [1.0, 3.0, 15.0], at=20)
+        assert selection.indices == CosseratRodRecordIndex([])
+        spheres = s.temporal_select_region([4, 0, -1], [6, 0.5, 1], "Sphere")
+        assert len(spheres[10]) == 1
+
+        with pytest.raises(KeyError, match="without iterations"):
+            s[[]].temporal_select_region([0, 0, 0], [1, 1, 1])
+
+
+# Needs Accessor which needs runtime checkable
+@skip_if_env_has("typeguard")
+def test_series_metadata_spatial_index() -> None:
+    """Test spatial index of a snapshot of a series with metadata file."""
+    s = series(metadata=THIS_DIR / "data" / "elastica_metadata.h5")
+    snapshot = s[50]
+    index = snapshot.spatial_index()
+    rods = snapshot.cosserat_rods()
+    assert len(index) == sum(r["Position"].shape[-1] for r in rods.values()) + len(
+        snapshot.spheres()
+    )
+    for system_name, sys_id, element in index.radius([0.0, 0.1, 0.0], 0.05):
+        position = snapshot[system_name][sys_id]["Position"][:, element]
+        assert np.linalg.norm(position - [0.0, 0.1, 0.0]) <= 0.05
+
+    selection = s.temporal_select_region([0.5, -1.0, -1.0], [2.0, 1.0, 1.0])
+    assert selection.indices == CosseratRodRecordIndex([2])
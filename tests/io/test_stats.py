@@ -0,0 +1,85 @@
+"""Test cases for instrumentation of IO."""
+import threading
+
+import pytest
+
+from elastica_pipelines.io import stats
+from elastica_pipelines.io.stats import IOStats
+from elastica_pipelines.io.stats import Recorder
+
+
+class TestRecorder:
+    """Test recorders of IO."""
+
+    def test_add(self) -> None:
+        """Test counters accumulate."""
+        recorder = Recorder()
+        assert recorder.stats() == IOStats()
+        recorder.add(reads=1, bytes_read=8)
+        recorder.add(reads=2, read_time=0.5)
+        assert recorder.stats() == IOStats(reads=3, bytes_read=8, read_time=0.5)
+        recorder.reset()
+        assert recorder.stats() == IOStats()
+
+    def test_threads(self) -> None:
+        """Test counters are not lost across threads."""
+        recorder = Recorder()
+
+        def work() -> None:
+            for _ in range(1000):
+                recorder.add(reads=1)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert recorder.stats().reads == 4000
+
+    def test_arithmetic(self) -> None:
+        """Test statistics are added and subtracted field-wise."""
+        a = IOStats(reads=3, read_time=1.0)
+        b = IOStats(reads=1, cache_hits=2)
+        assert a + b == IOStats(reads=4, cache_hits=2, read_time=1.0)
+        assert (a + b) - b == a
+
+
+class TestRecord:
+    """Test recording of IO within blocks."""
+
+    def test_record(self) -> None:
+        """Test counts are recorded into active and given recorders."""
+        own = Recorder()
+        stats.count(None, reads=1)
+        assert not stats.enabled(None)
+        with stats.record() as outer:
+            assert stats.enabled(None)
+            stats.count(own, reads=1)
+            with stats.record() as inner:
+                stats.count(None, reads=2)
+            stats.count(None, reads=4)
+        stats.count(None, reads=8)
+        assert own.stats().reads == 1
+        assert inner.stats().reads == 2
+        assert outer.stats().reads == 7
+        assert not stats.enabled(None)
+
+    def test_timed(self) -> None:
+        """Test blocks are timed along with their counts."""
+        recorder = Recorder()
+        with stats.timed(recorder, "read_time", reads=1) as counts:
+            counts["bytes_read"] = 8
+        recorded = recorder.stats()
+        assert recorded.reads == 1
+        assert recorded.bytes_read == 8
+        assert recorded.read_time > 0
+
+        # Failing blocks are recorded too
+        with pytest.raises(KeyError):
+            with stats.timed(recorder, "transform_time"):
+                raise KeyError()
+        assert recorder.stats().transform_time > 0
+
+        # Nothing is recorded without recorders
+        with stats.timed(None, "read_time", reads=1) as counts:
+            counts["bytes_read"] = 8
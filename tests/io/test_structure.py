@@ -0,0 +1,194 @@
+"""Test cases for caching of the structure of series."""
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
+
+import numpy as np
+import pytest
+
+from elastica_pipelines.io.core import SystemRecord
+from elastica_pipelines.io.entry import series
+from elastica_pipelines.io.protocols import ElasticaConvention
+from elastica_pipelines.io.specialize import CosseratRodRecordIndex
+from elastica_pipelines.io.structure import FieldInfo
+from elastica_pipelines.io.structure import StructureCache
+from elastica_pipelines.io.temporal import Series
+from elastica_pipelines.io.typing import Node
+from tests.io.test_protocols import skip_if_env_has
+from tests.io.test_temporal import temporal_information
+
+
+THIS_DIR = Path(__file__).parent
+
+
+class CountingNode(Mapping[str, Any]):
+    """Node counting walks over its keys."""
+
+    walks: Dict[str, int] = {}
+
+    def __init__(self, name: str, data: Mapping[str, Any]) -> None:  # noqa
+        self.name = name
+        self.data = data
+
+    def __getitem__(self, k: str) -> Any:  # noqa
+        value = self.data[k]
+        if isinstance(value, dict):
+            return CountingNode(f"{self.name}/{k}", value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:  # noqa
+        self.walks[self.name] = self.walks.get(self.name, 0) + 1
+        return iter(self.data)
+
+    def __len__(self) -> int:  # noqa
+        return len(self.data)
+
+
+def make_node(n_rods: Dict[int, int]) -> Node:
+    """Make series node data with a number of rods per iteration.
+
+    Args:
+        n_rods: Number of rods per iterate.
+
+    Returns:
+        node with data.
+    """
+
+    def rod(it: int) -> Node:
+        return {
+            "Position": {"data": np.full((3, 2), float(it))},
+            "Mass": {"data": np.full(it // 50, 1.0)},
+        }
+
+    return {
+        ElasticaConvention.as_record_key(it): dict(
+            data={
+                "CosseratRod": {
+                    ElasticaConvention.as_system_key(i): rod(it) for i in range(n)
+                }
+            },
+            **temporal_information(it),
+        )
+        for it, n in n_rods.items()
+    }
+
+
+class TestStructureCache:
+    """Test structure caches."""
+
+    def test_lookup(self) -> None:
+        """Test entries are discovered once, and checked when validating."""
+        calls = []
+
+        def discover(value):
+            def run():
+                calls.append(value)
+                return value
+
+            return run
+
+        structure = StructureCache()
+        assert structure.lookup(structure.keys, 50, ("a",), discover(("x",))) == ("x",)
+        assert structure.lookup(structure.keys, 100, ("a",), discover(("y",))) == ("x",)
+        assert calls == [("x",)]
+        structure.clear()
+        assert structure.lookup(structure.keys, 100, ("a",), discover(("y",))) == ("y",)
+
+        structure = StructureCache(validate=True)
+        structure.lookup(structure.keys, 50, ("a",), discover(("x",)))
+        structure.lookup(structure.keys, 50, ("a",), discover(("x",)))
+        structure.lookup(structure.keys, 100, ("a",), discover(("x",)))
+        assert len(calls) == 4
+        assert structure.checked == {("a",): 100}
+        with pytest.raises(ValueError, match="changed at iteration 150, at a"):
+            structure.lookup(structure.keys, 150, ("a",), discover(("y",)))
+        # Only the last iterate checked is kept, per path
+        structure.lookup(structure.keys, 100, ("a",), discover(("x",)))
+        assert len(calls) == 6
+        assert structure.checked == {("a",): 100}
+
+    def test_field_info(self) -> None:
+        """Test descriptions of fields."""
+        assert FieldInfo.of(np.zeros((3, 2))) == FieldInfo((3, 2), np.dtype("float64"))
+        assert FieldInfo.of([1, 2]) == FieldInfo((2,), np.dtype(int))
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_series(self) -> None:
+        """Test structural queries of series are answered from memory."""
+        CountingNode.walks.clear()
+        node = make_node({50: 2, 100: 2})
+        s = Series(
+            CountingNode("", node),
+            index=Series(node).index(),
+            structure=StructureCache(),
+        )
+        for _, snapshot in s.iterations():
+            assert list(snapshot) == ["CosseratRod"]
+            rods = snapshot.cosserat_rods()
+            assert len(rods) == 2 and list(rods) == [0, 1]
+            assert list(rods[1].keys()) == ["Position", "Mass"]
+            assert len(rods[1]) == 2
+        walks = {k: v for k, v in CountingNode.walks.items() if k}
+        assert walks == {
+            "/0000000050/data": 1,
+            "/0000000050/data/CosseratRod": 1,
+            "/0000000050/data/CosseratRod/0000000001": 1,
+        }
+
+        selection = s.temporal_select(CosseratRodRecordIndex(slice(None)))
+        assert len(selection.temporal_select(CosseratRodRecordIndex([1]))[50]) == 1
+        assert selection.stack("Position").shape == (2, 2, 3, 2)
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_validate(self) -> None:
+        """Test changes of structure are detected when validating."""
+        s = Series(make_node({50: 2, 100: 3}), structure=StructureCache())
+        assert [len(snap.cosserat_rods()) for _, snap in s.iterations()] == [2, 2]
+
+        s = Series(make_node({50: 2, 100: 3}), structure=StructureCache(True))
+        with pytest.raises(ValueError, match="changed at iteration 100"):
+            [len(snap.cosserat_rods()) for _, snap in s.iterations()]
+
+        s = Series(make_node({50: 2, 100: 2}), structure=StructureCache(True))
+        assert s[50].cosserat_rods()[0].describe("Mass").shape == (1,)
+        with pytest.raises(ValueError, match="CosseratRod/0/Mass"):
+            s[100].cosserat_rods()[0].describe("Mass")
+
+    def test_describe(self) -> None:
+        """Test fields of records are described without being read."""
+        node = {
+            ElasticaConvention.as_system_key(0): {
+                "k": {"data": np.zeros((2, 3), dtype=np.float32)}
+            }
+        }
+        info = SystemRecord(node, sys_id=0).describe("k")
+        assert info.shape == (2, 3) and info.dtype == np.float32
+
+
+# Needs Accessor which needs runtime checkable
+@skip_if_env_has("typeguard")
+def test_series_metadata_structure() -> None:
+    """Test cached structure of series with metadata file."""
+    metadata_file = THIS_DIR / "data" / "elastica_metadata.h5"
+    plain = series(metadata=metadata_file)
+    for kwargs in ({"cache_structure": True}, {"validate_structure": True}):
+        s = series(metadata=metadata_file, **kwargs)
+        assert s.structure is not None
+        assert s.structure.validate == ("validate_structure" in kwargs)
+        for t, snapshot in s.iterations():
+            expected = plain[t]
+            assert list(snapshot) == list(expected)
+            assert len(snapshot.spheres()) == len(expected.spheres())
+            rods = snapshot.cosserat_rods()
+            assert [len(r) for r in rods.values()] == [
+                len(r) for r in expected.cosserat_rods().values()
+            ]
+        assert rods[1].describe("Position") == FieldInfo((3, 17), np.dtype("f8"))
+
+    # Fields out of the schema of the system type are described from the data
+    subset = s.temporal_select(CosseratRodRecordIndex([0, 2]))
+    assert subset.empty("_DummyVoronoiVector").shape == (2, 2, 3, 9)
@@ -1,11 +1,17 @@
 """Test cases for temporal IO types."""
+import asyncio
+import gc
+import threading
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 from typing import Dict
 from typing import Tuple
 
+import numpy as np
 import pytest
 
+from elastica_pipelines.io.cache import DatasetCache
 from elastica_pipelines.io.core import SystemRecord
 from elastica_pipelines.io.protocols import ElasticaConvention
 from elastica_pipelines.io.specialize import CosseratRodRecord
@@ -23,12 +29,17 @@ from elastica_pipelines.io.specialize import SphereRecordIndex
 from elastica_pipelines.io.specialize import SphereRecords
 from elastica_pipelines.io.specialize import SphereRecordsSlice
 from elastica_pipelines.io.specialize import SphereRecordTraits
+from elastica_pipelines.io.stats import Recorder
+from elastica_pipelines.io.temporal import LiveSeries
 from elastica_pipelines.io.temporal import RecordsAdapter
 from elastica_pipelines.io.temporal import RecordsAdapterKey
 from elastica_pipelines.io.temporal import Series
+from elastica_pipelines.io.temporal import SeriesIndex
 from elastica_pipelines.io.temporal import SeriesKey
 from elastica_pipelines.io.temporal import SeriesSelection
 from elastica_pipelines.io.temporal import Snapshot
+from elastica_pipelines.io.temporal import _reselect
+from elastica_pipelines.io.transforms import ToArray
 from elastica_pipelines.io.typing import Node
 from tests.io.test_core import node_v  # noqa : F401
 from tests.io.test_core import records_v  # noqa : F401
@@ -373,6 +384,25 @@ class TestSeries:
         assert next(its) == SeriesKey(150, 15.0, 0.02)
         assert iter(its) == its
 
+        # Keys are read as they are reached, and indexed once all are read
+        s = Series(series_node, recorder=Recorder())
+        its = iter(s)
+        assert next(its) == SeriesKey(50, 5.0, 0.02)
+        assert s.stats().keys_read == 1
+        assert s._index is None
+        assert len(list(its)) == 2
+        assert s.index().iterates.tolist() == [50, 100, 150]
+        assert s.stats().keys_read == 3
+        assert list(s) == list(s.index())
+
+        # Concurrent scans index the series once
+        s = Series(series_node)
+        first, second = iter(s), iter(s)
+        keys = list(first)
+        index = s.index()
+        assert list(second) == keys
+        assert s.index() is index
+
     # FIXME : Typeguard fails with a weird NameError not related to the test.
     @skip_if_env_has("typeguard")
     def test_iterations(self, series_node) -> None:
@@ -391,6 +421,531 @@ class TestSeries:
             # TestSnapshot().test_systems(snaps.node)
 
 
+@pytest.fixture
+def varying_series_node() -> Node:
+    """Gets node data for a series whose data varies in time.
+
+    Returns:
+       node with data.
+    """
+
+    def prepare_node(it: int) -> Node:
+        rod = {
+            "Position": {"data": np.full(3, float(it))},
+            "NElement": {"data": np.array([it])},
+            "Mass": {"data": np.full(it // 50, 1.0)},
+        }
+        return {
+            ElasticaConvention.as_record_key(it): dict(
+                data={"CosseratRod": {ElasticaConvention.as_system_key(0): rod}},
+                **temporal_information(it),
+            )
+        }
+
+    return dict(**prepare_node(50), **prepare_node(100), **prepare_node(150))
+
+
+class TestLiveSeries:
+    """Test series following appended records."""
+
+    def nodes(self, varying_series_node):
+        """Reopens nodes with records appended on every reopen.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+
+        Returns:
+            Callable reopening the series node.
+        """
+        keys = sorted(varying_series_node)
+        opened = []
+
+        def reopen():
+            opened.append(None)
+            n = min(len(opened), len(keys))
+            return {k: varying_series_node[k] for k in keys[:n]}
+
+        return reopen
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_iterations(self, varying_series_node) -> None:
+        """Test iterations follow appended records.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        s = LiveSeries(
+            self.nodes(varying_series_node),
+            transforms=lambda x: 2 * x,
+            poll_interval=0.001,
+            timeout=0.05,
+        )
+        assert len(s) == 1
+        iterations = list(s.iterations())
+        assert [t.iterate for t, _ in iterations] == [50, 100, 150]
+        for t, snap in iterations:
+            assert np.all(snap.cosserat_rods()[0]["Position"] == 2.0 * t.iterate)
+        assert len(s) == 3
+        assert list(s.keys()) == [t for t, _ in iterations]
+
+        s = LiveSeries(
+            self.nodes(varying_series_node), poll_interval=0.001, timeout=0.05
+        )
+        iterations = list(s.iterations(prefetch=2, fields=["Mass"]))
+        assert [t.iterate for t, _ in iterations] == [50, 100, 150]
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_refresh(self, varying_series_node) -> None:
+        """Test discovery of appended records.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        reopen = self.nodes(varying_series_node)
+        s = LiveSeries(reopen)
+        assert s.refresh() == 1
+        assert s.index().iterates.tolist() == [50, 100]
+        assert s.refresh() == 1
+        assert s.refresh() == 0
+        assert s[150].cosserat_rods()[0]["NElement"] == 150
+
+        def unavailable():
+            raise OSError("locked")
+
+        s.reopen = unavailable
+        assert s.refresh() == 0
+        assert len(s) == 3
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_close(self, varying_series_node) -> None:
+        """Test replaced nodes are closed.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+
+        class ClosableNode(dict):
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        opened = []
+
+        def reopen(node=varying_series_node):
+            opened.append(ClosableNode(node))
+            return opened[-1]
+
+        s = LiveSeries(reopen)
+        assert s.refresh() == 0
+        # Replaced nodes not in use are closed right away
+        assert [n.closed for n in opened] == [True, False]
+
+        # Replaced nodes are closed once their snapshots and views are dropped
+        snapshot, view, raw = s[50], s[50:], s._raw()
+        for _ in range(3):
+            assert s.refresh() == 0
+        assert [n.closed for n in opened] == [True, False, True, True, False]
+        assert snapshot.cosserat_rods()[0]["NElement"] == 50
+        del snapshot
+        assert not opened[1].closed
+        assert len(view[100].cosserat_rods()) > 0
+        assert len(raw[100].cosserat_rods()) > 0
+        del view, raw
+        gc.collect()
+        assert opened[1].closed
+
+        # Nodes with incomplete records are closed right away
+        s.reopen = partial(reopen, {"0000000200": {}})
+        assert s.refresh() == 0
+        assert opened[-1].closed and not opened[-2].closed
+
+        # Nodes in use are closed with the series
+        snapshot = s[100]
+        assert s.refresh() == 0
+        s.close()
+        assert all(n.closed for n in opened)
+        del snapshot
+
+    def test_errors(self, varying_series_node) -> None:
+        """Test invalid arguments.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        with pytest.raises(ValueError, match="positive"):
+            LiveSeries(self.nodes(varying_series_node), poll_interval=0.0)
+
+
+class TestSeriesTime:
+    """Test time-based lookup of series."""
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_iterations_prefetch(self, varying_series_node) -> None:
+        """Test iterations with prefetching.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        s = Series(varying_series_node, transforms=lambda x: 2 * x)
+        iterations = list(s.iterations(prefetch=2, workers=2))
+        assert [t for t, _ in iterations] == list(s.keys())
+        for t, snap in iterations:
+            rod = snap.cosserat_rods()[0]
+            assert np.all(rod["Position"] == 2.0 * t.iterate)
+            assert rod["Mass"].shape == (t.iterate // 50,)
+
+        iterations = list(s.iterations(prefetch=1, fields=["Position"], max_bytes=1))
+        assert len(iterations) == 3
+        for t, snap in iterations:
+            rod = snap.cosserat_rods()[0]
+            assert list(rod.keys()) == ["Position"]
+            assert np.all(rod["Position"] == 2.0 * t.iterate)
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_async(self, varying_series_node) -> None:
+        """Test asynchronous reads.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        s = Series(varying_series_node, transforms=lambda x: 2 * x)
+        # The index is not built on the thread of the event loop
+        threads = []
+        build = s.index
+
+        def index():
+            threads.append(threading.current_thread())
+            return build()
+
+        s.index = index
+
+        async def read():
+            snapshot = await s.aget(100, fields=["Position"])
+            iterations = [(t, snap) async for t, snap in s.aiterations(concurrency=2)]
+            sel = s.temporal_select(CosseratRodRecordIndex([0]))
+            records = await sel.aget(150)
+            selected = [(t, r) async for t, r in sel.aiterations(fields=["Mass"])]
+            return snapshot, iterations, records, selected
+
+        snapshot, iterations, records, selected = asyncio.run(read())
+        assert threads and threading.main_thread() not in threads
+        rod = snapshot.cosserat_rods()[0]
+        assert list(rod.keys()) == ["Position"]
+        assert np.all(rod["Position"] == 200.0)
+
+        assert [t.iterate for t, _ in iterations] == [50, 100, 150]
+        for t, snap in iterations:
+            assert np.all(snap.cosserat_rods()[0]["Position"] == 2.0 * t.iterate)
+
+        assert np.all(records[0]["Position"] == 300.0)
+        assert [t.iterate for t, _ in selected] == [50, 100, 150]
+        for t, r in selected:
+            assert list(r[0].keys()) == ["Mass"]
+            assert r[0]["Mass"].shape == (t.iterate // 50,)
+
+        # FIXME : Typeguard fails with a weird NameError not related to the test.
+
+    @skip_if_env_has("typeguard")
+    def test_cache(self, varying_series_node) -> None:
+        """Test caching of series data.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        cache = DatasetCache(max_bytes=1024)
+        s = Series(varying_series_node, transforms=lambda x: 2 * x, cache=cache)
+        for _ in range(2):
+            for t, snap in s.iterations():
+                assert np.all(snap.cosserat_rods()[0]["Position"] == 2.0 * t.iterate)
+        assert cache.stats().misses == 3
+        assert cache.stats().hits == 3
+        assert (50, "CosseratRod", (0, "Position")) in cache.arrays
+
+        # Views and selections share the cache
+        s.time_range(0.0, 100.0).temporal_select(CosseratRodRecordIndex(0)).stack(
+            "Position"
+        )
+        assert cache.stats().hits == 6
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_map(self, varying_series_node) -> None:
+        """Test mapping over a series.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        s = Series(varying_series_node)
+
+        def first_position(snap):
+            return snap.cosserat_rods()[0]["Position"][0]
+
+        results = s.map(first_position, processes=1)
+        assert list(results.keys()) == list(s.keys())
+        assert list(results.values()) == [50.0, 100.0, 150.0]
+
+        results = s.time_range(7.0, 20.0).map(first_position, processes=1)
+        assert list(results.values()) == [100.0, 150.0]
+
+        sel = s.temporal_select(CosseratRodRecordIndex(0))
+        results = sel.map(lambda rod: rod["Position"][0], processes=1)
+        assert list(results.values()) == [50.0, 100.0, 150.0]
+
+        # Series without an opener cannot be used with processes
+        with pytest.raises(RuntimeError, match="opener"):
+            s.map(first_position, processes=2)
+        with pytest.raises(RuntimeError, match="opener"):
+            sel.map(first_position, processes=2)
+
+        # Workers reopen selections from the opener of the series
+        reopened = _reselect(partial(Series, varying_series_node), sel.indices)
+        assert reopened.indices == sel.indices
+        assert reopened[100]["Position"][0] == 100.0
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_at_time(self, varying_series_node) -> None:
+        """Test lookup by time.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        s = Series(varying_series_node)
+
+        def position(snap):
+            return snap.cosserat_rods()[0]["Position"]
+
+        assert np.all(position(s.at_time(5.0)) == 50.0)
+        assert np.all(position(s.at_time(7.4)) == 50.0)
+        assert np.all(position(s.at_time(7.6)) == 100.0)
+        assert np.all(position(s.at_time(100.0)) == 150.0)
+        assert np.all(position(s.at_time(9.9, method="before")) == 50.0)
+        with pytest.raises(KeyError):
+            s.at_time(1.0, method="before")
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_at_time_interpolate(self, varying_series_node) -> None:
+        """Test interpolated lookup by time.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        s = Series(varying_series_node, transforms=lambda x: 2 * x)
+
+        rod = s.at_time(6.0, method="interpolate").cosserat_rods()[0]
+        assert len(rod) == 3
+        assert list(rod.keys()) == ["Position", "NElement", "Mass"]
+        assert np.allclose(rod["Position"], 2 * 60.0)
+        # Integer data is taken from the nearest snapshot
+        assert rod["NElement"] == 2 * 50
+        # Data with different shapes is taken from the nearest snapshot
+        assert rod["Mass"].shape == (1,)
+        rod = s.at_time(9.0, method="interpolate").cosserat_rods()[0]
+        assert rod["NElement"] == 2 * 100
+        assert rod["Mass"].shape == (2,)
+
+        # Exact times are not interpolated
+        rod = s.at_time(10.0, method="interpolate").cosserat_rods()[0]
+        assert np.all(rod["Position"] == 2 * 100.0)
+
+        def test_key_error(t):
+            with pytest.raises(KeyError):
+                s.at_time(t, method="interpolate")
+            return True
+
+        assert all(map(test_key_error, (1.0, 15.1)))
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_time_range(self, varying_series_node) -> None:
+        """Test time windows of a series.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        s = Series(varying_series_node)
+        view = s.time_range(7.0, 15.0)
+        assert isinstance(view, Series)
+        assert len(view) == 2
+        assert [k.iterate for k in view.keys()] == [100, 150]
+        assert np.all(view[100].cosserat_rods()[0]["Position"] == 100.0)
+        with pytest.raises(KeyError):
+            view[50]
+
+        # Views compose
+        assert [k.iterate for k in view.time_range(0.0, 12.0).keys()] == [100]
+        assert len(view.time_range(0.0, 1.0)) == 0
+
+        # Selections of views only cover the view
+        sel = view.temporal_select(CosseratRodRecordIndex(0))
+        assert len(sel) == 2
+        assert np.all(sel.stack("Position")[:, 0] == [[100.0] * 3, [150.0] * 3])
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_iteration_slicing(self, varying_series_node) -> None:
+        """Test lazy views over ranges and lists of iterations.
+
+        Args:
+            varying_series_node : The fixture to obtain series node data.
+        """
+        s = Series(varying_series_node, recorder=Recorder())
+
+        def iterates(view):
+            return [k.iterate for k in view.keys()]
+
+        assert isinstance(s[50:150], Series)
+        assert iterates(s[50:150]) == [50, 100]
+        assert iterates(s[60:]) == [100, 150]
+        assert iterates(s[:100]) == [50]
+        assert iterates(s[::2]) == [50, 150]
+        assert iterates(s[200:]) == []
+        assert iterates(s[[150, 50]]) == [50, 150]
+        assert iterates(s[np.array([100])]) == [100]
+        assert iterates(s[[SeriesKey(100, 10.0, 0.01)]]) == [100]
+        assert np.all(s[::2][150].cosserat_rods()[0]["Position"] == 150.0)
+        with pytest.raises(KeyError):
+            s[::2][100]
+        with pytest.raises(KeyError):
+            s[[50, 75]]
+        with pytest.raises(ValueError, match="positive"):
+            s[::-1]
+
+        # Only temporal information of the selected iterations is read
+        s.recorder.reset()
+        assert s[[100]].index().times[0] == 10.0
+        assert s.stats().keys_read == 1
+
+        # Views compose, with the index of the series if already built
+        s.index()
+        assert iterates(s[50:][::2]) == [50, 150]
+        assert iterates(s.time_range(7.0, 15.0)[[150]]) == [150]
+
+        # Selections slice the same way
+        sel = s.temporal_select(CosseratRodRecordIndex(0))
+        assert isinstance(sel[100:], SeriesSelection)
+        assert iterates(sel[100:]) == [100, 150]
+        assert np.all(sel[[50, 150]].stack("Position")[:, 0, 0] == [50.0, 150.0])
+        assert np.all(sel[100]["Position"] == 100.0)
+
+
+class TestSeriesIndex:
+    """Test series index-related functionality."""
+
+    def test_from_keys(self) -> None:
+        """Test index construction from keys."""
+        keys = [SeriesKey(100, 10.0, 0.02), SeriesKey(50, 5.0, 0.01)]
+        index = SeriesIndex.from_keys(keys)
+
+        assert len(index) == 2
+        assert np.all(index.iterates == [50, 100])
+        assert np.all(index.times == [5.0, 10.0])
+        assert np.all(index.dts == [0.01, 0.02])
+        assert index[0] == keys[1]
+        assert index[-1] == keys[0]
+        assert list(index) == keys[::-1]
+
+    def test_locate(self) -> None:
+        """Test time lookup in an index."""
+        index = SeriesIndex.from_keys(
+            [SeriesKey(i, 0.1 * i, 0.1) for i in (10, 20, 30)]
+        )
+        assert index.locate(2.1) == 1
+        assert index.locate(2.5) == 1
+        assert index.locate(2.6) == 2
+        assert index.locate(-1.0) == 0
+        assert index.locate(10.0) == 2
+
+        assert index.locate(2.9, method="before") == 1
+        assert index.locate(3.0, method="before") == 2
+        assert index.locate(10.0, method="before") == 2
+        with pytest.raises(KeyError):
+            index.locate(0.5, method="before")
+
+        with pytest.raises(KeyError):
+            SeriesIndex.from_keys([]).locate(0.5)
+
+        with pytest.raises(ValueError, match="Unsupported"):
+            index.locate(2.0, method="after")
+
+        # Times that can't be binary searched, e.g. of restarted simulations
+        for times in ((1.0, 3.0, 2.0), (1.0, np.nan, 2.0)):
+            unsorted = SeriesIndex.from_keys(
+                [SeriesKey(i, t, 0.1) for i, t in enumerate(times)]
+            )
+            assert not unsorted.increasing
+            with pytest.raises(ValueError, match="decrease"):
+                unsorted.locate(2.0)
+            with pytest.raises(ValueError, match="decrease"):
+                unsorted.window(1.0, 2.0)
+        assert SeriesIndex.from_keys([SeriesKey(1, 1.0, 0.1)] * 2).increasing
+
+    def test_window(self) -> None:
+        """Test restriction of an index to a time window."""
+        index = SeriesIndex.from_keys([SeriesKey(i, 0.5 * i, 0.5) for i in range(10)])
+        assert np.all(index.window(1.0, 2.0).iterates == [2, 3, 4])
+        assert np.all(index.window(0.9, 2.1).iterates == [2, 3, 4])
+        assert np.all(index.window(-5.0, 0.2).iterates == [0])
+        assert len(index.window(2.0, 1.0)) == 0
+        assert len(index.window(20.0, 30.0)) == 0
+
+    def test_contains(self) -> None:
+        """Test membership of iterates in an index."""
+        index = SeriesIndex.from_keys([SeriesKey(i, i, 1.0) for i in (2, 4)])
+        assert 2 in index
+        assert np.int64(4) in index
+        assert 3 not in index
+        assert 5 not in index
+        assert "2" not in index
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_series_index(self, series_node) -> None:
+        """Test index of a series.
+
+        Args:
+            series_node : The fixture to obtain series node data.
+        """
+        s = Series(series_node)
+        index = s.index()
+        assert np.all(index.iterates == [50, 100, 150])
+        assert np.all(index.times == [5.0, 10.0, 15.0])
+        # Index is cached
+        assert s.index() is index
+        assert list(s.keys()) == list(index)
+
+    def test_prebuilt_index(self, series_node) -> None:
+        """Test series with a prebuilt index, which never reads temporal data.
+
+        Args:
+            series_node : The fixture to obtain series node data.
+        """
+        for v in series_node.values():
+            del v["TimeMetadata"]
+
+        index = SeriesIndex.from_keys(
+            [
+                SeriesKey(50, 1.0, 0.1),
+                SeriesKey(100, 2.0, 0.1),
+                SeriesKey(150, 3.0, 0.1),
+            ]
+        )
+        s = Series(series_node, index=index)
+        assert s.index() is index
+        assert list(s.keys()) == list(index)
+        assert s.temporal_select(CosseratRodRecordIndex(0)).stack("Position").shape == (
+            3,
+            1,
+        )
+
+
 class TestSeriesSelection:
     """Test series selection-related functionality."""
 
@@ -596,3 +1151,136 @@ class TestSeriesSelection:
             ],
             2,
         )
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_temporal_select_without_index(self, series_node) -> None:
+        """Test selections of selections do not build the index of the series.
+
+        Args:
+            series_node : The fixture to obtain series node data.
+        """
+        series = Series(series_node)
+        s = series.temporal_select(CosseratRodRecordIndex([0, 1, 2]))
+        sel = s.temporal_select(CosseratRodRecordIndex(1))
+        assert series._index is None
+        assert sel[50] == CosseratRodRecord(
+            series_node[ElasticaConvention.as_record_key("000050")]["data"][
+                "CosseratRod"
+            ],
+            1,
+        )
+
+        with pytest.raises(KeyError, match="without iterations"):
+            Series({}).temporal_select(CosseratRodRecordIndex([0])).temporal_select(
+                CosseratRodRecordIndex(0)
+            )
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_stack(self, series_node) -> None:
+        """Test stacking of fields.
+
+        Args:
+            series_node : The fixture to obtain series node data.
+        """
+        series = Series(series_node)
+
+        s = series.temporal_select(CosseratRodRecordIndex([1, 2]))
+        stacked = s.stack("Position")
+        assert stacked.shape == (3, 2)
+        assert np.all(stacked == np.array([4.0, 6.0]))
+
+        # A single index retains the system axis
+        s = series.temporal_select(SphereRecordIndex(-1))
+        stacked = s.stack("Velocity")
+        assert stacked.shape == (3, 1)
+        assert np.all(stacked == 8.0)
+
+        # Transforms are respected
+        series = Series(series_node, transforms=lambda x: x + 2)
+        s = series.temporal_select(CosseratRodRecordIndex(slice(None, None, 2)))
+        assert np.all(s.stack("Curvature") == np.array([6.0, 14.0]))
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_chunks(self, series_node) -> None:
+        """Test stacking of fields in blocks.
+
+        Args:
+            series_node : The fixture to obtain series node data.
+        """
+        series = Series(series_node)
+        s = series.temporal_select(CosseratRodRecordIndex([0, 1, 2]))
+
+        blocks = list(s.chunks("Velocity", size=2))
+        assert [b.shape for b in blocks] == [(2, 3), (1, 3)]
+        assert np.all(np.concatenate(blocks) == s.stack("Velocity"))
+
+        with pytest.raises(ValueError, match="positive"):
+            next(s.chunks("Velocity", size=0))
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_read_into(self, series_node) -> None:
+        """Test reading of fields into preallocated arrays.
+
+        Args:
+            series_node : The fixture to obtain series node data.
+        """
+        series = Series(series_node)
+        s = series.temporal_select(CosseratRodRecordIndex([0, 1, 2]))
+        out = np.empty((3, 3))
+        assert s.read_into("Velocity", out) is out
+        assert np.all(out == s.stack("Velocity"))
+
+        series = Series(series_node, transforms=lambda x: x + 2)
+        s = series.temporal_select(CosseratRodRecordIndex(slice(None, None, 2)))
+        out = np.empty((3, 2))
+        assert np.all(s.read_into("Curvature", out) == s.stack("Curvature"))
+
+        # Batch transforms returning their input leave out as read
+        series = Series(series_node, transforms=ToArray())
+        s = series.temporal_select(CosseratRodRecordIndex([0, 1, 2]))
+        out = np.empty((3, 3))
+        assert np.all(s.read_into("Velocity", out) == [[3.0, 6.0, 9.0]] * 3)
+
+        with pytest.raises(ValueError, match="shape"):
+            s.read_into("Curvature", np.empty((2, 2)))
+
+        # Shapes are checked without any iterations to read
+        s = Series({}).temporal_select(CosseratRodRecordIndex([0, 1]))
+        assert s.read_into("Velocity", np.empty((0, 2))).shape == (0, 2)
+        with pytest.raises(ValueError, match="shape"):
+            s.read_into("Velocity", np.empty((0, 3)))
+
+        key = ElasticaConvention.as_record_key(150)
+        records = dict(series_node[key]["data"]["CosseratRod"])
+        del records[ElasticaConvention.as_system_key(2)]
+        series_node[key] = dict(series_node[key], data={"CosseratRod": records})
+        s = Series(series_node).temporal_select(CosseratRodRecordIndex(slice(None)))
+        with pytest.raises(ValueError, match="number of systems differs"):
+            s.read_into("Velocity", np.empty((3, 3)))
+
+    # FIXME : Typeguard fails with a weird NameError not related to the test.
+    @skip_if_env_has("typeguard")
+    def test_stack_shape_error(self, series_node) -> None:
+        """Test stacking of fields with different shapes.
+
+        Args:
+            series_node : The fixture to obtain series node data.
+        """
+        rods = series_node[ElasticaConvention.as_record_key(100)]["data"]
+        rods["CosseratRod"][ElasticaConvention.as_system_key(1)]["Position"] = {
+            "data": np.zeros(3)
+        }
+        series = Series(series_node)
+        s = series.temporal_select(CosseratRodRecordIndex([0, 1]))
+        with pytest.raises(ValueError, match="differ"):
+            s.stack("Position")
+
+        # Transformed fields are read before being stacked
+        series = Series(series_node, transforms=lambda x: x)
+        s = series.temporal_select(CosseratRodRecordIndex([0, 1]))
+        with pytest.raises(ValueError, match="differ"):
+            s.stack("Position")
@@ -1,8 +1,14 @@
 """Test cases for IO transformations."""
+import h5py
 import numpy as np
 
+from elastica_pipelines.io.transforms import Batched
 from elastica_pipelines.io.transforms import Compose
+from elastica_pipelines.io.transforms import MemMap
 from elastica_pipelines.io.transforms import ToArray
+from elastica_pipelines.io.transforms import is_elementwise
+from elastica_pipelines.io.transforms import is_memory_mapped
+from elastica_pipelines.io.transforms import supports_batch
 
 
 def test_compose() -> None:
@@ -16,6 +22,41 @@ def test_compose() -> None:
     assert all(map(lambda x: x in fun.__repr__(), substrings))
 
 
+def test_batched() -> None:
+    """Test Batched and support of batches."""
+    fun = Batched(lambda x: 2 * x)
+    assert np.all(fun([1, 2]) == [2, 4])
+    assert "Batched" in fun.__repr__()
+
+    assert supports_batch(fun)
+    assert supports_batch(ToArray())
+    assert not supports_batch(MemMap())
+    assert not supports_batch(lambda x: x)
+    assert supports_batch(Compose([ToArray(), fun]))
+    assert not supports_batch(Compose([fun, lambda x: x]))
+
+
+def test_elementwise() -> None:
+    """Test declarations of elementwise transforms."""
+    fun = Batched(lambda x: 2 * x, elementwise=True)
+    assert is_elementwise(fun)
+    assert is_elementwise(ToArray())
+    assert not is_elementwise(Batched(lambda x: x.T))
+    assert not is_elementwise(MemMap())
+    assert not is_elementwise(lambda x: x)
+    assert is_elementwise(Compose([ToArray(), fun]))
+    assert not is_elementwise(Compose([fun, lambda x: x]))
+
+
+def test_memory_mapped() -> None:
+    """Test declarations of memory-mapping transforms."""
+    assert is_memory_mapped(MemMap())
+    assert not is_memory_mapped(ToArray())
+    assert not is_memory_mapped(lambda x: x)
+    assert is_memory_mapped(Compose([MemMap(), lambda x: x]))
+    assert not is_memory_mapped(Compose([ToArray(), lambda x: x]))
+
+
 def test_to_array() -> None:
     """Test ToArray."""
     a = [1, 2, 3, 4]
@@ -24,3 +65,36 @@ def test_to_array() -> None:
     assert type(b) == np.ndarray
     assert b.shape == (4,)
     assert "ToArray" in fun.__repr__()
+
+
+def test_memmap(tmp_path) -> None:
+    """Test MemMap.
+
+    Args:
+        tmp_path : Temporary directory.
+    """
+    data = np.arange(12.0).reshape(3, 4)
+    with h5py.File(tmp_path / "data.h5", "w") as f:
+        f.create_dataset("contiguous", data=data)
+        f.create_dataset("big_endian", data=data.astype(">i4"))
+        f.create_dataset("chunked", data=data, chunks=(1, 4))
+        f.create_dataset("compressed", data=data, compression="gzip")
+        f.create_dataset("scalar", data=1.0)
+        f.create_dataset("unallocated", shape=(3,), dtype="f8")
+
+    fun = MemMap()
+    with h5py.File(tmp_path / "data.h5", "r") as f:
+        for k in ("contiguous", "big_endian"):
+            b = fun(f[k])
+            assert type(b) == np.memmap
+            assert np.all(b == data)
+            assert not b.flags.writeable
+
+        for k in ("chunked", "compressed", "scalar"):
+            b = fun(f[k])
+            assert type(b) == np.ndarray
+            assert np.all(b == f[k][()])
+        assert type(fun(f["unallocated"])) == np.ndarray
+
+    assert type(fun([1, 2, 3])) == np.ndarray
+    assert "MemMap" in fun.__repr__()
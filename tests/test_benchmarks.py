@@ -0,0 +1,90 @@
+"""Test cases for the benchmark suite."""
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks import bench
+from benchmarks.synthetic import DatasetSpec
+from benchmarks.synthetic import generate
+from elastica_pipelines.io import series
+from tests.io.test_protocols import skip_if_env_has
+
+
+@pytest.fixture
+def spec() -> DatasetSpec:
+    """Specification of a small synthetic dataset."""
+    return DatasetSpec(n_rods=3, n_elements=5, n_spheres=2, n_iterations=4)
+
+
+# Needs Accessor which needs runtime checkable
+@skip_if_env_has("typeguard")
+class TestSynthetic:
+    """Test generation of synthetic datasets."""
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_generate(
+        self, spec: DatasetSpec, tmp_path: Path, compression: str
+    ) -> None:
+        """Test generated datasets are read as Elastica++ series."""
+        spec = DatasetSpec(**{**spec.__dict__, "compression": compression})
+        s = series(metadata=generate(tmp_path, spec))
+        assert [k.iterate for k in s] == [50, 100, 150, 200]
+        assert s.index().times[0] == pytest.approx(50 * spec.dt)
+
+        snapshot = s[100]
+        assert len(snapshot.cosserat_rods()) == 3
+        assert len(snapshot.spheres()) == 2
+        assert snapshot.cosserat_rods()[2]["Position"].shape == (3, 6)
+        assert snapshot.cosserat_rods()[2]["Director"].shape == (3, 3, 5)
+        assert snapshot.spheres()[1]["Radius"].shape == (1,)
+        assert spec.nbytes() > 0
+
+        pattern = str(tmp_path / "elastica_%T.h5")
+        assert len(series(file_pattern=pattern)) == 4
+
+
+@skip_if_env_has("typeguard")
+class TestBench:
+    """Test benchmark runners."""
+
+    def test_run(self, spec: DatasetSpec, tmp_path: Path) -> None:
+        """Test all benchmarks run."""
+        results = bench.run(generate(tmp_path, spec), repeat=2, warmup=0)
+        assert [r.name for r in results] == list(bench.BENCHMARKS)
+        items = {r.name: r.items for r in results}
+        assert items["keys"] == 4
+        assert items["iterations"] == items["temporal_select_stack"] == 12
+        assert items["systems_traversal"] == 5
+        for r in results:
+            assert len(r.timings) == 2
+            assert r.throughput > 0
+            assert r.latency > 0
+
+        with pytest.raises(KeyError, match="Unknown"):
+            bench.run(tmp_path / "elastica_metadata.h5", ["unknown"])
+
+    def test_regressions(self, spec: DatasetSpec) -> None:
+        """Test comparisons against a baseline."""
+        baseline = bench.report(spec, [bench.Result("keys", 4, (1.0,))])
+        faster = [bench.Result("keys", 4, (1.1,)), bench.Result("new", 1, (1.0,))]
+        assert bench.regressions(faster, baseline, tolerance=0.2) == []
+        slower = [bench.Result("keys", 4, (1.5,))]
+        assert bench.regressions(slower, baseline, tolerance=0.2) == [
+            "keys is 1.50x slower than the baseline"
+        ]
+
+    def test_main(self, tmp_path: Path) -> None:
+        """Test the command-line interface."""
+        runner = CliRunner()
+        args = ["--rods", "2", "--iterations", "2", "--repeat", "1", "-k", "keys"]
+        output = tmp_path / "baseline.json"
+        result = runner.invoke(bench.main, [*args, "-o", str(output)])
+        assert result.exit_code == 0, result.output
+        assert "keys" in result.output
+
+        result = runner.invoke(
+            bench.main, [*args, "--baseline", str(output), "--tolerance", "-1"]
+        )
+        assert result.exit_code == 1
+        assert "slower than the baseline" in result.output
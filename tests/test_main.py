@@ -1,8 +1,12 @@
 """Test cases for the __main__ module."""
+from pathlib import Path
+
 import pytest
 from click.testing import CliRunner
 
 from elastica_pipelines import __main__
+from elastica_pipelines.io.repack import is_repacked
+from tests.io.test_protocols import skip_if_env_has
 
 
 @pytest.fixture
@@ -15,3 +19,21 @@ def test_main_succeeds(runner: CliRunner) -> None:
     """It exits with a status code of zero."""
     result = runner.invoke(__main__.main)
     assert result.exit_code == 0
+
+
+# Needs Accessor which needs runtime checkable
+@skip_if_env_has("typeguard")
+def test_repack_succeeds(runner: CliRunner, tmp_path: Path) -> None:
+    """It repacks a series into a store."""
+    import h5py
+
+    metadata = Path(__file__).parent / "io" / "data" / "elastica_metadata.h5"
+    output = tmp_path / "repacked.h5"
+    result = runner.invoke(
+        __main__.main,
+        ["repack", str(metadata), str(output), "--compression", "lzf"],
+    )
+    assert result.exit_code == 0
+    with h5py.File(output, "r") as f:
+        assert is_repacked(f)
+        assert f["CosseratRod"]["Position"]["data"].compression == "lzf"